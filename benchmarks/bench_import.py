@@ -0,0 +1,91 @@
+"""
+Benchmark cold import time of optbinning and check that solver and plotting
+libraries are not loaded by imports and transformations. Each statement is
+run in a fresh interpreter.
+
+Usage: python benchmarks/bench_import.py
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+
+N_REPEATS = 5
+
+HEAVY_MODULES = ("ortools", "matplotlib", "tdigest", "localsolver")
+
+STATEMENTS = [
+    ("baseline", "pass"),
+    ("import optbinning", "import optbinning"),
+    ("from optbinning import BinningProcess",
+     "from optbinning import BinningProcess"),
+    ("from optbinning import Scorecard", "from optbinning import Scorecard"),
+    ("import optbinning.scoring", "import optbinning.scoring"),
+    ("load pickle + transform",
+     "import pickle; process, X = pickle.load(open({!r}, 'rb')); "
+     "process.transform(X)")
+]
+
+_TEMPLATE = """
+import sys, time
+time_init = time.perf_counter()
+{}
+elapsed = time.perf_counter() - time_init
+heavy = sorted(set(m.split(".")[0] for m in sys.modules
+                   if m.startswith({!r})))
+print(elapsed, ",".join(heavy))
+"""
+
+
+def run_statement(statement):
+    code = _TEMPLATE.format(statement, HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", code],
+                                     stderr=subprocess.DEVNULL)
+    fields = output.decode().split()
+    heavy = fields[1] if len(fields) > 1 else ""
+
+    return float(fields[0]), heavy
+
+
+def bench_statement(statement):
+    times = []
+    for _ in range(N_REPEATS):
+        elapsed, heavy = run_statement(statement)
+        times.append(elapsed)
+
+    return np.median(times), np.min(times), heavy
+
+
+def _fitted_process(path):
+    from sklearn.datasets import load_breast_cancer
+
+    from optbinning import BinningProcess
+
+    data = load_breast_cancer()
+    process = BinningProcess(data.feature_names).fit(data.data, data.target)
+
+    with open(path, "wb") as f:
+        pickle.dump((process, data.data), f)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "process.pkl")
+        _fitted_process(path)
+
+        print("{:>40} {:>12} {:>12}   {}".format(
+            "statement", "median (s)", "min (s)", "heavy modules"))
+
+        for name, statement in STATEMENTS:
+            median, best, heavy = bench_statement(statement.format(path))
+
+            print("{:>40} {:>12.4f} {:>12.4f}   {}".format(
+                name, median, best, heavy or "-"))
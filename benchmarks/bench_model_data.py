@@ -0,0 +1,71 @@
+"""
+Benchmark model data construction time as a function of the number of
+prebins, with and without the max p-value constraint.
+
+Usage: python benchmarks/bench_model_data.py
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import time
+
+import numpy as np
+
+from optbinning.binning.model_data import continuous_model_data
+from optbinning.binning.model_data import model_data
+
+
+N_PREBINS = [10, 20, 50, 100]
+N_REPEATS = 3
+
+
+def _best_time(func, *args):
+    times = []
+    for _ in range(N_REPEATS):
+        time_init = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - time_init)
+
+    return min(times)
+
+
+def bench_model_data(n_prebins, max_pvalue, max_pvalue_policy, seed=0):
+    rng = np.random.RandomState(seed)
+    n_nonevent = rng.randint(100, 1000, n_prebins)
+    n_event = rng.randint(10, 100, n_prebins)
+
+    return _best_time(model_data, "iv", n_nonevent, n_event, max_pvalue,
+                      max_pvalue_policy)
+
+
+def bench_continuous_model_data(n_prebins, max_pvalue, max_pvalue_policy,
+                                seed=0):
+    rng = np.random.RandomState(seed)
+    n_records = rng.randint(100, 1000, n_prebins)
+    sums = rng.uniform(0, 1, n_prebins) * n_records
+    stds = rng.uniform(0.1, 1, n_prebins)
+
+    return _best_time(continuous_model_data, n_records, sums, stds,
+                      max_pvalue, max_pvalue_policy)
+
+
+if __name__ == "__main__":
+    header = "{:>10} {:>12} {:>14} {:>12} {:>14}".format(
+        "n_prebins", "binary", "binary_pvalue", "continuous",
+        "continuous_pvalue")
+
+    for policy in ("consecutive", "all"):
+        print("max_pvalue_policy = {}".format(policy))
+        print(header)
+
+        for n_prebins in N_PREBINS:
+            t_b = bench_model_data(n_prebins, None, policy)
+            t_bp = bench_model_data(n_prebins, 0.05, policy)
+            t_c = bench_continuous_model_data(n_prebins, None, policy)
+            t_cp = bench_continuous_model_data(n_prebins, 0.05, policy)
+
+            print("{:>10} {:>12.4f} {:>14.4f} {:>12.4f} {:>14.4f}".format(
+                n_prebins, t_b, t_bp, t_c, t_cp))
+
+        print()
@@ -0,0 +1,80 @@
+"""
+Benchmark single record scoring latency of a scorecard: p50 and p99 of
+``Scorecard.score_record`` compared with ``Scorecard.score`` on a one-row
+DataFrame.
+
+Usage: python benchmarks/bench_score_record.py
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from sklearn.datasets import load_breast_cancer
+from sklearn.linear_model import LogisticRegression
+
+from optbinning import BinningProcess
+from optbinning import Scorecard
+
+
+N_RECORDS = 2000
+N_RECORDS_DATAFRAME = 200
+
+
+def _latencies(func, records):
+    times = np.empty(len(records))
+    for i, record in enumerate(records):
+        time_init = time.perf_counter()
+        func(record)
+        times[i] = time.perf_counter() - time_init
+
+    return times
+
+
+def _fit_scorecard():
+    data = load_breast_cancer()
+    variable_names = list(data.feature_names) + ["category"]
+
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df["category"] = np.array(["a", "b", "c", "d"], dtype=object)[
+        np.arange(len(df)) % 4]
+    df["target"] = data.target
+
+    binning_process = BinningProcess(variable_names,
+                                     categorical_variables=["category"])
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LogisticRegression(),
+                          scaling_method="min_max",
+                          scaling_method_params={"min": 300, "max": 850})
+    scorecard.fit(df)
+
+    records = df[variable_names].to_dict(orient="records")
+
+    return scorecard, records
+
+
+if __name__ == "__main__":
+    scorecard, records = _fit_scorecard()
+    n_variables = len(scorecard._compiled_records)
+
+    rng = np.random.RandomState(0)
+    records = [records[i] for i in rng.randint(0, len(records), N_RECORDS)]
+
+    t_record = _latencies(scorecard.score_record, records)
+    t_dataframe = _latencies(
+        lambda record: scorecard.score(pd.DataFrame([record])),
+        records[:N_RECORDS_DATAFRAME])
+
+    print("selected variables: {}".format(n_variables))
+    print("{:>28} {:>12} {:>12} {:>14}".format(
+        "method", "p50 (us)", "p99 (us)", "p50/var (us)"))
+
+    for name, times in (("score_record", t_record),
+                        ("score(DataFrame([record]))", t_dataframe)):
+        p50, p99 = np.percentile(times, [50, 99]) * 1e6
+        print("{:>28} {:>12.1f} {:>12.1f} {:>14.2f}".format(
+            name, p50, p99, p50 / n_variables))
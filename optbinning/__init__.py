@@ -1,18 +1,30 @@
-from .binning import BinningProcess
-from .binning import ContinuousOptimalBinning
-from .binning import MDLP
-from .binning import MulticlassOptimalBinning
-from .binning import OptimalBinning
-from .binning.distributed import OptimalBinningSketch
-from .binning.uncertainty import SBOptimalBinning
-from .scorecard import Scorecard
+from ._lazy import lazy_attributes
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'BinningProcess': '.binning',
+    'BinningProcessSketch': '.binning.distributed',
+    'ColumnCache': '.binning',
+    'ContinuousOptimalBinning': '.binning',
+    'MDLP': '.binning',
+    'MulticlassOptimalBinning': '.binning',
+    'OptimalBinning': '.binning',
+    'OptimalBinningSketch': '.binning.distributed',
+    'SBOptimalBinning': '.binning.uncertainty',
+    'Scorecard': '.scorecard',
+    'SolutionCache': '.binning'
+}, submodules=['binning', 'outlier', 'preprocessing', 'scorecard',
+               'scoring'])
 
 
 __all__ = ['BinningProcess',
+           'BinningProcessSketch',
+           'ColumnCache',
            'ContinuousOptimalBinning',
            'MDLP',
            'MulticlassOptimalBinning',
            'OptimalBinning',
            'OptimalBinningSketch',
            'SBOptimalBinning',
-           'Scorecard']
+           'Scorecard',
+           'SolutionCache']
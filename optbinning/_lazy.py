@@ -0,0 +1,60 @@
+"""
+Lazy loading of package attributes.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import importlib
+import sys
+
+
+def lazy_attributes(package, attributes, submodules=()):
+    """Return the module level functions ``__getattr__`` and ``__dir__``
+    (PEP 562) of a package importing the module of each attribute on first
+    access.
+
+    Python 3.6 does not support module level ``__getattr__``, therefore all
+    attributes are imported eagerly.
+
+    Parameters
+    ----------
+    package : str
+        The package name.
+
+    attributes : dict
+        Dictionary mapping attribute names to relative module names.
+
+    submodules : list
+        List of submodules imported on first access.
+
+    Returns
+    -------
+    getattr : function
+
+    dir : function
+    """
+    def __getattr__(name):
+        if name in attributes:
+            module = importlib.import_module(attributes[name], package)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module("." + name, package)
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}"
+                                 .format(package, name))
+
+        # Cache the attribute, __getattr__ is only called once per name
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attributes) |
+                      set(submodules))
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            __getattr__(name)
+
+    return __getattr__, __dir__
@@ -1,12 +1,21 @@
-from .binning import OptimalBinning
-from .binning_process import BinningProcess
-from .continuous_binning import ContinuousOptimalBinning
-from .mdlp import MDLP
-from .multiclass_binning import MulticlassOptimalBinning
+from .._lazy import lazy_attributes
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'BinningProcess': '.binning_process',
+    'ColumnCache': '.column_cache',
+    'ContinuousOptimalBinning': '.continuous_binning',
+    'MDLP': '.mdlp',
+    'MulticlassOptimalBinning': '.multiclass_binning',
+    'OptimalBinning': '.binning',
+    'SolutionCache': '.solution_cache'
+}, submodules=['distributed', 'uncertainty'])
 
 
 __all__ = ['BinningProcess',
+           'ColumnCache',
            'ContinuousOptimalBinning',
            'MDLP',
            'MulticlassOptimalBinning',
-           'OptimalBinning']
+           'OptimalBinning',
+           'SolutionCache']
@@ -7,8 +7,6 @@ Automatic monotonic trend algorithm.
 
 import numpy as np
 
-from scipy.spatial import ConvexHull
-
 
 def n_peaks_valleys(x):
     """Find number of peaks and valleys in an array of values.
@@ -125,6 +123,8 @@ def auto_monotonic_data(n_nonevent, n_event):
     rectangular_area = (max_event_rate - min_event_rate) * n_prebins
 
     if n_prebins > 2:
+        from scipy.spatial import ConvexHull
+
         try:
             hull = ConvexHull(points)
             p_convex_hull = hull.volume / rectangular_area
@@ -198,6 +198,8 @@ def auto_monotonic_data_continuous(n_records, sums):
     rectangular_area = (max_event_rate - min_event_rate) * n_prebins
 
     if n_prebins > 2:
+        from scipy.spatial import ConvexHull
+
         try:
             hull = ConvexHull(points)
             p_convex_hull = hull.volume / rectangular_area
@@ -23,11 +23,14 @@ from .binning_statistics import bin_categorical
 from .binning_statistics import bin_info
 from .binning_statistics import BinningTable
 from .binning_statistics import target_info_samples
-from .cp import BinningCP
-from .ls import BinningLS
-from .mip import BinningMIP
+from .dp import BinningDP
+from .histogram import bin_indices
+from .histogram import binary_histogram
+from .histogram import merge_histogram
 from .prebinning import PreBinning
+from .solution_cache import SolutionCache
 from .transformations import transform_binary_target
+from .transformations import TransformPlan
 
 
 def _check_parameters(name, dtype, prebinning_method, solver, divergence,
@@ -38,7 +41,8 @@ def _check_parameters(name, dtype, prebinning_method, solver, divergence,
                       max_pvalue_policy, gamma, outlier_detector,
                       outlier_params, class_weight, cat_cutoff, user_splits,
                       user_splits_fixed, special_codes, split_digits,
-                      mip_solver, time_limit, verbose):
+                      mip_solver, time_limit,
+                      solution_cache, verbose):
 
     if not isinstance(name, str):
         raise TypeError("name must be a string.")
@@ -52,9 +56,9 @@ def _check_parameters(name, dtype, prebinning_method, solver, divergence,
                          'values are "cart", "mdlp", "quantile" '
                          'and "uniform".')
 
-    if solver not in ("cp", "ls", "mip"):
+    if solver not in ("cp", "dp", "ls", "mip"):
         raise ValueError('Invalid value for solver. Allowed string '
-                         'values are "cp", "ls" and "mip".')
+                         'values are "cp", "dp", "ls" and "mip".')
 
     if divergence not in ("iv", "js", "hellinger", "triangular"):
         raise ValueError('Invalid value for divergence. Allowed string '
@@ -228,6 +232,11 @@ def _check_parameters(name, dtype, prebinning_method, solver, divergence,
         raise ValueError("time_limit must be a positive value in seconds; "
                          "got {}.".format(time_limit))
 
+    if solution_cache is not None and not isinstance(solution_cache,
+                                                     SolutionCache):
+        raise TypeError("solution_cache must be a SolutionCache instance or "
+                        "None.")
+
     if not isinstance(verbose, bool):
         raise TypeError("verbose must be a boolean; got {}.".format(verbose))
 
@@ -258,8 +267,12 @@ class OptimalBinning(BaseOptimalBinning):
     solver : str, optional (default="cp")
         The optimizer to solve the optimal binning problem. Supported solvers
         are "mip" to choose a mixed-integer programming solver, "cp" to choose
-        a constrained programming solver or "ls" to choose `LocalSolver
-        <https://www.localsolver.com/>`_.
+        a constrained programming solver, "dp" to choose an exact dynamic
+        programming solver or "ls" to choose `LocalSolver
+        <https://www.localsolver.com/>`_. Solver "dp" supports no monotonic
+        trend or "ascending" and "descending" trends, and the max p-value
+        constraint with ``max_pvalue_policy="consecutive"``. Otherwise, it
+        falls back to solver "cp".
 
     divergence : str, optional (default="iv")
         The divergence measure in the objective function to be maximized.
@@ -388,6 +401,13 @@ class OptimalBinning(BaseOptimalBinning):
     time_limit : int (default=100)
         The maximum time in seconds to run the optimization solver.
 
+    solution_cache : SolutionCache or None (default=None)
+        Cache of optimal solutions. If the prebinning statistics and the
+        optimizer parameters match a cached solution, the optimization model
+        is neither built nor solved. See :class:`SolutionCache`.
+
+        .. versionadded:: 0.7.1
+
     verbose : bool (default=False)
         Enable verbose output.
 
@@ -422,7 +442,8 @@ class OptimalBinning(BaseOptimalBinning):
                  outlier_detector=None, outlier_params=None, class_weight=None,
                  cat_cutoff=None, user_splits=None, user_splits_fixed=None,
                  special_codes=None, split_digits=None, mip_solver="bop",
-                 time_limit=100, verbose=False, **prebinning_kwargs):
+                 time_limit=100, solution_cache=None, verbose=False,
+                 **prebinning_kwargs):
 
         self.name = name
         self.dtype = dtype
@@ -462,6 +483,7 @@ class OptimalBinning(BaseOptimalBinning):
         self.mip_solver = mip_solver
         self.time_limit = time_limit
 
+        self.solution_cache = solution_cache
         self.verbose = verbose
         self.prebinning_kwargs = prebinning_kwargs
 
@@ -483,16 +505,21 @@ class OptimalBinning(BaseOptimalBinning):
         self._binning_table = None
         self._n_prebins = None
         self._n_refinements = 0
+        self._presorted = None
         self._n_samples = None
         self._optimizer = None
+        self._solver_type = None
         self._splits_optimal = None
         self._status = None
+        self._transform_plan = None
 
         # timing
         self._time_total = None
         self._time_preprocessing = None
         self._time_prebinning = None
         self._time_solver = None
+        self._time_model_generation = None
+        self._time_optimizer = None
         self._time_postprocessing = None
 
         # logger
@@ -501,7 +528,8 @@ class OptimalBinning(BaseOptimalBinning):
 
         self._is_fitted = False
 
-    def fit(self, x, y, sample_weight=None, check_input=False):
+    def fit(self, x, y, sample_weight=None, check_input=False,
+            column_cache=None):
         """Fit the optimal binning according to the given training data.
 
         Parameters
@@ -520,12 +548,19 @@ class OptimalBinning(BaseOptimalBinning):
         check_input : bool (default=False)
             Whether to check input arrays.
 
+        column_cache : ColumnCache or None (default=None)
+            Cache of presorted columns. If provided, the sorted clean values
+            of a numerical variable are stored in the cache or reused from a
+            previous fit. See :class:`ColumnCache`.
+
+            .. versionadded:: 0.7.1
+
         Returns
         -------
         self : object
             Fitted optimal binning.
         """
-        return self._fit(x, y, sample_weight, check_input)
+        return self._fit(x, y, sample_weight, check_input, column_cache)
 
     def fit_transform(self, x, y, sample_weight=None, metric="woe",
                       metric_special=0, metric_missing=0, show_digits=2,
@@ -631,7 +666,8 @@ class OptimalBinning(BaseOptimalBinning):
                                        self._cat_others, metric,
                                        metric_special, metric_missing,
                                        self.user_splits, show_digits,
-                                       check_input)
+                                       check_input,
+                                       self._get_transform_plan())
 
     def information(self, print_level=1):
         """Print overview information about the options settings, problem
@@ -653,22 +689,29 @@ class OptimalBinning(BaseOptimalBinning):
         if self._optimizer is not None:
             solver = self._optimizer.solver_
             time_solver = self._time_solver
+            time_model_generation = self._time_model_generation
+            time_optimizer = self._time_optimizer
         else:
             solver = None
             time_solver = 0
+            time_model_generation = None
+            time_optimizer = None
 
         dict_user_options = self.get_params()
 
         print_binning_information(binning_type, print_level, self.name,
-                                  self._status, self.solver, solver,
+                                  self._status, self._solver_type, solver,
                                   self._time_total, self._time_preprocessing,
                                   self._time_prebinning, time_solver,
+                                  time_model_generation, time_optimizer,
                                   self._time_postprocessing, self._n_prebins,
                                   self._n_refinements, dict_user_options)
 
-    def _fit(self, x, y, sample_weight, check_input):
+    def _fit(self, x, y, sample_weight, check_input, column_cache=None):
         time_init = time.perf_counter()
 
+        self._transform_plan = None
+
         if self.verbose:
             self._logger.info("Optimal binning started.")
             self._logger.info("Options: check parameters.")
@@ -694,6 +737,14 @@ class OptimalBinning(BaseOptimalBinning):
             self.user_splits, check_input, self.outlier_detector,
             self.outlier_params, None, None, self.class_weight, sample_weight)
 
+        if (column_cache is not None and self.dtype == "numerical" and
+                self.outlier_detector is None):
+            self._presorted = column_cache._get(
+                x, y, sample_weight, self.dtype, self.special_codes,
+                self.class_weight, x_clean, y_clean, sw_clean)
+        else:
+            self._presorted = None
+
         self._time_preprocessing = time.perf_counter() - time_preprocessing
 
         if self.verbose:
@@ -827,6 +878,9 @@ class OptimalBinning(BaseOptimalBinning):
             self._logger.info("Post-processing terminated. Time: {:.4f}s"
                               .format(self._time_postprocessing))
 
+        # Do not keep references to the cached column
+        self._presorted = None
+
         self._time_total = time.perf_counter() - time_init
 
         if self.verbose:
@@ -852,7 +906,7 @@ class OptimalBinning(BaseOptimalBinning):
                                 problem_type=self._problem_type,
                                 class_weight=class_weight,
                                 **self.prebinning_kwargs
-                                ).fit(x, y, sample_weight)
+                                ).fit(x, y, sample_weight, self._presorted)
 
         return self._prebinning_refinement(prebinning.splits, x, y, y_missing,
                                            y_special, y_others, sw_clean,
@@ -951,7 +1005,27 @@ class OptimalBinning(BaseOptimalBinning):
                 self._logger.info("Optimizer: monotonic trend set to "
                                   "{}.".format(monotonic))
 
-        if self.solver == "cp":
+        solver_type = self.solver
+
+        if self.solver == "dp":
+            optimizer = BinningDP(monotonic, self.min_n_bins, self.max_n_bins,
+                                  min_bin_size, max_bin_size,
+                                  min_bin_n_event, self.max_bin_n_event,
+                                  min_bin_n_nonevent, self.max_bin_n_nonevent,
+                                  self.min_event_rate_diff, self.max_pvalue,
+                                  self.max_pvalue_policy, self.gamma,
+                                  self.user_splits_fixed, self.time_limit)
+
+            if not optimizer.is_supported():
+                solver_type = "cp"
+
+                if self.verbose:
+                    self._logger.info("Optimizer: constraints not supported "
+                                      "by solver dp, fallback to cp.")
+
+        if solver_type == "cp":
+            from .cp import BinningCP
+
             optimizer = BinningCP(monotonic, self.min_n_bins, self.max_n_bins,
                                   min_bin_size, max_bin_size,
                                   min_bin_n_event, self.max_bin_n_event,
@@ -960,6 +1034,8 @@ class OptimalBinning(BaseOptimalBinning):
                                   self.max_pvalue_policy, self.gamma,
                                   self.user_splits_fixed, self.time_limit)
         elif self.solver == "mip":
+            from .mip import BinningMIP
+
             optimizer = BinningMIP(monotonic, self.min_n_bins, self.max_n_bins,
                                    min_bin_size, max_bin_size,
                                    min_bin_n_event, self.max_bin_n_event,
@@ -969,6 +1045,8 @@ class OptimalBinning(BaseOptimalBinning):
                                    self.user_splits_fixed, self.mip_solver,
                                    self.time_limit)
         elif self.solver == "ls":
+            from .ls import BinningLS
+
             optimizer = BinningLS(monotonic, self.min_n_bins, self.max_n_bins,
                                   min_bin_size, max_bin_size,
                                   min_bin_n_event, self.max_bin_n_event,
@@ -977,20 +1055,13 @@ class OptimalBinning(BaseOptimalBinning):
                                   self.max_pvalue_policy,
                                   self.user_splits_fixed, self.time_limit)
 
-        if self.verbose:
-            self._logger.info("Optimizer: build model...")
-
-        optimizer.build_model(self.divergence, n_nonevent, n_event,
-                              trend_change)
-
-        if self.verbose:
-            self._logger.info("Optimizer: solve...")
-
-        status, solution = optimizer.solve()
+        optimizer, status, solution = self._solve(
+            optimizer, self.divergence, n_nonevent, n_event, trend_change)
 
         self._solution = solution
 
         self._optimizer = optimizer
+        self._solver_type = solver_type
         self._status = status
 
         if self.dtype == "categorical" and self.user_splits is not None:
@@ -1004,12 +1075,46 @@ class OptimalBinning(BaseOptimalBinning):
             self._logger.info("Optimizer terminated. Time: {:.4f}s"
                               .format(self._time_solver))
 
+    def _solve(self, optimizer, *model_data):
+        # Build and solve the optimization model unless the solution is
+        # cached. On cache hits the returned optimizer is None.
+        solution_cache = self.solution_cache
+
+        if solution_cache is not None:
+            key = solution_cache._key(optimizer, *model_data)
+            cached = solution_cache._get(key)
+
+            if cached is not None:
+                if self.verbose:
+                    self._logger.info("Optimizer: solution retrieved from "
+                                      "cache.")
+
+                status, solution = cached
+                return None, status, solution
+
+        if self.verbose:
+            self._logger.info("Optimizer: build model...")
+
+        time_model_generation = time.perf_counter()
+        optimizer.build_model(*model_data)
+        self._time_model_generation = (
+            time.perf_counter() - time_model_generation)
+
+        if self.verbose:
+            self._logger.info("Optimizer: solve...")
+
+        time_optimizer = time.perf_counter()
+        status, solution = optimizer.solve()
+        self._time_optimizer = time.perf_counter() - time_optimizer
+
+        if solution_cache is not None:
+            solution_cache._set(key, status, solution)
+
+        return optimizer, status, solution
+
     def _prebinning_refinement(self, splits_prebinning, x, y, y_missing,
                                y_special, y_others, sw_clean, sw_missing,
                                sw_special, sw_others):
-        y0 = (y == 0)
-        y1 = ~y0
-
         # Compute n_nonevent and n_event for special, missing and others.
         special_target_info = target_info_samples(y_special, sw_special)
         self._n_nonevent_special = special_target_info[0]
@@ -1033,31 +1138,44 @@ class OptimalBinning(BaseOptimalBinning):
             splits_prebinning = np.round(splits_prebinning, self.split_digits)
 
         splits_prebinning, n_nonevent, n_event = self._compute_prebins(
-            splits_prebinning, x, y0, y1, sw_clean)
+            splits_prebinning, x, y, sw_clean)
 
         return splits_prebinning, n_nonevent, n_event
 
-    def _compute_prebins(self, splits_prebinning, x, y0, y1, sw):
+    def _compute_prebins(self, splits_prebinning, x, y, sw):
         n_splits = len(splits_prebinning)
         if not n_splits:
             return splits_prebinning, np.array([]), np.array([])
 
         if self.dtype == "categorical" and self.user_splits is not None:
-            indices = np.digitize(x, splits_prebinning, right=True)
+            indices = bin_indices(x, splits_prebinning, right=True)
             n_bins = n_splits
+        elif self._presorted is not None:
+            # Histogram of the unique values instead of the samples
+            indices = bin_indices(self._presorted.values, splits_prebinning,
+                                  right=False)
+            n_nonevent, n_event = self._presorted.histogram(
+                indices, n_splits + 1)
+
+            return self._refine_prebins(splits_prebinning, n_nonevent,
+                                        n_event)
         else:
-            indices = np.digitize(x, splits_prebinning, right=False)
+            indices = bin_indices(x, splits_prebinning, right=False)
             n_bins = n_splits + 1
 
-        n_nonevent = np.empty(n_bins).astype(np.int64)
-        n_event = np.empty(n_bins).astype(np.int64)
+        n_nonevent, n_event = binary_histogram(indices, n_bins, y, sw)
 
-        for i in range(n_bins):
-            mask = (indices == i)
-            n_nonevent[i] = np.sum(sw[y0 & mask])
-            n_event[i] = np.sum(sw[y1 & mask])
+        return self._refine_prebins(splits_prebinning, n_nonevent, n_event)
 
-        mask_remove = (n_nonevent == 0) | (n_event == 0)
+    def _refine_prebins(self, splits_prebinning, n_nonevent, n_event):
+        if not len(splits_prebinning):
+            return splits_prebinning, np.array([]), np.array([])
+
+        # Weighted counts are merged before truncation to integer counts.
+        n_nonevent_int = n_nonevent.astype(np.int64)
+        n_event_int = n_event.astype(np.int64)
+
+        mask_remove = (n_nonevent_int == 0) | (n_event_int == 0)
 
         if np.any(mask_remove):
             if self.divergence in ("hellinger", "triangular"):
@@ -1094,10 +1212,28 @@ class OptimalBinning(BaseOptimalBinning):
                     self._logger.info("Pre-binning: number prebins removed: {}"
                                       .format(np.count_nonzero(mask_remove)))
 
-                [splits_prebinning, n_nonevent,
-                 n_event] = self._compute_prebins(splits, x, y0, y1, sw)
+                # Merge counts of removed prebins instead of recomputing.
+                if (self.dtype == "categorical" and
+                        self.user_splits is not None):
+                    n_bins = len(splits)
+                else:
+                    n_bins = len(splits) + 1
+
+                n_nonevent = merge_histogram(n_nonevent, mask_splits, n_bins)
+                n_event = merge_histogram(n_event, mask_splits, n_bins)
 
-        return splits_prebinning, n_nonevent, n_event
+                return self._refine_prebins(splits, n_nonevent, n_event)
+
+        return splits_prebinning, n_nonevent_int, n_event_int
+
+    def _get_transform_plan(self):
+        # Compile the bin lookup once and reuse it across transform calls.
+        if self._transform_plan is None:
+            self._transform_plan = TransformPlan(
+                self._splits_optimal, self.dtype, self._categories,
+                self._cat_others, self.user_splits, self.special_codes)
+
+        return self._transform_plan
 
     @property
     def binning_table(self):
@@ -13,12 +13,7 @@ from .options import continuous_optimal_binning_default_options
 from .options import multiclass_optimal_binning_default_options
 from .options import optimal_binning_default_options
 from .options import sboptimal_binning_default_options
-
-try:
-    from localsolver import LSStatistics
-    LOCALSOLVER_AVAILABLE = True
-except ImportError:
-    LOCALSOLVER_AVAILABLE = False
+from .solution_cache import SolutionCache
 
 
 def print_header():
@@ -41,7 +36,7 @@ def print_optional_parameters(dict_default_options, dict_user_options):
             user_value = "no"
         elif isinstance(user_value, (list, np.ndarray, dict)):
             user_value = "yes"
-        elif isinstance(user_value, BaseEstimator):
+        elif isinstance(user_value, (BaseEstimator, SolutionCache)):
             user_value = "yes"
 
         str_options += option_format.format(key, str(user_value), user_flag)
@@ -92,8 +87,17 @@ def print_solver_statistics(solver_type, solver):
             "    Best objective bound          {:>10.4f}\n"
             ).format(solver_type, n_variables, n_constraints, objective,
                      best_bound)
+    elif solver_type == "dp":
+        solver_stats = (
+            "  Solver statistics\n"
+            "    Type                          {:>10}\n"
+            "    Number of states              {:>10}\n"
+            "    Objective value               {:>10}\n"
+            ).format(solver_type, solver.n_states_, solver.objective_)
     elif solver_type == "ls":
-        if not LOCALSOLVER_AVAILABLE:
+        try:
+            from localsolver import LSStatistics
+        except ImportError:
             raise ImportError('Cannot import localsolver. Install LocalSolver '
                               'or choose another solver, options are "cp" and '
                               '"mip".')
@@ -108,17 +112,16 @@ def print_solver_statistics(solver_type, solver):
     print(solver_stats)
 
 
-def print_timing(solver_type, solver, time_total, time_preprocessing,
-                 time_prebinning, time_solver, time_postprocessing):
+def print_timing(time_total, time_preprocessing, time_prebinning,
+                 time_solver, time_model_generation, time_optimizer,
+                 time_postprocessing):
 
     p_preprocessing = time_preprocessing / time_total
     p_prebinning = time_prebinning / time_total
     p_solver = time_solver / time_total
     p_postprocessing = time_postprocessing / time_total
 
-    if solver_type == "cp" and solver is not None:
-        time_optimizer = solver.WallTime()
-        time_model_generation = time_solver - time_optimizer
+    if time_model_generation is not None and time_optimizer is not None:
         p_model_generation = time_model_generation / time_solver
         p_optimizer = time_optimizer / time_solver
 
@@ -167,6 +170,7 @@ def print_main_info(name, status, time_total):
 def print_binning_information(binning_type, print_level, name, status,
                               solver_type, solver, time_total,
                               time_preprocessing, time_prebinning, time_solver,
+                              time_model_generation, time_optimizer,
                               time_postprocessing, n_prebins, n_refinements,
                               dict_user_options):
 
@@ -195,5 +199,6 @@ def print_binning_information(binning_type, print_level, name, status,
             if solver is not None:
                 print_solver_statistics(solver_type, solver)
 
-            print_timing(solver_type, solver, time_total, time_preprocessing,
-                         time_prebinning, time_solver, time_postprocessing)
+            print_timing(time_total, time_preprocessing, time_prebinning,
+                         time_solver, time_model_generation, time_optimizer,
+                         time_postprocessing)
@@ -6,8 +6,12 @@ Binning process.
 # Copyright (C) 2020
 
 import numbers
+import os
+import shutil
+import tempfile
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import cpu_count
 from multiprocessing import Pool
 from warnings import warn
@@ -22,10 +26,19 @@ from sklearn.utils import check_consistent_length
 from sklearn.utils.multiclass import type_of_target
 
 from ..logging import Logger
+from ..preprocessing import split_data
+from ..scoring import write_artifact
 from .binning import OptimalBinning
 from .binning_process_information import print_binning_process_information
 from .continuous_binning import ContinuousOptimalBinning
+from .histogram import bin_indices
+from .histogram import binary_histogram
 from .multiclass_binning import MulticlassOptimalBinning
+from .solution_cache import SolutionCache
+from .transformations import _binary_target_table
+from .transformations import _check_metric_special_missing
+from .transformations import _continuous_target_table
+from .transformations import _multiclass_target_table
 
 
 _METRICS = {
@@ -47,6 +60,30 @@ _METRICS = {
 }
 
 
+_TRANSFORM_METRICS = {
+    "binary": ["woe", "event_rate"],
+    "continuous": ["mean"],
+    "multiclass": ["mean_woe", "weighted_mean_woe"]
+}
+
+
+def _metric_table(optb, target_dtype, metric, metric_special,
+                  metric_missing):
+    # Lookup table of the transformation metric indexed by bin index. See
+    # TransformPlan.indices.
+    n_bins = optb._get_transform_plan().n_bins
+
+    if target_dtype == "binary":
+        return _binary_target_table(optb._n_nonevent, optb._n_event, n_bins,
+                                    metric, metric_special, metric_missing)
+    elif target_dtype == "continuous":
+        return _continuous_target_table(optb._n_records, optb._sums, n_bins,
+                                        metric_special, metric_missing)
+    else:
+        return _multiclass_target_table(optb._n_event, n_bins, metric,
+                                        metric_special, metric_missing)
+
+
 def _effective_n_jobs(n_jobs):
     # Joblib check
     if n_jobs is None:
@@ -60,7 +97,8 @@ def _effective_n_jobs(n_jobs):
 def _fit_variable(x, y, name, target_dtype, categorical_variables,
                   binning_fit_params, max_n_prebins, min_prebin_size,
                   min_n_bins, max_n_bins, min_bin_size, max_pvalue,
-                  max_pvalue_policy, special_codes, split_digits):
+                  max_pvalue_policy, special_codes, split_digits,
+                  solution_cache=None, column_cache=None):
     params = {}
     dtype = _check_variable_dtype(x)
 
@@ -79,7 +117,8 @@ def _fit_variable(x, y, name, target_dtype, categorical_variables,
             min_bin_size=min_bin_size, max_pvalue=max_pvalue,
             max_pvalue_policy=max_pvalue_policy,
             special_codes=special_codes,
-            split_digits=split_digits)
+            split_digits=split_digits,
+            solution_cache=solution_cache)
     elif target_dtype == "continuous":
         optb = ContinuousOptimalBinning(
             name=name, dtype=dtype, max_n_prebins=max_n_prebins,
@@ -88,7 +127,8 @@ def _fit_variable(x, y, name, target_dtype, categorical_variables,
             min_bin_size=min_bin_size, max_pvalue=max_pvalue,
             max_pvalue_policy=max_pvalue_policy,
             special_codes=special_codes,
-            split_digits=split_digits)
+            split_digits=split_digits,
+            solution_cache=solution_cache)
     else:
         if dtype == "categorical":
             raise ValueError("MulticlassOptimalBinning does not support "
@@ -100,40 +140,97 @@ def _fit_variable(x, y, name, target_dtype, categorical_variables,
             min_bin_size=min_bin_size, max_pvalue=max_pvalue,
             max_pvalue_policy=max_pvalue_policy,
             special_codes=special_codes,
-            split_digits=split_digits)
+            split_digits=split_digits,
+            solution_cache=solution_cache)
 
     optb.set_params(**params)
-    optb.fit(x, y)
+
+    if column_cache is not None and target_dtype == "binary":
+        optb.fit(x, y, column_cache=column_cache)
+    else:
+        optb.fit(x, y)
 
     return dtype, optb
 
 
-def _fit_block(X, y, names, target_dtype, categorical_variables,
-               binning_fit_params, max_n_prebins, min_prebin_size,
-               min_n_bins, max_n_bins, min_bin_size, max_pvalue,
-               max_pvalue_policy, special_codes, split_digits):
+def _sketch_variable(name, dtype, categorical_variables, binning_fit_params,
+                     sketch, eps, max_n_prebins, min_n_bins, max_n_bins,
+                     min_bin_size, max_pvalue, max_pvalue_policy,
+                     special_codes, split_digits):
+    # Imported here, the distributed module depends on this module
+    from .distributed import OptimalBinningSketch
 
-    variable_dtypes = {}
-    binned_variables = {}
+    params = {}
 
-    for i, name in enumerate(names):
-        if isinstance(X, np.ndarray):
-            dtype, optb = _fit_variable(
-                X[:, i], y, name, target_dtype, categorical_variables,
-                binning_fit_params, max_n_prebins, min_prebin_size, min_n_bins,
-                max_n_bins, min_bin_size, max_pvalue, max_pvalue_policy,
-                special_codes, split_digits)
-        else:
-            dtype, optb = _fit_variable(
-                X[name], y, name, target_dtype, categorical_variables,
-                binning_fit_params, max_n_prebins, min_prebin_size, min_n_bins,
-                max_n_bins, min_bin_size, max_pvalue, max_pvalue_policy,
-                special_codes, split_digits)
+    if categorical_variables is not None:
+        if name in categorical_variables:
+            dtype = "categorical"
+
+    if binning_fit_params is not None:
+        params = binning_fit_params.get(name, {})
+
+    optb = OptimalBinningSketch(
+        name=name, dtype=dtype, sketch=sketch, eps=eps,
+        max_n_prebins=max_n_prebins, min_n_bins=min_n_bins,
+        max_n_bins=max_n_bins, min_bin_size=min_bin_size,
+        max_pvalue=max_pvalue, max_pvalue_policy=max_pvalue_policy,
+        special_codes=special_codes, split_digits=split_digits)
+
+    # Parameters of OptimalBinning without a sketch counterpart, e.g.,
+    # prebinning_method, are ignored.
+    sketch_params = optb.get_params()
+    unsupported = [key for key in params if key not in sketch_params]
+
+    if unsupported:
+        warn("Parameters {} of variable {} are not supported by "
+             "OptimalBinningSketch and will be ignored."
+             .format(unsupported, name))
+
+        params = {key: value for key, value in params.items()
+                  if key in sketch_params}
+
+    optb.set_params(**params)
+
+    return optb
+
+
+# Data shared with the worker processes. X columns and y are stored once in
+# memory-mapped files and opened by each worker on initialization.
+_worker_data = {}
+
+
+def _init_worker(paths, y, fit_args):
+    _worker_data["X"] = {key: np.load(path, mmap_mode="r")
+                         for key, path in paths.items()}
+
+    if isinstance(y, str):
+        y = np.load(y, mmap_mode="r")
+
+    _worker_data["y"] = y
+    _worker_data["fit_args"] = fit_args
 
-        variable_dtypes[name] = dtype
-        binned_variables[name] = optb
 
-    return variable_dtypes, binned_variables
+def _fit_variable_task(task):
+    name, key, position, x = task
+
+    if x is None:
+        x = np.asarray(_worker_data["X"][key][position])
+
+    y = np.asarray(_worker_data["y"])
+
+    dtype, optb = _fit_variable(x, y, name, *_worker_data["fit_args"])
+
+    return name, dtype, optb
+
+
+def _variable_cost(x, is_categorical, n_sample=10000):
+    # Estimated fitting cost used to schedule expensive variables first:
+    # categorical variables before numerical, then by number of unique
+    # values on a strided sample.
+    step = max(len(x) // n_sample, 1)
+    x_sample = pd.Series(x[::step])
+
+    return is_categorical, x_sample.nunique()
 
 
 def _check_selection_criteria(selection_criteria, target_dtype):
@@ -182,7 +279,7 @@ def _check_parameters(variable_names, max_n_prebins, min_prebin_size,
                       max_pvalue, max_pvalue_policy, selection_criteria,
                       categorical_variables, special_codes, split_digits,
                       binning_fit_params, binning_transform_params, n_jobs,
-                      verbose):
+                      solution_cache, verbose):
 
     if not isinstance(variable_names, (np.ndarray, list)):
         raise TypeError("variable_names must be a list or numpy.ndarray.")
@@ -274,10 +371,24 @@ def _check_parameters(variable_names, max_n_prebins, min_prebin_size,
             raise ValueError("n_jobs must be an integer or None; got {}."
                              .format(n_jobs))
 
+    if solution_cache is not None and not isinstance(solution_cache,
+                                                     SolutionCache):
+        raise TypeError("solution_cache must be a SolutionCache instance or "
+                        "None.")
+
     if not isinstance(verbose, bool):
         raise TypeError("verbose must be a boolean; got {}.".format(verbose))
 
 
+def _check_chunk_size(chunk_size, allow_none):
+    if chunk_size is None and allow_none:
+        return
+
+    if not isinstance(chunk_size, numbers.Integral) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer; got {}."
+                         .format(chunk_size))
+
+
 def _check_variable_dtype(x):
     return "categorical" if x.dtype == np.object else "numerical"
 
@@ -350,7 +461,19 @@ class BinningProcess(BaseEstimator):
 
     n_jobs : int or None, optional (default=None)
         Number of cores to run in parallel while binning variables.
-        ``None`` means 1 core. ``-1`` means using all processors.
+        ``None`` means 1 core. ``-1`` means using all processors. Data is
+        shared with the worker processes through memory-mapped files and
+        each variable is fitted as a separate task, scheduling the most
+        expensive variables first.
+
+        .. versionadded:: 0.7.1
+
+    solution_cache : SolutionCache or None (default=None)
+        Cache of optimal solutions shared by the optimal binning of all
+        variables. Refitting with the same prebinning and constraints, for
+        example after changing ``selection_criteria``, reuses the cached
+        solutions. With ``n_jobs > 1``, worker processes only share the
+        on-disk store. See :class:`SolutionCache`.
 
         .. versionadded:: 0.7.1
 
@@ -389,7 +512,8 @@ class BinningProcess(BaseEstimator):
                  max_pvalue_policy="consecutive", selection_criteria=None,
                  categorical_variables=None, special_codes=None,
                  split_digits=None, binning_fit_params=None,
-                 binning_transform_params=None, n_jobs=None, verbose=False):
+                 binning_transform_params=None, n_jobs=None,
+                 solution_cache=None, verbose=False):
 
         self.variable_names = variable_names
 
@@ -411,6 +535,7 @@ class BinningProcess(BaseEstimator):
         self.split_digits = split_digits
         self.categorical_variables = categorical_variables
         self.n_jobs = n_jobs
+        self.solution_cache = solution_cache
         self.verbose = verbose
 
         # auxiliary
@@ -435,7 +560,7 @@ class BinningProcess(BaseEstimator):
 
         self._is_fitted = False
 
-    def fit(self, X, y, check_input=False):
+    def fit(self, X, y, check_input=False, column_cache=None):
         """Fit the binning process. Fit the optimal binning to all variables
         according to the given training data.
 
@@ -453,12 +578,64 @@ class BinningProcess(BaseEstimator):
         check_input : bool (default=False)
             Whether to check input arrays.
 
+        column_cache : ColumnCache or None (default=None)
+            Cache of presorted columns shared across fits of numerical
+            variables with binary target. Only used if ``n_jobs=1``. See
+            :class:`ColumnCache`.
+
+            .. versionadded:: 0.7.1
+
+        Returns
+        -------
+        self : object
+            Fitted binning process.
+        """
+        return self._fit(X, y, check_input, column_cache)
+
+    def fit_from_chunks(self, chunks, y_column, sketch="gk", eps=1e-4,
+                        check_input=False):
+        """Fit the binning process from data split in chunks of rows, without
+        loading the whole dataset in memory. Only binary target is supported.
+
+        The data is read twice. The first pass builds a binning sketch per
+        variable (see :class:`OptimalBinningSketch`) to compute quantile
+        pre-binning split points of numerical variables and exact category
+        counts of categorical variables. The second pass computes the exact
+        number of events and non-events of each prebin of the numerical
+        variables. Finally, the optimizer runs on the aggregated counts.
+        Memory usage depends on the number of variables and prebins, not on
+        the number of samples.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        chunks : iterable or callable
+            Iterable of ``pandas.DataFrame`` containing the variables and the
+            target column. It must support iterating twice, e.g., a list, or
+            be a callable returning a new iterator of chunks on each call,
+            e.g., a function reading Parquet or CSV files by chunks.
+
+        y_column : str
+            The name of the target column.
+
+        sketch : str, optional (default="gk")
+            Sketch algorithm. Supported algorithms are "gk"
+            (Greenwald-Khanna's) and "t-digest" (Ted Dunning) algorithm.
+
+        eps : float (default=1e-4)
+            Relative error epsilon of the quantile sketch.
+
+        check_input : bool (default=False)
+            Whether to check input arrays.
+
         Returns
         -------
         self : object
             Fitted binning process.
         """
-        return self._fit(X, y, check_input)
+        return self._fit_from_chunks(chunks, y_column, sketch, eps,
+                                     check_input)
 
     def fit_transform(self, X, y, metric=None, metric_special=0,
                       metric_missing=0, show_digits=2, check_input=False):
@@ -510,7 +687,8 @@ class BinningProcess(BaseEstimator):
                                                      show_digits, check_input)
 
     def transform(self, X, metric=None, metric_special=0, metric_missing=0,
-                  show_digits=2, check_input=False):
+                  show_digits=2, check_input=False, n_jobs=None,
+                  chunk_size=None, out=None):
         """Transform given data to metric using bins from each fitted optimal
         binning.
 
@@ -546,6 +724,26 @@ class BinningProcess(BaseEstimator):
         check_input : bool (default=False)
             Whether to check input arrays.
 
+        n_jobs : int or None, optional (default=None)
+            Number of threads to transform row chunks and groups of variables
+            in parallel. ``None`` means 1 thread. ``-1`` means using all
+            processors.
+
+            .. versionadded:: 0.7.1
+
+        chunk_size : int or None, optional (default=None)
+            The number of rows transformed per task. If None, all rows are
+            transformed at once.
+
+            .. versionadded:: 0.7.1
+
+        out : numpy.ndarray or None, optional (default=None)
+            Preallocated output array of shape (n_samples, n_features_new)
+            where the result is stored, e.g., a ``float32`` array or a
+            ``numpy.memmap``. If None, a new array is allocated.
+
+            .. versionadded:: 0.7.1
+
         Returns
         -------
         X_new : numpy array, shape = (n_samples, n_features_new)
@@ -554,7 +752,63 @@ class BinningProcess(BaseEstimator):
         self._check_is_fitted()
 
         return self._transform(X, metric, metric_special, metric_missing,
-                               show_digits, check_input)
+                               show_digits, check_input, n_jobs, chunk_size,
+                               out)
+
+    def transform_chunks(self, X, chunk_size, metric=None, metric_special=0,
+                         metric_missing=0, show_digits=2, check_input=False,
+                         n_jobs=None):
+        """Transform given data to metric using bins from each fitted optimal
+        binning, yielding the transformed data by chunks of rows.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Training vector, where n_samples is the number of samples.
+
+        chunk_size : int
+            The number of rows of each transformed chunk.
+
+        metric : str or None, (default=None)
+            The metric used to transform the input vector. See
+            :meth:`transform`.
+
+        metric_special : float or str (default=0)
+            The metric value to transform special codes in the input vector.
+
+        metric_missing : float or str (default=0)
+            The metric value to transform missing values in the input vector.
+
+        show_digits : int, optional (default=2)
+            The number of significant digits of the bin column. Applies when
+            ``metric="bins"``.
+
+        check_input : bool (default=False)
+            Whether to check input arrays.
+
+        n_jobs : int or None, optional (default=None)
+            Number of threads to transform groups of variables in parallel.
+            ``None`` means 1 thread. ``-1`` means using all processors.
+
+        Yields
+        ------
+        X_new : numpy array, shape = (chunk_size, n_features_new)
+            Transformed chunk. A ``pandas.DataFrame`` if X is a
+            ``pandas.DataFrame``.
+        """
+        self._check_is_fitted()
+
+        _check_chunk_size(chunk_size, allow_none=False)
+
+        n_samples = X.shape[0]
+        for start in range(0, n_samples, chunk_size):
+            stop = min(start + chunk_size, n_samples)
+
+            yield self._transform(X, metric, metric_special, metric_missing,
+                                  show_digits, check_input, n_jobs, None,
+                                  None, rows=slice(start, stop))
 
     def information(self, print_level=1):
         """Print overview information about the options settings and
@@ -661,6 +915,79 @@ class BinningProcess(BaseEstimator):
         else:
             return mask
 
+    def export(self, path, metric=None, metric_special=0, metric_missing=0):
+        """Export the transformation of the selected variables to a
+        lightweight JSON artifact.
+
+        The artifact contains the split points or categories, special codes
+        and the metric lookup table of each selected variable. Load it with
+        :func:`optbinning.scoring.load_artifact` to transform data using
+        NumPy only.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        path : str
+            JSON file path.
+
+        metric : str or None, (default=None)
+            The metric used to transform the input vector. If None, the default
+            transformation metric for each target type is applied. For binary
+            target options are: "woe" (default) and "event_rate". For
+            continuous target the option is "mean" (default). For multiclass
+            target options are: "mean_woe" (default) and "weighted_mean_woe".
+
+        metric_special : float or str (default=0)
+            The metric value to transform special codes in the input vector.
+            Supported metrics are "empirical" to use the empirical metric, and
+            any numerical value.
+
+        metric_missing : float or str (default=0)
+            The metric value to transform missing values in the input vector.
+            Supported metrics are "empirical" to use the empirical metric, and
+            any numerical value.
+        """
+        self._check_is_fitted()
+
+        metrics = _TRANSFORM_METRICS[self._target_dtype]
+        if metric is not None and metric not in metrics:
+            raise ValueError("Invalid value for metric. Allowed values for "
+                             "{} target are {}; got {}."
+                             .format(self._target_dtype, metrics, metric))
+
+        _check_metric_special_missing(metric_special, metric_missing)
+
+        variables = []
+        for name in self.get_support(names=True):
+            optb = self._binned_variables[name]
+
+            params = {}
+            if self.binning_transform_params is not None:
+                params = self.binning_transform_params.get(name, {})
+
+            if metric is None:
+                _metric = metrics[0]
+            else:
+                _metric = params.get("metric", metric)
+
+            _metric_special = params.get("metric_special", metric_special)
+            _metric_missing = params.get("metric_missing", metric_missing)
+
+            table = _metric_table(optb, self._target_dtype, _metric,
+                                  _metric_special, _metric_missing)
+
+            variables.append({"name": name,
+                              "plan": optb._get_transform_plan().to_dict(),
+                              "metric": _metric, "values": table})
+
+        artifact = {"variable_names": list(self.variable_names),
+                    "target_dtype": self._target_dtype,
+                    "metric": metrics[0] if metric is None else metric,
+                    "variables": variables}
+
+        write_artifact(path, "binning_process", artifact)
+
     def _support_selection_criteria(self):
         self._support = np.full(self._n_variables, True, dtype=np.bool)
 
@@ -742,7 +1069,7 @@ class BinningProcess(BaseEstimator):
                                  "'fit' with appropriate arguments."
                                  .format(self.__class__.__name__))
 
-    def _fit(self, X, y, check_input):
+    def _fit(self, X, y, check_input, column_cache=None):
         time_init = time.perf_counter()
 
         if self.verbose:
@@ -801,7 +1128,8 @@ class BinningProcess(BaseEstimator):
                         self.max_n_prebins, self.min_prebin_size,
                         self.min_n_bins, self.max_n_bins, self.min_bin_size,
                         self.max_pvalue, self.max_pvalue_policy,
-                        self.special_codes, self.split_digits)
+                        self.special_codes, self.split_digits,
+                        self.solution_cache, column_cache)
                 else:
                     dtype, optb = _fit_variable(
                         X[name], y, name, self._target_dtype,
@@ -809,44 +1137,145 @@ class BinningProcess(BaseEstimator):
                         self.max_n_prebins, self.min_prebin_size,
                         self.min_n_bins, self.max_n_bins, self.min_bin_size,
                         self.max_pvalue, self.max_pvalue_policy,
-                        self.special_codes, self.split_digits)
+                        self.special_codes, self.split_digits,
+                        self.solution_cache, column_cache)
 
                 self._variable_dtypes[name] = dtype
                 self._binned_variables[name] = optb
         else:
-            pool = Pool(processes=n_jobs)
+            self._fit_parallel(X, y, n_jobs)
 
-            ids = np.arange(len(self.variable_names))
-            id_blocks = np.array_split(ids, n_jobs)
-            names = np.asarray(self.variable_names)
+        if self.verbose:
+            self._logger.info("Binning process variable selection...")
 
-            if isinstance(X, np.ndarray):
-                blocks = [pool.apply_async(
-                    _fit_block, args=(
-                        X[:, id_block], y, names[id_block],
-                        self._target_dtype, self.categorical_variables,
-                        self.binning_fit_params, self.max_n_prebins,
-                        self.min_prebin_size, self.min_n_bins,
-                        self.max_n_bins, self.min_bin_size,
-                        self.max_pvalue, self.max_pvalue_policy,
-                        self.special_codes, self.split_digits))
-                         for id_block in id_blocks]
-            else:
-                blocks = [pool.apply_async(
-                    _fit_block, args=(
-                        X[names[id_block]], y, names[id_block],
-                        self._target_dtype, self.categorical_variables,
-                        self.binning_fit_params, self.max_n_prebins,
-                        self.min_prebin_size, self.min_n_bins,
-                        self.max_n_bins, self.min_bin_size,
-                        self.max_pvalue, self.max_pvalue_policy,
-                        self.special_codes, self.split_digits))
-                         for id_block in id_blocks]
+        # Compute binning statistics and decide whether a variable is selected
+        self._binning_selection_criteria()
 
-            for b in blocks:
-                vt, bv = b.get()
-                self._variable_dtypes.update(vt)
-                self._binned_variables.update(bv)
+        self._time_total = time.perf_counter() - time_init
+
+        if self.verbose:
+            self._logger.info("Binning process terminated. Time: {:.4f}s"
+                              .format(self._time_total))
+
+        # Completed successfully
+        self._class_logger.close()
+        self._is_fitted = True
+
+        return self
+
+    def _fit_from_chunks(self, chunks, y_column, sketch, eps, check_input):
+        time_init = time.perf_counter()
+
+        if self.verbose:
+            self._logger.info("Binning process started.")
+            self._logger.info("Options: check parameters.")
+
+        _check_parameters(**self.get_params())
+
+        if callable(chunks):
+            get_chunks = chunks
+        elif iter(chunks) is chunks:
+            raise TypeError("chunks must be an iterable supporting multiple "
+                            "passes or a callable returning an iterator.")
+        else:
+            def get_chunks():
+                return iter(chunks)
+
+        self._target_dtype = "binary"
+
+        if self.selection_criteria is not None:
+            _check_selection_criteria(self.selection_criteria,
+                                      self._target_dtype)
+
+        # First pass: binning sketches
+        if self.verbose:
+            self._logger.info("Chunks: first pass, building sketches.")
+
+        sketches = {}
+        n_samples = 0
+
+        for chunk in get_chunks():
+            if not isinstance(chunk, pd.DataFrame):
+                raise TypeError("chunks must be pandas.DataFrame.")
+
+            y = chunk[y_column].values
+
+            if type_of_target(y) != "binary":
+                raise ValueError("fit_from_chunks only supports binary "
+                                 "target.")
+
+            n_samples += len(chunk)
+
+            for name in self.variable_names:
+                x = chunk[name].values
+
+                if name not in sketches:
+                    sketches[name] = _sketch_variable(
+                        name, _check_variable_dtype(x),
+                        self.categorical_variables, self.binning_fit_params,
+                        sketch, eps, self.max_n_prebins, self.min_n_bins,
+                        self.max_n_bins, self.min_bin_size, self.max_pvalue,
+                        self.max_pvalue_policy, self.special_codes,
+                        self.split_digits)
+
+                sketches[name].add(x, y, check_input)
+
+        if not n_samples:
+            raise ValueError("chunks must contain at least one sample.")
+
+        self._n_samples = n_samples
+        self._n_variables = len(self.variable_names)
+
+        if self.verbose:
+            self._logger.info("Dataset: number of samples: {}."
+                              .format(self._n_samples))
+
+            self._logger.info("Dataset: number of variables: {}."
+                              .format(self._n_variables))
+
+        # Second pass: exact prebin counts of numerical variables
+        numerical_splits = {name: optb._prebinning_splits()
+                            for name, optb in sketches.items()
+                            if optb.dtype == "numerical"}
+
+        if numerical_splits:
+            if self.verbose:
+                self._logger.info("Chunks: second pass, computing prebin "
+                                  "counts.")
+
+            counts = {name: (np.zeros(len(splits) + 1, dtype=np.int64),
+                             np.zeros(len(splits) + 1, dtype=np.int64))
+                      for name, splits in numerical_splits.items()}
+
+            for chunk in get_chunks():
+                y = chunk[y_column].values
+
+                for name, splits in numerical_splits.items():
+                    xc, yc = split_data(
+                        dtype=None, x=chunk[name].values, y=y,
+                        special_codes=self.special_codes,
+                        check_input=check_input)[:2]
+
+                    n_bins = len(splits) + 1
+                    n_nonevent, n_event = binary_histogram(
+                        bin_indices(xc, splits), n_bins, yc)
+
+                    counts[name][0][:] += n_nonevent.astype(np.int64)
+                    counts[name][1][:] += n_event.astype(np.int64)
+
+            for name, (n_nonevent, n_event) in counts.items():
+                sketches[name]._prebin_counts = (
+                    numerical_splits[name], n_nonevent, n_event)
+
+        return self._fit_sketches(sketches, time_init)
+
+    def _fit_sketches(self, sketches, time_init):
+        # Optimization on aggregated counts
+        for name in self.variable_names:
+            optb = sketches[name].solve()
+
+            self._variable_dtypes[name] = optb.dtype
+            self._binned_variables[name] = optb
 
         if self.verbose:
             self._logger.info("Binning process variable selection...")
@@ -866,15 +1295,124 @@ class BinningProcess(BaseEstimator):
 
         return self
 
+    def _fit_parallel(self, X, y, n_jobs):
+        # Columns with numeric dtype are written once to memory-mapped files,
+        # one per dtype, with one row per variable. Object columns are sent
+        # with their task. One task per variable, most expensive first.
+        tmp_dir = tempfile.mkdtemp(prefix="optbinning_")
+
+        try:
+            columns = []
+            for i, name in enumerate(self.variable_names):
+                if isinstance(X, np.ndarray):
+                    x = X[:, i]
+                else:
+                    x = X[name].values
+
+                columns.append((name, x))
+
+            dtype_columns = {}
+            for name, x in columns:
+                if isinstance(x, np.ndarray) and x.dtype.kind in "biuf":
+                    dtype_columns.setdefault(x.dtype.str, []).append(name)
+
+            paths = {}
+            positions = {}
+            column_dict = dict(columns)
+            for key, names in dtype_columns.items():
+                path = os.path.join(tmp_dir, "X_{}.npy".format(len(paths)))
+                data = np.lib.format.open_memmap(
+                    path, mode="w+", dtype=np.dtype(key),
+                    shape=(len(names), self._n_samples))
+
+                for position, name in enumerate(names):
+                    data[position] = column_dict[name]
+                    positions[name] = (key, position)
+
+                data.flush()
+                del data
+                paths[key] = path
+
+            y = np.asarray(y)
+            if y.dtype.kind in "biuf":
+                y_path = os.path.join(tmp_dir, "y.npy")
+                np.save(y_path, y)
+                y = y_path
+
+            tasks = []
+            costs = []
+            for name, x in columns:
+                is_categorical = x.dtype == object or (
+                    self.categorical_variables is not None and
+                    name in self.categorical_variables)
+
+                costs.append(_variable_cost(x, is_categorical))
+
+                if name in positions:
+                    key, position = positions[name]
+                    tasks.append((name, key, position, None))
+                else:
+                    tasks.append((name, None, None, x))
+
+            order = sorted(range(len(tasks)), key=lambda i: costs[i],
+                           reverse=True)
+
+            fit_args = (self._target_dtype, self.categorical_variables,
+                        self.binning_fit_params, self.max_n_prebins,
+                        self.min_prebin_size, self.min_n_bins,
+                        self.max_n_bins, self.min_bin_size, self.max_pvalue,
+                        self.max_pvalue_policy, self.special_codes,
+                        self.split_digits, self.solution_cache)
+
+            variable_dtypes = {}
+            binned_variables = {}
+
+            with Pool(processes=n_jobs, initializer=_init_worker,
+                      initargs=(paths, y, fit_args)) as pool:
+
+                results = pool.imap_unordered(
+                    _fit_variable_task, [tasks[i] for i in order])
+
+                for name, dtype, optb in results:
+                    # Workers receive a copy of the cache
+                    if self.solution_cache is not None:
+                        optb.solution_cache = self.solution_cache
+
+                    variable_dtypes[name] = dtype
+                    binned_variables[name] = optb
+
+                    if self.verbose:
+                        self._logger.info("Variable {} fitted ({}/{})."
+                                          .format(name, len(binned_variables),
+                                                  self._n_variables))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        for name in self.variable_names:
+            self._variable_dtypes[name] = variable_dtypes[name]
+            self._binned_variables[name] = binned_variables[name]
+
     def _transform(self, X, metric, metric_special, metric_missing,
-                   show_digits, check_input):
+                   show_digits, check_input, n_jobs=None, chunk_size=None,
+                   out=None, rows=None):
 
         # check X dtype
         if not isinstance(X, (pd.DataFrame, np.ndarray)):
             raise TypeError("X must be a pandas.DataFrame or numpy.ndarray.")
 
+        _check_chunk_size(chunk_size, allow_none=True)
+
+        if n_jobs is not None and not isinstance(n_jobs, numbers.Integral):
+            raise ValueError("n_jobs must be an integer or None; got {}."
+                             .format(n_jobs))
+
         n_samples, n_variables = X.shape
 
+        if rows is None:
+            rows = slice(0, n_samples)
+        else:
+            n_samples = rows.stop - rows.start
+
         mask = self.get_support()
         if not mask.any():
             warn("No variables were selected: either the data is"
@@ -886,17 +1424,64 @@ class BinningProcess(BaseEstimator):
 
         indices_selected_variables = self.get_support(indices=True)
         n_selected_variables = len(indices_selected_variables)
-
-        if metric == "indices":
-            X_transform = np.full(
-                (n_samples, n_selected_variables), -1, dtype=np.int)
+        shape = (n_samples, n_selected_variables)
+
+        if out is not None:
+            if out.shape != shape:
+                raise ValueError("out must have shape {}; got {}."
+                                 .format(shape, out.shape))
+            X_transform = out
+        elif metric == "indices":
+            X_transform = np.full(shape, -1, dtype=int)
         elif metric == "bins":
-            X_transform = np.full(
-                (n_samples, n_selected_variables), "", dtype=np.object)
+            X_transform = np.full(shape, "", dtype=object)
         else:
-            X_transform = np.zeros((n_samples, n_selected_variables))
+            X_transform = np.zeros(shape)
+
+        # Tasks: row chunks x groups of variables
+        n_jobs = _effective_n_jobs(n_jobs)
+
+        if chunk_size is None:
+            chunk_size = max(n_samples, 1)
+
+        positions = list(enumerate(indices_selected_variables))
+        groups = [g for g in np.array_split(positions, n_jobs) if len(g)]
+
+        tasks = [(slice(start, min(start + chunk_size, n_samples)), group)
+                 for start in range(0, max(n_samples, 1), chunk_size)
+                 for group in groups]
 
-        for i, idx in enumerate(indices_selected_variables):
+        args = (X, X_transform, rows, metric, metric_special, metric_missing,
+                show_digits, check_input)
+
+        if n_jobs == 1 or len(tasks) == 1:
+            for out_rows, group in tasks:
+                self._transform_block(out_rows, group, *args)
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [executor.submit(self._transform_block, out_rows,
+                                           group, *args)
+                           for out_rows, group in tasks]
+
+                for future in futures:
+                    future.result()
+
+        if isinstance(X, pd.DataFrame):
+            selected_variables = self.get_support(names=True)
+            return pd.DataFrame(X_transform, columns=selected_variables,
+                                index=pd.RangeIndex(rows.start, rows.stop))
+
+        return X_transform
+
+    def _transform_block(self, out_rows, group, X, X_transform, rows, metric,
+                         metric_special, metric_missing, show_digits,
+                         check_input):
+        # Transform rows[out_rows] of a group of variables (i, idx), where i
+        # is the output column and idx the input column.
+        x_rows = slice(rows.start + out_rows.start,
+                       rows.start + out_rows.stop)
+
+        for i, idx in group:
             name = self.variable_names[idx]
             optb = self._binned_variables[name]
 
@@ -904,29 +1489,23 @@ class BinningProcess(BaseEstimator):
             if self.binning_transform_params is not None:
                 params = self.binning_transform_params.get(name, {})
 
-            metric_missing = params.get("metric_missing", metric_missing)
-            metric_special = params.get("metric_special", metric_special)
+            _metric_missing = params.get("metric_missing", metric_missing)
+            _metric_special = params.get("metric_special", metric_special)
 
             if isinstance(X, np.ndarray):
-                x = X[:, idx]
+                x = X[x_rows, idx]
             else:
-                x = X[name]
+                x = X[name].values[x_rows]
 
             if metric is None:
                 # Use default metric for each target type
-                X_transform[:, i] = optb.transform(
-                    x=x, metric_special=metric_special,
-                    metric_missing=metric_missing, show_digits=show_digits,
+                X_transform[out_rows, i] = optb.transform(
+                    x=x, metric_special=_metric_special,
+                    metric_missing=_metric_missing, show_digits=show_digits,
                     check_input=check_input)
             else:
                 _metric = params.get("metric", metric)
 
-                X_transform[:, i] = optb.transform(
-                    x, _metric, metric_special, metric_missing, show_digits,
-                    check_input)
-
-        if isinstance(X, pd.DataFrame):
-            selected_variables = self.get_support(names=True)
-            return pd.DataFrame(X_transform, columns=selected_variables)
-
-        return X_transform
+                X_transform[out_rows, i] = optb.transform(
+                    x, _metric, _metric_special, _metric_missing,
+                    show_digits, check_input)
@@ -7,9 +7,6 @@ Optimal binning algorithm.
 
 import numbers
 
-import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
 import numpy as np
 import pandas as pd
 
@@ -488,6 +485,10 @@ class BinningTable:
             _n_nonevent.pop(-1)
             n_bins -= 1
 
+        import matplotlib.patches as mpatches
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+
         fig, ax1 = plt.subplots()
 
         p2 = ax1.bar(range(n_bins), _n_event, color="tab:red")
@@ -933,6 +934,10 @@ class MulticlassBinningTable:
         n_metric = n_bins - 2
         n_classes = len(self.classes)
 
+        import matplotlib.patches as mpatches
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+
         fig, ax1 = plt.subplots()
 
         colors = COLORS_RGB[:n_classes]
@@ -1329,6 +1334,10 @@ class ContinuousBinningTable:
             _n_records.pop(-1)
             n_bins -= 1
 
+        import matplotlib.patches as mpatches
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+
         fig, ax1 = plt.subplots()
 
         p1 = ax1.bar(range(n_bins), _n_records, color="tab:blue")
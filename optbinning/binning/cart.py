@@ -0,0 +1,500 @@
+"""
+Best-first CART for a single feature on unique-value histograms.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numbers
+
+import numpy as np
+
+
+# Constants of sklearn.tree: feature values closer than FEATURE_THRESHOLD
+# (in float32 arithmetic) cannot be split and nodes with impurity <= EPSILON
+# are leaves.
+FEATURE_THRESHOLD = np.float32(1e-7)
+
+EPSILON = np.finfo(np.float64).eps
+
+# Frontier record of a leaf: zero improvement and no split.
+_LEAF = (0.0, None)
+
+CLASSIFICATION_CRITERIA = ("gini", "entropy", "log_loss")
+
+REGRESSION_CRITERIA = ("squared_error", "mse")
+
+CART_OPTIONS = ("criterion", "splitter", "max_depth", "min_samples_split",
+                "min_samples_leaf", "min_weight_fraction_leaf",
+                "max_leaf_nodes", "min_impurity_decrease", "class_weight",
+                "random_state")
+
+
+def supports_options(problem_type, options):
+    """Whether the sklearn decision tree options can be handled by
+    :class:`HistogramCART`.
+
+    Parameters
+    ----------
+    problem_type : str
+        The problem type, "classification" or "regression".
+
+    options : dict
+        Keyword arguments of ``sklearn.tree.DecisionTreeClassifier`` or
+        ``sklearn.tree.DecisionTreeRegressor``.
+
+    Returns
+    -------
+    supported : bool
+    """
+    if any(option not in CART_OPTIONS for option in options):
+        return False
+
+    if options.get("splitter", "best") != "best":
+        return False
+
+    if problem_type == "classification":
+        criteria = CLASSIFICATION_CRITERIA
+    else:
+        criteria = REGRESSION_CRITERIA
+
+    criterion = options.get("criterion", criteria[0])
+
+    return criterion in criteria
+
+
+def _push_frontier(frontier, record):
+    # std::push_heap of libstdc++ on the improvement (record[0]), as used by
+    # the best-first builder of sklearn.tree. Ties are resolved by the heap
+    # layout, not by insertion order.
+    frontier.append(record)
+    hole = len(frontier) - 1
+    parent = (hole - 1) // 2
+    while hole > 0 and frontier[parent][0] < record[0]:
+        frontier[hole] = frontier[parent]
+        hole = parent
+        parent = (hole - 1) // 2
+    frontier[hole] = record
+
+
+def _pop_frontier(frontier):
+    # std::pop_heap of libstdc++ followed by pop_back.
+    top = frontier[0]
+    record = frontier.pop()
+    n = len(frontier)
+
+    if not n:
+        return top
+
+    hole = 0
+    child = 0
+    while child < (n - 1) // 2:
+        child = 2 * (child + 1)
+        if frontier[child][0] < frontier[child - 1][0]:
+            child -= 1
+        frontier[hole] = frontier[child]
+        hole = child
+
+    if n % 2 == 0 and child == (n - 2) // 2:
+        child = 2 * (child + 1)
+        frontier[hole] = frontier[child - 1]
+        hole = child - 1
+
+    parent = (hole - 1) // 2
+    while hole > 0 and frontier[parent][0] < record[0]:
+        frontier[hole] = frontier[parent]
+        hole = parent
+        parent = (hole - 1) // 2
+    frontier[hole] = record
+
+    return top
+
+
+def _class_weight(class_weight, classes, y_indices):
+    # Weight of each class as in sklearn.utils.compute_sample_weight for
+    # single output targets.
+    if class_weight is None:
+        return None
+
+    n_classes = len(classes)
+
+    if isinstance(class_weight, str) and class_weight == "balanced":
+        weight = len(y_indices) / (n_classes * np.bincount(
+            y_indices, minlength=n_classes))
+    else:
+        weight = np.array([class_weight.get(c, 1.0) for c in classes],
+                          dtype=float)
+
+    return weight
+
+
+def _group_values(values, counts, stats):
+    # Values are cast to float32 as sklearn trees do. Consecutive values
+    # closer than FEATURE_THRESHOLD cannot be separated and are grouped.
+    values = values.astype(np.float32)
+
+    if not len(values):
+        values = values.astype(np.float64)
+        return values, values, counts, stats
+
+    separable = values[1:] > values[:-1] + FEATURE_THRESHOLD
+    values = values.astype(np.float64)
+    starts = np.concatenate(([0], np.flatnonzero(separable) + 1))
+    ends = np.append(starts[1:], len(values))
+
+    return (values[starts], values[ends - 1],
+            np.add.reduceat(counts, starts),
+            np.add.reduceat(stats, starts, axis=0))
+
+
+class HistogramCART:
+    """Best-first CART for a single feature working on unique values.
+
+    Fits the same tree as ``sklearn.tree.DecisionTreeClassifier`` or
+    ``sklearn.tree.DecisionTreeRegressor`` with ``splitter="best"`` on
+    ``x.reshape(-1, 1)``, but splits are searched on the cumulative
+    histogram of the distinct values, thus the cost scales with the number
+    of distinct values instead of the number of samples. Ties between
+    candidate splits are resolved in favour of the lowest threshold, as in
+    sklearn.
+
+    Parameters
+    ----------
+    problem_type : str (default="classification")
+        The problem type, "classification" or "regression".
+
+    criterion : str or None (default=None)
+        The function to measure the quality of a split. Supported criteria
+        are "gini", "entropy" and "log_loss" for classification and
+        "squared_error" for regression. If None, "gini" or "squared_error" is
+        used.
+
+    max_depth : int or None (default=None)
+        The maximum depth of the tree.
+
+    min_samples_split : int or float (default=2)
+        The minimum number of samples required to split an internal node.
+
+    min_samples_leaf : int or float (default=1)
+        The minimum number of samples required to be at a leaf node.
+
+    min_weight_fraction_leaf : float (default=0.0)
+        The minimum weighted fraction of the sum total of weights required to
+        be at a leaf node.
+
+    max_leaf_nodes : int or None (default=None)
+        Grow a tree with ``max_leaf_nodes`` in best-first fashion. If None,
+        unlimited number of leaf nodes.
+
+    min_impurity_decrease : float (default=0.0)
+        A node will be split if this split induces a decrease of the impurity
+        greater than or equal to this value.
+
+    class_weight : dict, "balanced" or None (default=None)
+        Weights associated with classes in the form ``{class_label:
+        weight}``. Only used for classification.
+
+    random_state : object (default=None)
+        Ignored. Splits of a single feature are deterministic.
+    """
+    def __init__(self, problem_type="classification", criterion=None,
+                 splitter="best", max_depth=None, min_samples_split=2,
+                 min_samples_leaf=1, min_weight_fraction_leaf=0.0,
+                 max_leaf_nodes=None, min_impurity_decrease=0.0,
+                 class_weight=None, random_state=None):
+
+        self.problem_type = problem_type
+        self.criterion = criterion
+        self.splitter = splitter
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.min_weight_fraction_leaf = min_weight_fraction_leaf
+        self.max_leaf_nodes = max_leaf_nodes
+        self.min_impurity_decrease = min_impurity_decrease
+        self.class_weight = class_weight
+        self.random_state = random_state
+
+        self._splits = None
+
+    def fit(self, x, y, sample_weight=None):
+        """Fit CART on the histogram of the distinct values of x.
+
+        Parameters
+        ----------
+        x : array-like, shape = (n_samples,)
+            Data samples.
+
+        y : array-like, shape = (n_samples,)
+            Target vector relative to x.
+
+        sample_weight : array-like, shape = (n_samples,) or None
+            Sample weights. Samples with zero weight are ignored.
+
+        Returns
+        -------
+        self : object
+        """
+        x = np.asarray(x, dtype=np.float32).ravel()
+        y = np.asarray(y).ravel()
+        n_samples = len(x)
+
+        if self.problem_type == "classification":
+            classes, y = np.unique(y, return_inverse=True)
+            n_classes = len(classes)
+
+            weight = np.ones(n_samples)
+            class_weight = _class_weight(self.class_weight, classes, y)
+            if class_weight is not None:
+                weight *= class_weight[y]
+        else:
+            y = y.astype(np.float64)
+            weight = np.ones(n_samples)
+
+        if sample_weight is not None:
+            weight *= np.asarray(sample_weight, dtype=np.float64)
+
+        mask = weight != 0
+        if not np.all(mask):
+            x = x[mask]
+            y = y[mask]
+            weight = weight[mask]
+
+        values, indices = np.unique(x, return_inverse=True)
+        n_unique = len(values)
+        counts = np.bincount(indices, minlength=n_unique)
+
+        if self.problem_type == "classification":
+            stats = np.bincount(
+                indices * n_classes + y, weights=weight,
+                minlength=n_unique * n_classes).reshape(n_unique, n_classes)
+        else:
+            wy = weight * y
+            stats = np.column_stack([
+                np.bincount(indices, weights=w, minlength=n_unique)
+                for w in (weight, wy, wy * y)])
+
+        return self._fit_histogram(values, counts, stats, n_samples)
+
+    def _fit_histogram(self, values, counts, stats, n_samples):
+        # values: sorted distinct values. counts: number of samples of each
+        # value. stats: weighted class counts of each value for
+        # classification or weighted (count, sum, sum of squares) of the
+        # target for regression.
+        criterion = self.criterion
+        if criterion is None:
+            if self.problem_type == "classification":
+                criterion = "gini"
+            else:
+                criterion = "squared_error"
+
+        if self.problem_type == "classification":
+            self._criterion = "gini" if criterion == "gini" else "entropy"
+        else:
+            self._criterion = "squared_error"
+
+        if isinstance(self.min_samples_leaf, numbers.Integral):
+            min_samples_leaf = self.min_samples_leaf
+        else:
+            min_samples_leaf = int(np.ceil(self.min_samples_leaf * n_samples))
+
+        if isinstance(self.min_samples_split, numbers.Integral):
+            min_samples_split = self.min_samples_split
+        else:
+            min_samples_split = int(np.ceil(
+                self.min_samples_split * n_samples))
+            min_samples_split = max(2, min_samples_split)
+
+        min_samples_split = max(min_samples_split, 2 * min_samples_leaf)
+
+        if self.max_depth is None:
+            max_depth = np.iinfo(np.int32).max
+        else:
+            max_depth = self.max_depth
+
+        if self.max_leaf_nodes is None:
+            max_split_nodes = len(values)
+        else:
+            max_split_nodes = self.max_leaf_nodes - 1
+
+        lower, upper, counts, stats = _group_values(
+            np.asarray(values), np.asarray(counts, dtype=np.int64),
+            np.asarray(stats, dtype=np.float64))
+
+        self._lower = lower
+        self._upper = upper
+        self._c_counts = np.concatenate(([0], np.cumsum(counts)))
+        self._c_stats = np.vstack((np.zeros(stats.shape[1]),
+                                   np.cumsum(stats, axis=0)))
+
+        weighted_n_samples = self._weighted_n(0, len(lower))
+        self._weighted_n_samples = weighted_n_samples
+        self._min_samples_leaf = min_samples_leaf
+        self._min_weight_leaf = (self.min_weight_fraction_leaf *
+                                 weighted_n_samples)
+
+        self._max_depth = max_depth
+        self._min_samples_split = min_samples_split
+
+        # Best-first expansion: nodes are popped from a max-heap on the
+        # impurity improvement. Leaves are pushed with zero improvement, as
+        # in sklearn.tree, since they take part in the heap layout that
+        # breaks ties between nodes with the same improvement.
+        frontier = []
+        splits = []
+
+        _push_frontier(frontier, self._split_node(0, len(lower), 0, None))
+
+        while frontier and max_split_nodes > 0:
+            node = _pop_frontier(frontier)
+
+            if node[1] is None:
+                continue
+
+            (_, start, pos, end, depth, impurity_left,
+             impurity_right) = node
+
+            max_split_nodes -= 1
+            splits.append(self._threshold(pos))
+
+            _push_frontier(frontier, self._split_node(
+                start, pos, depth + 1, impurity_left))
+            _push_frontier(frontier, self._split_node(
+                pos, end, depth + 1, impurity_right))
+
+        self._splits = np.unique(splits)
+
+        return self
+
+    def _split_node(self, start, end, depth, impurity):
+        # Frontier record with the best split of a node or a leaf record
+        n_node_samples = self._c_counts[end] - self._c_counts[start]
+
+        if (depth >= self._max_depth or
+                n_node_samples < self._min_samples_split or
+                self._weighted_n(start, end) < 2 * self._min_weight_leaf):
+            return _LEAF
+
+        if impurity is None:
+            impurity = self._impurity(self._node_stats(start, end))
+
+        if impurity <= EPSILON:
+            return _LEAF
+
+        split = self._best_split(start, end, impurity)
+
+        if split is None:
+            return _LEAF
+
+        pos, improvement, impurity_left, impurity_right = split
+
+        if improvement + EPSILON < self.min_impurity_decrease:
+            return _LEAF
+
+        return (improvement, start, pos, end, depth, impurity_left,
+                impurity_right)
+
+    def _weighted_n(self, start, end):
+        node_stats = self._node_stats(start, end)
+
+        if self._criterion == "squared_error":
+            return node_stats[0]
+
+        return node_stats.sum()
+
+    def _node_stats(self, start, end):
+        return self._c_stats[end] - self._c_stats[start]
+
+    def _impurity(self, node_stats):
+        # node_stats: shape (..., n_stats)
+        if self._criterion == "squared_error":
+            w = node_stats[..., 0]
+            mean = node_stats[..., 1] / w
+            return node_stats[..., 2] / w - mean * mean
+
+        w = node_stats.sum(axis=-1)
+
+        if self._criterion == "gini":
+            return 1.0 - (node_stats * node_stats).sum(axis=-1) / (w * w)
+
+        p = node_stats / w[..., np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_p = np.where(p > 0, np.log(p), 0)
+
+        return -(p * log_p).sum(axis=-1) / np.log(2.0)
+
+    def _best_split(self, start, end, impurity):
+        # Candidate positions are the group boundaries strictly inside the
+        # node satisfying the min_samples_leaf and min_weight_leaf
+        # constraints.
+        pos = np.arange(start + 1, end)
+
+        if not len(pos):
+            return None
+
+        c_counts = self._c_counts
+        n_left = c_counts[pos] - c_counts[start]
+        n_right = c_counts[end] - c_counts[pos]
+
+        total = self._c_stats[end] - self._c_stats[start]
+        left = self._c_stats[pos] - self._c_stats[start]
+        right = total - left
+
+        if self._criterion == "squared_error":
+            w_left = left[:, 0]
+            w_right = right[:, 0]
+        else:
+            w_left = left.sum(axis=1)
+            w_right = right.sum(axis=1)
+
+        valid = ((n_left >= self._min_samples_leaf) &
+                 (n_right >= self._min_samples_leaf) &
+                 (w_left >= self._min_weight_leaf) &
+                 (w_right >= self._min_weight_leaf))
+
+        if not np.any(valid):
+            return None
+
+        pos = pos[valid]
+        left = left[valid]
+        right = right[valid]
+        w_left = w_left[valid]
+        w_right = w_right[valid]
+
+        if self._criterion == "squared_error":
+            proxy = (left[:, 1] * left[:, 1] / w_left +
+                     right[:, 1] * right[:, 1] / w_right)
+        else:
+            proxy = (-w_right * self._impurity(right) -
+                     w_left * self._impurity(left))
+
+        # First maximum, i.e., the lowest threshold on ties
+        best = np.argmax(proxy)
+
+        impurity_left = self._impurity(left[best])
+        impurity_right = self._impurity(right[best])
+
+        w_node = w_left[best] + w_right[best]
+        improvement = (w_node / self._weighted_n_samples) * (
+            impurity - w_right[best] / w_node * impurity_right -
+            w_left[best] / w_node * impurity_left)
+
+        return pos[best], improvement, impurity_left, impurity_right
+
+    def _threshold(self, pos):
+        threshold = self._upper[pos - 1] / 2.0 + self._lower[pos] / 2.0
+
+        if threshold == self._lower[pos] or np.isinf(threshold):
+            threshold = self._upper[pos - 1]
+
+        return threshold
+
+    @property
+    def splits(self):
+        """List of split points
+
+        Returns
+        -------
+        splits : numpy.ndarray
+        """
+        return self._splits
@@ -0,0 +1,196 @@
+"""
+Cache of presorted numerical columns.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numpy as np
+import pandas as pd
+
+from .histogram import binary_histogram
+
+
+def _input_array(array):
+    # Array holding the memory of the input. Inputs converted to a new array
+    # on each call, such as lists, are not cached: the memory of the
+    # temporary array is freed and reused.
+    if isinstance(array, pd.Series):
+        array = array.values
+
+    if isinstance(array, np.ndarray):
+        return array
+
+
+def _array_key(array):
+    # Identity of the memory of an array: address, shape, strides and dtype
+    if array is None:
+        return None
+
+    interface = array.__array_interface__
+
+    return (interface["data"][0], array.shape, interface["strides"],
+            array.dtype.str)
+
+
+def _params_key(dtype, special_codes, class_weight):
+    if special_codes is not None:
+        special_codes = tuple(np.asarray(special_codes).ravel().tolist())
+
+    return dtype, special_codes, repr(class_weight)
+
+
+class PresortedColumn:
+    """Presorted clean values of a numerical column and their target.
+
+    Parameters
+    ----------
+    x : array-like, shape = (n_samples,)
+        Clean data samples.
+
+    y : array-like, shape = (n_samples,)
+        Binary target vector relative to x.
+
+    sample_weight : array-like, shape = (n_samples,) or None (default=None)
+        Sample weights. If None or empty, each sample is given unit weight.
+
+    Attributes
+    ----------
+    order : numpy.ndarray, shape = (n_samples,)
+        Indices that sort x, as returned by ``numpy.argsort``.
+
+    x_sorted : numpy.ndarray, shape = (n_samples,)
+        Sorted data samples.
+
+    y_sorted : numpy.ndarray, shape = (n_samples,)
+        Target vector relative to x_sorted.
+
+    values : numpy.ndarray, shape = (n_unique,)
+        Sorted unique values.
+
+    counts : numpy.ndarray, shape = (n_unique,)
+        Number of samples of each unique value.
+
+    n_nonevent : numpy.ndarray, shape = (n_unique,)
+        Weighted number of non-events of each unique value.
+
+    n_event : numpy.ndarray, shape = (n_unique,)
+        Weighted number of events of each unique value.
+    """
+    def __init__(self, x, y, sample_weight=None):
+        x = np.asarray(x)
+        y = np.asarray(y)
+
+        self.order = np.argsort(x)
+        self.x_sorted = x[self.order]
+        self.y_sorted = y[self.order]
+
+        if sample_weight is not None and len(sample_weight):
+            sw_sorted = np.asarray(sample_weight)[self.order]
+        else:
+            sw_sorted = None
+
+        # Run-length encoding of the sorted values
+        n_samples = len(self.x_sorted)
+        starts = np.flatnonzero(np.concatenate(
+            ([n_samples > 0], self.x_sorted[1:] != self.x_sorted[:-1])))
+
+        self.values = self.x_sorted[starts]
+        self.counts = np.diff(np.append(starts, n_samples))
+
+        unique_indices = np.repeat(np.arange(len(starts)), self.counts)
+        self.n_nonevent, self.n_event = binary_histogram(
+            unique_indices, len(starts), self.y_sorted, sw_sorted)
+
+    def histogram(self, indices, n_bins):
+        """Weighted number of non-events and events per bin, given the bin
+        index of each unique value.
+
+        Parameters
+        ----------
+        indices : array-like, shape = (n_unique,)
+            Bin index of each unique value.
+
+        n_bins : int
+            The number of bins.
+
+        Returns
+        -------
+        n_nonevent : numpy.ndarray, shape = (n_bins,)
+
+        n_event : numpy.ndarray, shape = (n_bins,)
+        """
+        n_nonevent = np.bincount(indices, weights=self.n_nonevent,
+                                 minlength=n_bins)[:n_bins]
+        n_event = np.bincount(indices, weights=self.n_event,
+                              minlength=n_bins)[:n_bins]
+
+        return (n_nonevent.astype(self.n_nonevent.dtype),
+                n_event.astype(self.n_event.dtype))
+
+
+class ColumnCache:
+    """Cache of presorted numerical columns shared across fits.
+
+    The first fit of a numerical variable with binary target sorts its
+    clean values and stores the sorted order, the unique values with their
+    number of samples and the weighted number of events and non-events of
+    each unique value. Further fits of the same column reuse them, thus
+    prebinning and prebinning refinement work on the unique values instead
+    of the samples. This is useful to refit a binning process with
+    different constraints.
+
+    Columns are identified by the memory of the input arrays ``x``, ``y``
+    and ``sample_weight``, together with the options that determine the
+    clean values. Only numpy arrays and pandas Series backed by numpy arrays
+    are cached, other inputs are presorted on each fit. The cache keeps a
+    reference to the input arrays, so their memory cannot be reused by other
+    arrays. Arrays modified in place after
+    being cached must be removed from the cache using :meth:`clear`.
+
+    .. versionadded:: 0.7.1
+
+    Example
+    -------
+    >>> from optbinning import BinningProcess
+    >>> from optbinning import ColumnCache
+    >>> cache = ColumnCache()
+    >>> binning_process = BinningProcess(variable_names)
+    >>> binning_process.fit(X, y, column_cache=cache)
+    >>> binning_process.set_params(max_n_bins=5)
+    >>> binning_process.fit(X, y, column_cache=cache)
+    """
+    def __init__(self):
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._columns)
+
+    def clear(self):
+        """Remove all cached columns."""
+        self._columns.clear()
+
+    def _get(self, x, y, sample_weight, dtype, special_codes, class_weight,
+             x_clean, y_clean, sw_clean):
+        arrays = []
+        for array in (x, y, sample_weight):
+            if array is not None:
+                array = _input_array(array)
+
+                if array is None:
+                    return PresortedColumn(x_clean, y_clean, sw_clean)
+
+            arrays.append(array)
+
+        key = tuple(_array_key(array) for array in arrays) + (
+            _params_key(dtype, special_codes, class_weight),)
+
+        entry = self._columns.get(key)
+
+        if entry is None:
+            column = PresortedColumn(x_clean, y_clean, sw_clean)
+            self._columns[key] = (arrays, column)
+        else:
+            _, column = entry
+
+        return column
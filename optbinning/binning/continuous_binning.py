@@ -20,7 +20,9 @@ from .auto_monotonic import peak_valley_trend_change_heuristic
 from .binning import OptimalBinning
 from .binning_statistics import continuous_bin_info
 from .binning_statistics import ContinuousBinningTable
-from .continuous_cp import ContinuousBinningCP
+from .histogram import bin_indices
+from .histogram import continuous_histogram
+from .solution_cache import SolutionCache
 from .transformations import transform_continuous_target
 
 
@@ -29,7 +31,8 @@ def _check_parameters(name, dtype, prebinning_method, max_n_prebins,
                       max_bin_size, monotonic_trend, min_mean_diff, max_pvalue,
                       max_pvalue_policy, outlier_detector, outlier_params,
                       cat_cutoff, user_splits, user_splits_fixed,
-                      special_codes, split_digits, time_limit, verbose):
+                      special_codes, split_digits, time_limit,
+                      solution_cache, verbose):
 
     if not isinstance(name, str):
         raise TypeError("name must be a string.")
@@ -157,6 +160,11 @@ def _check_parameters(name, dtype, prebinning_method, max_n_prebins,
         raise ValueError("time_limit must be a positive value in seconds; "
                          "got {}.".format(time_limit))
 
+    if solution_cache is not None and not isinstance(solution_cache,
+                                                     SolutionCache):
+        raise TypeError("solution_cache must be a SolutionCache instance or "
+                        "None.")
+
     if not isinstance(verbose, bool):
         raise TypeError("verbose must be a boolean; got {}.".format(verbose))
 
@@ -265,6 +273,13 @@ class ContinuousOptimalBinning(OptimalBinning):
     time_limit : int (default=100)
         The maximum time in seconds to run the optimization solver.
 
+    solution_cache : SolutionCache or None (default=None)
+        Cache of optimal solutions. If the prebinning statistics and the
+        optimizer parameters match a cached solution, the optimization model
+        is neither built nor solved. See :class:`SolutionCache`.
+
+        .. versionadded:: 0.7.1
+
     verbose : bool (default=False)
         Enable verbose output.
 
@@ -293,7 +308,8 @@ class ContinuousOptimalBinning(OptimalBinning):
                  max_pvalue_policy="consecutive", outlier_detector=None,
                  outlier_params=None, cat_cutoff=None, user_splits=None,
                  user_splits_fixed=None, special_codes=None, split_digits=None,
-                 time_limit=100, verbose=False, **prebinning_kwargs):
+                 time_limit=100, solution_cache=None, verbose=False,
+                 **prebinning_kwargs):
 
         self.name = name
         self.dtype = dtype
@@ -325,6 +341,7 @@ class ContinuousOptimalBinning(OptimalBinning):
 
         self.time_limit = time_limit
 
+        self.solution_cache = solution_cache
         self.verbose = verbose
         self.prebinning_kwargs = prebinning_kwargs
 
@@ -357,16 +374,21 @@ class ContinuousOptimalBinning(OptimalBinning):
         self._binning_table = None
         self._n_prebins = None
         self._n_refinements = 0
+        self._presorted = None
         self._n_samples = None
         self._optimizer = None
+        self._solver_type = None
         self._splits_optimal = None
         self._status = None
+        self._transform_plan = None
 
         # timing
         self._time_total = None
         self._time_preprocessing = None
         self._time_prebinning = None
         self._time_solver = None
+        self._time_model_generation = None
+        self._time_optimizer = None
         self._time_postprocessing = None
 
         # logger
@@ -492,11 +514,14 @@ class ContinuousOptimalBinning(OptimalBinning):
                                            self._categories, self._cat_others,
                                            metric, metric_special,
                                            metric_missing, self.user_splits,
-                                           show_digits, check_input)
+                                           show_digits, check_input,
+                                           self._get_transform_plan())
 
     def _fit(self, x, y, check_input):
         time_init = time.perf_counter()
 
+        self._transform_plan = None
+
         if self.verbose:
             self._logger.info("Optimal binning started.")
             self._logger.info("Options: check parameters.")
@@ -742,6 +767,8 @@ class ContinuousOptimalBinning(OptimalBinning):
                 self._logger.info("Optimizer: monotonic trend set to "
                                   "{}.".format(monotonic))
 
+        from .continuous_cp import ContinuousBinningCP
+
         optimizer = ContinuousBinningCP(monotonic, self.min_n_bins,
                                         self.max_n_bins, min_bin_size,
                                         max_bin_size, self.min_mean_diff,
@@ -750,19 +777,13 @@ class ContinuousOptimalBinning(OptimalBinning):
                                         self.user_splits_fixed,
                                         self.time_limit)
 
-        if self.verbose:
-            self._logger.info("Optimizer: build model...")
-
-        optimizer.build_model(n_records, sums, stds, trend_change)
-
-        if self.verbose:
-            self._logger.info("Optimizer: solve...")
-
-        status, solution = optimizer.solve()
+        optimizer, status, solution = self._solve(
+            optimizer, n_records, sums, stds, trend_change)
 
         self._solution = solution
 
         self._optimizer = optimizer
+        self._solver_type = self.solver
         self._status = status
 
         if self.dtype == "categorical" and self.user_splits is not None:
@@ -789,10 +810,10 @@ class ContinuousOptimalBinning(OptimalBinning):
             splits_prebinning = np.round(splits_prebinning, self.split_digits)
 
         if self.dtype == "categorical" and self.user_splits is not None:
-            indices = np.digitize(x, splits_prebinning, right=True)
+            indices = bin_indices(x, splits_prebinning, right=True)
             n_bins = n_splits
         else:
-            indices = np.digitize(x, splits_prebinning, right=False)
+            indices = bin_indices(x, splits_prebinning, right=False)
             n_bins = n_splits + 1
 
         # Compute n_records, sum and std for special, missing and others
@@ -817,24 +838,15 @@ class ContinuousOptimalBinning(OptimalBinning):
             self._max_target_others = np.max(y_others)
             self._n_zeros_others = np.count_nonzero(y_others == 0)
 
-        n_records = np.empty(n_bins).astype(np.int64)
-        sums = np.empty(n_bins)
-        stds = np.empty(n_bins)
-        n_zeros = np.empty(n_bins).astype(np.int64)
-        min_t = np.full(n_bins, -np.inf)
-        max_t = np.full(n_bins, np.inf)
-
         # Compute prebin information
-        for i in range(n_bins):
-            mask = (indices == i)
-            n_records[i] = np.count_nonzero(mask)
-            ymask = y[mask]
-            sums[i] = np.sum(ymask)
-            stds[i] = np.std(ymask)
-            n_zeros[i] = np.count_nonzero(ymask == 0)
-            if len(ymask):
-                min_t[i] = np.min(ymask)
-                max_t[i] = np.max(ymask)
+        if self.dtype == "categorical" and self.user_splits is not None:
+            # Discard records beyond the last user split.
+            mask = indices < n_bins
+            indices = indices[mask]
+            y = y[mask]
+
+        [n_records, sums, stds, min_t, max_t,
+         n_zeros] = continuous_histogram(indices, n_bins, y)
 
         return splits_prebinning, n_records, sums, stds, min_t, max_t, n_zeros
 
@@ -6,8 +6,6 @@ problem. Constraint programming implementation.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
-from ortools.sat.python import cp_model
-
 from .cp import BinningCP
 from .model_data import continuous_model_data
 
@@ -37,6 +35,8 @@ class ContinuousBinningCP(BinningCP):
         self._x = None
 
     def build_model(self, n_records, sums, stds, trend_change):
+        from ortools.sat.python import cp_model
+
         # Parameters
         M = int(1e6)
         U, V, pvalue_violation_indices = continuous_model_data(
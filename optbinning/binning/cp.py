@@ -8,12 +8,128 @@ Constraint programming implementation.
 
 import numpy as np
 
-from ortools.sat.python import cp_model
-
 from .model_data import model_data
 from .model_data import multiclass_model_data
 
 
+def bin_coefficients(D):
+    """Coefficients of the linear expression of a bin statistic.
+
+    Given the lower triangular matrix ``D``, where ``D[i, k]`` is the
+    statistic of the bin containing prebins ``k, ..., i``, return ``C`` such
+    that ``sum(C[i, j] * x[i, j] for j <= i)`` equals ``D[i, k]`` if prebins
+    ``k, ..., i`` are merged into a bin, and zero if prebin ``i`` is not the
+    end of a bin.
+
+    Parameters
+    ----------
+    D : array-like, shape = (n, n)
+
+    Returns
+    -------
+    C : numpy.ndarray, shape = (n, n)
+    """
+    D = np.tril(D)
+
+    C = D.copy()
+    C[:, :-1] -= D[:, 1:]
+
+    return C
+
+
+def _row_variables(n, x):
+    return [[x[i, j] for j in range(i + 1)] for i in range(n)]
+
+
+def _row_terms(rows, C, offset=0):
+    # Variables, non-zero coefficients and variable indices of the
+    # expression sum(C[i, j] * x[i, j]) + offset * x[i, i] for each row i.
+    C = np.array(C, dtype=np.int64)
+    C[np.diag_indices_from(C)] += offset
+
+    terms = []
+    for i, row in enumerate(rows):
+        coeffs = C[i, :i + 1]
+        nonzero = np.flatnonzero(coeffs)
+        variables = [row[j] for j in nonzero]
+        terms.append((variables, coeffs[nonzero].tolist(),
+                      [v.Index() for v in variables]))
+
+    return terms
+
+
+def _weighted_sum(variables, coefficients):
+    # LinearExpr.WeightedSum replaces LinearExpr.ScalProd since OR-Tools 9.3
+    from ortools.sat.python import cp_model
+
+    if hasattr(cp_model.LinearExpr, "WeightedSum"):
+        return cp_model.LinearExpr.WeightedSum(variables, coefficients)
+
+    return cp_model.LinearExpr.ScalProd(variables, coefficients)
+
+
+def _proto_linear_constraints():
+    # Whether linear constraints can be written directly to the model proto.
+    # The protobuf layout of CpModel.Proto() is only relied upon for
+    # OR-Tools 9.3 to 9.7, other versions use the public API.
+    import ortools
+
+    version = tuple(int(v) for v in ortools.__version__.split(".")[:2])
+
+    return (9, 3) <= version < (9, 8)
+
+
+def _add_linear_constraint(model, terms, lb, ub=None):
+    # lb <= sum of terms <= ub
+    from ortools.sat.python import cp_model
+
+    if ub is None:
+        ub = cp_model.INT_MAX
+
+    variables = []
+    coefficients = []
+    for v, c in terms:
+        variables += v
+        coefficients += c
+
+    model.AddLinearConstraint(_weighted_sum(variables, coefficients), lb, ub)
+
+
+def _add_row_constraint(model, terms, lb, proto):
+    # sum of terms >= lb, where terms are lists of distinct variables,
+    # integer coefficients and variable indices. If proto, the constraint
+    # is written directly to the model proto: validating and flattening
+    # linear expressions term by term dominates the build time of the
+    # O(n^2) and O(n^3) monotonicity constraints.
+    if not proto:
+        _add_linear_constraint(model, [(v, c) for v, c, _ in terms], lb)
+        return
+
+    from ortools.sat.python import cp_model
+
+    linear = model.Proto().constraints.add().linear
+    for _, coefficients, indices in terms:
+        linear.vars.extend(indices)
+        linear.coeffs.extend(coefficients)
+    linear.domain.extend([lb, cp_model.INT_MAX])
+
+
+def _fixed_bin_ends(D, start, stop, sign):
+    # Preprocessing of monotonic trends: bin ends that cannot satisfy the
+    # trend when min_event_rate_diff = 0. Duplicates are removed.
+    D = np.asarray(D)
+
+    fixed = []
+    for i in range(start, stop - 1):
+        if sign * (D[i+1, i] - D[i+1, i+1]) > 0:
+            fixed.append(i)
+            for j in range(start, stop - i - 1):
+                if sign * (D[i+1+j, i] - D[i+1+j, i+1+j]) > 0:
+                    fixed.append(i + j)
+
+    return list(dict.fromkeys(fixed))
+
+
 class BinningCP:
     def __init__(self, monotonic_trend, min_n_bins, max_n_bins, min_bin_size,
                  max_bin_size, min_bin_n_event, max_bin_n_event,
@@ -46,7 +162,19 @@ class BinningCP:
         self._n = None
         self._x = None
 
+    def __getstate__(self):
+        # Solver and model objects cannot be pickled, for instance, when
+        # returning fitted binnings from worker processes.
+        state = self.__dict__.copy()
+        state["solver_"] = None
+        state["_model"] = None
+        state["_x"] = None
+
+        return state
+
     def build_model(self, divergence, n_nonevent, n_event, trend_change):
+        from ortools.sat.python import cp_model
+
         # Parameters
         M = int(1e6)
         D, V, pvalue_violation_indices = model_data(divergence, n_nonevent,
@@ -63,20 +191,18 @@ class BinningCP:
         x, y, t, d, u, bin_size_diff = self.decision_variables(model, n)
 
         # Objective function
+        variables, coefficients = self.objective_terms(n, x, [V])
+
         if self.gamma:
             total_records = int(n_records.sum())
             regularization = int(np.ceil(M * self.gamma / total_records))
             pmax = model.NewIntVar(0, total_records, "pmax")
             pmin = model.NewIntVar(0, total_records, "pmin")
 
-            model.Maximize(sum([(V[i][i] * x[i, i]) +
-                           sum([(V[i][j] - V[i][j+1]) * x[i, j]
-                                for j in range(i)]) for i in range(n)]) -
-                           regularization * (pmax - pmin))
-        else:
-            model.Maximize(sum([(V[i][i] * x[i, i]) +
-                           sum([(V[i][j] - V[i][j+1]) * x[i, j]
-                                for j in range(i)]) for i in range(n)]))
+            variables += [pmax, pmin]
+            coefficients += [-regularization, regularization]
+
+        model.Maximize(_weighted_sum(variables, coefficients))
 
         # Constraint: unique assignment
         self.add_constraint_unique_assignment(model, n, x)
@@ -92,29 +218,14 @@ class BinningCP:
                                              bin_size_diff)
 
         # Constraint: min / max n_nonevent per bin
-        if (self.min_bin_n_nonevent is not None or
-                self.max_bin_n_nonevent is not None):
-            for i in range(n):
-                bin_ne_size = sum([n_nonevent[j] * x[i, j]
-                                   for j in range(i + 1)])
-
-                if self.min_bin_n_nonevent is not None:
-                    model.Add(bin_ne_size >= self.min_bin_n_nonevent * x[i, i])
-
-                if self.max_bin_n_nonevent is not None:
-                    model.Add(bin_ne_size <= self.max_bin_n_nonevent * x[i, i])
+        self.add_constraint_min_max_bin_count(model, n, x, n_nonevent,
+                                              self.min_bin_n_nonevent,
+                                              self.max_bin_n_nonevent)
 
         # Constraint: min / max n_event per bin
-        if (self.min_bin_n_event is not None or
-                self.max_bin_n_event is not None):
-            for i in range(n):
-                bin_e_size = sum([n_event[j] * x[i, j] for j in range(i + 1)])
-
-                if self.min_bin_n_event is not None:
-                    model.Add(bin_e_size >= self.min_bin_n_event * x[i, i])
-
-                if self.max_bin_n_event is not None:
-                    model.Add(bin_e_size <= self.max_bin_n_event * x[i, i])
+        self.add_constraint_min_max_bin_count(model, n, x, n_event,
+                                              self.min_bin_n_event,
+                                              self.max_bin_n_event)
 
         # Constraints: monotonicity
         if self.monotonic_trend == "ascending":
@@ -149,11 +260,20 @@ class BinningCP:
 
         # Constraint: reduction of dominating bins
         if self.gamma:
+            rows = _row_variables(n, x)
             for i in range(n):
-                bin_size = sum([n_records[j] * x[i, j] for j in range(i + 1)])
-
-                model.Add(pmin <= total_records * (1 - x[i, i]) + bin_size)
-                model.Add(pmax >= bin_size)
+                bin_size = n_records[:i + 1].tolist()
+
+                # pmin <= total_records * (1 - x[i, i]) + bin_size
+                coefficients = bin_size[:-1] + [bin_size[-1] - total_records]
+                _add_linear_constraint(model, [([pmin], [-1]),
+                                               (rows[i], coefficients)],
+                                       -total_records)
+
+                # pmax >= bin_size
+                _add_linear_constraint(model, [([pmax], [1]),
+                                               (rows[i], [-c for c in
+                                                          bin_size])], 0)
             model.Add(pmin <= pmax)
 
         # Constraint: max-pvalue
@@ -167,6 +287,8 @@ class BinningCP:
         self._n = n
 
     def build_model_scenarios(self, n_nonevent, n_event, w):
+        from ortools.sat.python import cp_model
+
         # Parameters
         M = int(1e6)
         D, V, pvalue_violation_indices = multiclass_model_data(
@@ -187,10 +309,7 @@ class BinningCP:
         x, y, t, d = self.decision_variables_scenarios(model, n)
 
         # Objective function
-        model.Maximize(sum([w[s] * sum([(V[s][i][i] * x[i, i]) +
-                            sum([(V[s][i][j] - V[s][i][j+1]) * x[i, j]
-                                 for j in range(i)]) for i in range(n)])
-                            for s in range(n_scenarios)]))
+        model.Maximize(_weighted_sum(*self.objective_terms(n, x, V, w)))
 
         # Constraint: unique assignment
         self.add_constraint_unique_assignment(model, n, x)
@@ -247,7 +366,39 @@ class BinningCP:
         self._x = x
         self._n = n
 
+    def objective_terms(self, n, x, V, weights=None):
+        """Variables and coefficients of the objective function
+        ``sum_s w_s sum_i (V_s[i, i] x[i, i] + sum_{j < i} (V_s[i, j] -
+        V_s[i, j+1]) x[i, j])``, with zero coefficients removed."""
+        if weights is None:
+            weights = np.ones(len(V), dtype=np.int64)
+
+        C = sum(int(w) * bin_coefficients(Vs) for w, Vs in zip(weights, V))
+        rows, cols = np.tril_indices(n)
+        coefficients = C[rows, cols]
+        nonzero = np.flatnonzero(coefficients)
+
+        variables = [x[rows[k], cols[k]] for k in nonzero]
+
+        return variables, coefficients[nonzero].tolist()
+
+    def add_hint(self, solution):
+        """Warm-start the solver from a previous solution with the same
+        number of prebins. Prebin j is assigned to the bin ending at the first
+        i >= j with ``solution[i] = True``."""
+        if len(solution) != self._n or not solution[-1]:
+            return
+
+        ends = np.flatnonzero(solution)
+        bin_end = ends[np.searchsorted(ends, np.arange(self._n))]
+
+        for i in range(self._n):
+            for j in range(i + 1):
+                self._model.AddHint(self._x[i, j], int(bin_end[j] == i))
+
     def solve(self):
+        from ortools.sat.python import cp_model
+
         self.solver_ = cp_model.CpSolver()
         self.solver_.parameters.max_time_in_seconds = self.time_limit
 
@@ -256,9 +407,9 @@ class BinningCP:
 
         if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             solution = np.array([self.solver_.BooleanValue(self._x[i, i])
-                                 for i in range(self._n)]).astype(np.bool)
+                                 for i in range(self._n)]).astype(bool)
         else:
-            solution = np.zeros(self._n).astype(np.bool)
+            solution = np.zeros(self._n).astype(bool)
             solution[-1] = True
 
         return status_name, solution
@@ -328,17 +479,22 @@ class BinningCP:
         return x, y, t, d
 
     def add_constraint_unique_assignment(self, model, n, x):
+        from ortools.sat.python import cp_model
+
         for j in range(n):
-            model.Add(sum([x[i, j] for i in range(j, n)]) == 1)
+            model.Add(cp_model.LinearExpr.Sum(
+                [x[i, j] for i in range(j, n)]) == 1)
 
     def add_constraint_continuity(self, model, n, x):
         for i in range(n):
             for j in range(i):
-                model.Add(x[i, j] - x[i, j+1] <= 0)
+                model.Add(x[i, j] <= x[i, j+1])
 
     def add_constraint_min_max_bins(self, model, n, x, d):
+        from ortools.sat.python import cp_model
+
         if self.min_n_bins is not None or self.max_n_bins is not None:
-            trace = sum([x[i, i] for i in range(n)])
+            trace = cp_model.LinearExpr.Sum([x[i, i] for i in range(n)])
 
             if self.min_n_bins is not None and self.max_n_bins is not None:
                 model.Add(d + trace - self.max_n_bins == 0)
@@ -349,224 +505,177 @@ class BinningCP:
 
     def add_constraint_min_max_bin_size(self, model, n, x, u, n_records,
                                         bin_size_diff):
-        if self.min_bin_size is not None or self.max_bin_size is not None:
+        if self.min_bin_size is None and self.max_bin_size is None:
+            return
+
+        if self.min_bin_size is not None and self.max_bin_size is not None:
+            rows = _row_variables(n, x)
             for i in range(n):
-                bin_size = sum([n_records[j] * x[i, j] for j in range(i + 1)])
-
-                if (self.min_bin_size is not None and
-                        self.max_bin_size is not None):
-                    model.Add(u[i] + bin_size -
-                              self.max_bin_size * x[i, i] == 0)
-                    model.Add(u[i] <= bin_size_diff * x[i, i])
-                elif self.min_bin_size is not None:
-                    model.Add(bin_size >= self.min_bin_size * x[i, i])
-                elif self.max_bin_size is not None:
-                    model.Add(bin_size <= self.max_bin_size * x[i, i])
+                bin_size = n_records[:i + 1].tolist()
+
+                # u[i] + bin_size - max_bin_size * x[i, i] == 0
+                coefficients = bin_size[:-1] + [
+                    bin_size[-1] - self.max_bin_size]
+                _add_linear_constraint(model, [([u[i]], [1]),
+                                               (rows[i], coefficients)],
+                                       0, 0)
+
+                model.Add(u[i] <= bin_size_diff * x[i, i])
+        else:
+            self.add_constraint_min_max_bin_count(
+                model, n, x, n_records, self.min_bin_size, self.max_bin_size)
+
+    def add_constraint_min_max_bin_count(self, model, n, x, count, min_count,
+                                         max_count):
+        # min_count * x[i, i] <= sum_j count[j] * x[i, j] <= max_count *
+        # x[i, i]
+        if min_count is None and max_count is None:
+            return
+
+        rows = _row_variables(n, x)
+        for i in range(n):
+            bin_count = count[:i + 1].tolist()
+
+            if min_count is not None:
+                coefficients = bin_count[:-1] + [bin_count[-1] - min_count]
+                _add_linear_constraint(model, [(rows[i], coefficients)], 0)
+
+            if max_count is not None:
+                coefficients = [-c for c in bin_count[:-1]] + [
+                    max_count - bin_count[-1]]
+                _add_linear_constraint(model, [(rows[i], coefficients)], 0)
 
     def add_constraint_min_max_bin_size_scenarios(self, model, n, x,
                                                   n_records):
         if self.min_bin_size is not None or self.max_bin_size is not None:
             n_scenarios = n_records.shape[1]
             for s in range(n_scenarios):
-                for i in range(n):
-                    bin_size = sum([n_records[j, s] * x[i, j]
-                                    for j in range(i + 1)])
+                min_bin_size = None
+                max_bin_size = None
 
-                    if self.min_bin_size is not None:
-                        model.Add(bin_size >= self.min_bin_size[s] * x[i, i])
-                    if self.max_bin_size is not None:
-                        model.Add(bin_size <= self.max_bin_size[s] * x[i, i])
+                if self.min_bin_size is not None:
+                    min_bin_size = self.min_bin_size[s]
+                if self.max_bin_size is not None:
+                    max_bin_size = self.max_bin_size[s]
 
-    def add_constraint_monotonic_ascending(self, model, n, D, x, M):
-        min_event_rate_diff = int(M * self.min_event_rate_diff)
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    D[z][z] * x[z, z] - M - (D[i][i] - M) * x[i, i] -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
+                self.add_constraint_min_max_bin_count(
+                    model, n, x, n_records[:, s], min_bin_size, max_bin_size)
 
-        # Preprocessing
-        if self.min_event_rate_diff == 0:
-            for i in range(n - 1):
-                if D[i+1][i] - D[i+1][i+1] > 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(n - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] > 0:
-                            model.Add(x[i+j, i+j] == 0)
+    def add_constraint_monotonic_ascending(self, model, n, D, x, M):
+        self._add_constraint_monotonic(model, n, D, x, M, 0, n, 1)
 
     def add_constraint_monotonic_descending(self, model, n, D, x, M):
-        min_event_rate_diff = int(M * self.min_event_rate_diff)
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) + D[i][i] * x[i, i] -
-                    M - (D[z][z] - M) * x[z, z] -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
-
-        # Preprocessing
-        if self.min_event_rate_diff == 0:
-            for i in range(n - 1):
-                if D[i+1][i] - D[i+1][i+1] < 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(n - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] < 0:
-                            model.Add(x[i+j, i+j] == 0)
+        self._add_constraint_monotonic(model, n, D, x, M, 0, n, -1)
 
     def add_constraint_monotonic_concave(self, model, n, D, x, M):
-        for i in range(2, n):
-            for j in range(1, i):
-                for k in range(j):
-                    model.Add(
-                        -(sum([(D[i][z] - D[i][z+1]) * x[i, z]
-                               for z in range(i)]) + D[i][i] * x[i, i]) +
-                        2 * (sum([(D[j][z] - D[j][z+1]) * x[j, z]
-                                  for z in range(j)]) + D[j][j] * x[j, j]) -
-                        (sum([(D[k][z] - D[k][z+1]) * x[k, z]
-                              for z in range(k)]) + D[k][k] * x[k, k]) >=
-                        M * (x[i, i] + x[j, j] + x[k, k] - 3))
+        self._add_constraint_monotonic_curvature(model, n, D, x, M, -1)
 
     def add_constraint_monotonic_convex(self, model, n, D, x, M):
-        for i in range(2, n):
-            for j in range(1, i):
-                for k in range(j):
-                    model.Add(
-                        (sum([(D[i][z] - D[i][z+1]) * x[i, z]
-                              for z in range(i)]) + D[i][i] * x[i, i]) -
-                        2 * (sum([(D[j][z] - D[j][z+1]) * x[j, z]
-                                  for z in range(j)]) + D[j][j] * x[j, j]) +
-                        (sum([(D[k][z] - D[k][z+1]) * x[k, z]
-                              for z in range(k)]) + D[k][k] * x[k, k]) >=
-                        M * (x[i, i] + x[j, j] + x[k, k] - 3))
+        self._add_constraint_monotonic_curvature(model, n, D, x, M, 1)
 
     def add_constraint_monotonic_peak(self, model, n, D, x, y, M):
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    M * (y[i] + y[z]) + M + (D[z][z] - M) * x[z, z] +
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    D[i][i] * x[i, i] >= 0)
-
-                model.Add(
-                    M * (2 - y[i] - y[z]) + M + (D[i][i] - M) * x[i, i] +
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    D[z][z] * x[z, z] >= 0)
+        self._add_constraint_monotonic_change(model, n, D, x, y, M, True)
 
     def add_constraint_monotonic_valley(self, model, n, D, x, y, M):
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    M * (y[i] + y[z]) + M + (D[i][i] - M) * x[i, i] +
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    D[z][z] * x[z, z] >= 0)
-
-                model.Add(
-                    M * (2 - y[i] - y[z]) + M + (D[z][z] - M) * x[z, z] +
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    D[i][i] * x[i, i] >= 0)
+        self._add_constraint_monotonic_change(model, n, D, x, y, M, False)
 
     def add_constraint_monotonic_peak_heuristic(self, model, n, D, x, tc, M):
+        self._add_constraint_monotonic(model, n, D, x, M, 0, tc, 1)
+        self._add_constraint_monotonic(model, n, D, x, M, tc, n, -1)
+
+    def add_constraint_monotonic_valley_heuristic(self, model, n, D, x, tc, M):
+        self._add_constraint_monotonic(model, n, D, x, M, 0, tc, -1)
+        self._add_constraint_monotonic(model, n, D, x, M, tc, n, 1)
+
+    def _add_constraint_monotonic(self, model, n, D, x, M, start, stop,
+                                  sign):
+        # Ascending (sign=1) or descending (sign=-1) trend between the bins
+        # ending at z < i, with z, i in [start, stop). Big-M formulation:
+        # for ascending, D_z - D_i + min_event_rate_diff <= 0 if
+        # x[z, z] = x[i, i] = 1.
         min_event_rate_diff = int(M * self.min_event_rate_diff)
-        for i in range(1, tc):
-            for z in range(i):
-                model.Add(
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    D[z][z] * x[z, z] - M - (D[i][i] - M) * x[i, i] -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
 
-        # Preprocessing
-        if self.min_event_rate_diff == 0:
-            for i in range(tc - 1):
-                if D[i+1][i] - D[i+1][i+1] > 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(tc - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] > 0:
-                            model.Add(x[i+j, i+j] == 0)
-
-        for i in range(tc, n):
-            for z in range(tc, i):
-                model.Add(
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) + D[i][i] * x[i, i] -
-                    M - (D[z][z] - M) * x[z, z] -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
+        C = bin_coefficients(D)
+        rows = _row_variables(n, x)
+        lower = _row_terms(rows, -C, -min_event_rate_diff)
+        upper = _row_terms(rows, C, -M - min_event_rate_diff)
+        proto = _proto_linear_constraints()
 
         # Preprocessing
+        fixed = []
         if self.min_event_rate_diff == 0:
-            for i in range(tc, n - 1):
-                if D[i+1][i] - D[i+1][i+1] < 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(tc, n - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] < 0:
-                            model.Add(x[i+j, i+j] == 0)
+            fixed = _fixed_bin_ends(D, start, stop, sign)
+            for i in fixed:
+                model.Add(x[i, i] == 0)
+
+        # Constraints involving a bin end fixed to zero are redundant if
+        # 0 <= D <= M.
+        if np.all((D >= 0) & (D <= M)):
+            redundant = set(fixed)
+        else:
+            redundant = set()
+
+        for i in range(start + 1, stop):
+            if i in redundant:
+                continue
+
+            for z in range(start, i):
+                if z in redundant:
+                    continue
+
+                if sign == 1:
+                    terms = [lower[z], upper[i]]
+                else:
+                    terms = [lower[i], upper[z]]
+
+                _add_row_constraint(model, terms, -M - min_event_rate_diff,
+                                    proto)
+
+    def _add_constraint_monotonic_curvature(self, model, n, D, x, M, sign):
+        # Convex (sign=1) or concave (sign=-1) trend between the bins ending
+        # at k < j < i: for convex, D_i - 2 D_j + D_k >= 0 if
+        # x[k, k] = x[j, j] = x[i, i] = 1.
+        C = bin_coefficients(D)
+        rows = _row_variables(n, x)
+        outer = _row_terms(rows, sign * C, -M)
+        inner = _row_terms(rows, -2 * sign * C, -M)
+        proto = _proto_linear_constraints()
 
-    def add_constraint_monotonic_valley_heuristic(self, model, n, D, x, tc, M):
-        min_event_rate_diff = int(M * self.min_event_rate_diff)
-        for i in range(1, tc):
+        for i in range(2, n):
+            for j in range(1, i):
+                for k in range(j):
+                    _add_row_constraint(
+                        model, [outer[i], inner[j], outer[k]], -3 * M, proto)
+
+    def _add_constraint_monotonic_change(self, model, n, D, x, y, M, peak):
+        # Peak or valley trend: y[i] indicates whether the bin ending at i
+        # is after the change point t.
+        C = bin_coefficients(D)
+        rows = _row_variables(n, x)
+        lower = _row_terms(rows, -C)
+        upper = _row_terms(rows, C, -M)
+        proto = _proto_linear_constraints()
+
+        for i in range(1, n):
             for z in range(i):
-                model.Add(
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) + D[i][i] * x[i, i] -
-                    M - (D[z][z] - M) * x[z, z] -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
+                if peak:
+                    first, second = (upper[z], lower[i]), (upper[i], lower[z])
+                else:
+                    first, second = (upper[i], lower[z]), (upper[z], lower[i])
 
-        # Preprocessing
-        if self.min_event_rate_diff == 0:
-            for i in range(tc - 1):
-                if D[i+1][i] - D[i+1][i+1] < 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(tc - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] < 0:
-                            model.Add(x[i+j, i+j] == 0)
-
-        for i in range(tc, n):
-            for z in range(tc, i):
-                model.Add(
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) +
-                    D[z][z] * x[z, z] - M - (D[i][i] - M) * x[i, i] -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) +
-                    min_event_rate_diff * (x[i, i] + x[z, z] - 1) <= 0)
+                y_iz = [y[i], y[z]]
+                y_index = [y[i].Index(), y[z].Index()]
 
-        # Preprocessing
-        if self.min_event_rate_diff == 0:
-            for i in range(tc, n - 1):
-                if D[i+1][i] - D[i+1][i+1] > 0:
-                    model.Add(x[i, i] == 0)
-                    for j in range(tc, n - i - 1):
-                        if D[i+1+j][i] - D[i+1+j][i+1+j] > 0:
-                            model.Add(x[i+j, i+j] == 0)
+                _add_row_constraint(
+                    model, [(y_iz, [M, M], y_index), *first], -M, proto)
+
+                _add_row_constraint(
+                    model, [(y_iz, [-M, -M], y_index), *second], -3 * M,
+                    proto)
 
     def add_max_pvalue_constraint(self, model, x, pvalue_violation_indices):
-        for ind1, ind2 in pvalue_violation_indices:
-            model.AddImplication(x[ind1[0], ind1[1]],
-                                 x[ind2[0], ind2[1]].Not())
+        for i, r, j, k in pvalue_violation_indices.tolist():
+            model.AddImplication(x[i, r], x[j, k].Not())
 
     def add_constraint_fixed_splits(self, model, n, x):
         if self.user_splits_fixed is not None:
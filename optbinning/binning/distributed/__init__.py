@@ -1,10 +1,19 @@
-from .gk import GK
-from .bsketch import BSketch
-from .bsketch import BCatSketch
-from .binning_sketch import OptimalBinningSketch
+from ..._lazy import lazy_attributes
 
 
-__all__ = ['BSketch',
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'BinningProcessSketch': '.binning_process_sketch',
+    'BSketch': '.bsketch',
+    'BCatSketch': '.bsketch',
+    'GK': '.gk',
+    'OptimalBinningSketch': '.binning_sketch',
+    'merge_all': '.merge'
+})
+
+
+__all__ = ['BinningProcessSketch',
+           'BSketch',
            'BCatSketch',
            'GK',
-           'OptimalBinningSketch']
+           'OptimalBinningSketch',
+           'merge_all']
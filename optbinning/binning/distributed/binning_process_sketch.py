@@ -0,0 +1,389 @@
+"""
+Binning process sketch.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import copy
+import numbers
+import time
+
+import numpy as np
+import pandas as pd
+
+from sklearn.base import BaseEstimator
+from sklearn.utils import check_array
+from sklearn.utils import check_consistent_length
+
+from ...logging import Logger
+from ..binning_process import _check_parameters as _check_bp_parameters
+from ..binning_process import _check_selection_criteria
+from ..binning_process import _check_variable_dtype
+from ..binning_process import _sketch_variable
+from ..binning_process import BinningProcess
+from .bsketch import BSketch
+
+
+def _equal_special_codes(special_codes, other):
+    if special_codes is None or other is None:
+        return special_codes is None and other is None
+
+    return list(special_codes) == list(other)
+
+
+def _check_parameters(variable_names, max_n_prebins, min_n_bins, max_n_bins,
+                      min_bin_size, max_pvalue, max_pvalue_policy,
+                      selection_criteria, categorical_variables,
+                      special_codes, split_digits, binning_fit_params,
+                      binning_transform_params, sketch, eps, verbose):
+
+    _check_bp_parameters(variable_names, max_n_prebins, 0.05, min_n_bins,
+                         max_n_bins, min_bin_size, None, max_pvalue,
+                         max_pvalue_policy, selection_criteria,
+                         categorical_variables, special_codes, split_digits,
+                         binning_fit_params, binning_transform_params, None,
+                         None, verbose)
+
+    if sketch not in ("gk", "t-digest"):
+        raise ValueError('Invalid value for sketch. Allowed string '
+                         'values are "gk" and "t-digest".')
+
+    if not isinstance(eps, numbers.Number) or not 0 <= eps <= 1:
+        raise ValueError("eps must be a value in [0, 1]; got {}."
+                         .format(eps))
+
+    if selection_criteria is not None:
+        _check_selection_criteria(selection_criteria, "binary")
+
+
+class BinningProcessSketch(BaseEstimator):
+    """Binning process over data streams of a dataset with respect to a
+    binary target.
+
+    Each batch of data updates the binning sketches of all variables (see
+    :class:`OptimalBinningSketch`). Missing values, special codes and
+    targets of numerical variables are processed for all columns at once.
+    Method ``solve`` returns a fitted :class:`BinningProcess`, supporting
+    transform, summary and variable selection.
+
+    .. versionadded:: 0.7.1
+
+    Parameters
+    ----------
+    variable_names : array-like
+        List of variable names.
+
+    max_n_prebins : int (default=20)
+        The maximum number of bins after pre-binning (prebins).
+
+    min_n_bins : int or None, optional (default=None)
+        The minimum number of bins. If None, then ``min_n_bins`` is
+        a value in ``[0, max_n_prebins]``.
+
+    max_n_bins : int or None, optional (default=None)
+        The maximum number of bins. If None, then ``max_n_bins`` is
+        a value in ``[0, max_n_prebins]``.
+
+    min_bin_size : float or None, optional (default=None)
+        The fraction of minimum number of records for each bin. If None,
+        ``min_bin_size = min_prebin_size``.
+
+    max_pvalue : float or None, optional (default=0.05)
+        The maximum p-value among bins. The Z-test is used to detect bins
+        not satisfying the p-value constraint.
+
+    max_pvalue_policy : str, optional (default="consecutive")
+        The method to determine bins not satisfying the p-value constraint.
+        Supported methods are "consecutive" to compare consecutive bins and
+        "all" to compare all bins.
+
+    selection_criteria : dict or None (default=None)
+        Variable selection criteria. See notes in :class:`BinningProcess`.
+
+    categorical_variables : array-like or None, optional (default=None)
+        List of variables numerical variables to be considered categorical.
+        These are nominal variables. Not applicable when target type is
+        multiclass.
+
+    special_codes : array-like or None, optional (default=None)
+        List of special codes. Use special codes to specify the data values
+        that must be treated separately.
+
+    split_digits : int or None, optional (default=None)
+        The significant digits of the split points. If ``split_digits`` is set
+        to 0, the split points are integers. If None, then all significant
+        digits in the split points are considered.
+
+    binning_fit_params : dict or None, optional (default=None)
+        Dictionary with optimal binning sketch options for specific
+        variables. Example: ``{"variable_1": {"max_n_bins": 4}}``.
+
+    binning_transform_params : dict or None, optional (default=None)
+        Dictionary with optimal binning transform options for specific
+        variables. Example ``{"variable_1": {"metric": "event_rate"}}``.
+
+    sketch : str, optional (default="gk")
+        Sketch algorithm. Supported algorithms are "gk" (Greenwald-Khanna's)
+        and "t-digest" (Ted Dunning) algorithm.
+
+    eps : float, optional (default=1e-4)
+        Relative error epsilon of the quantile sketch.
+
+    verbose : bool (default=False)
+        Enable verbose output.
+    """
+    def __init__(self, variable_names, max_n_prebins=20, min_n_bins=None,
+                 max_n_bins=None, min_bin_size=None, max_pvalue=None,
+                 max_pvalue_policy="consecutive", selection_criteria=None,
+                 categorical_variables=None, special_codes=None,
+                 split_digits=None, binning_fit_params=None,
+                 binning_transform_params=None, sketch="gk", eps=1e-4,
+                 verbose=False):
+
+        self.variable_names = variable_names
+
+        self.max_n_prebins = max_n_prebins
+        self.min_n_bins = min_n_bins
+        self.max_n_bins = max_n_bins
+        self.min_bin_size = min_bin_size
+        self.max_pvalue = max_pvalue
+        self.max_pvalue_policy = max_pvalue_policy
+
+        self.selection_criteria = selection_criteria
+
+        self.binning_fit_params = binning_fit_params
+        self.binning_transform_params = binning_transform_params
+
+        self.special_codes = special_codes
+        self.split_digits = split_digits
+        self.categorical_variables = categorical_variables
+
+        self.sketch = sketch
+        self.eps = eps
+
+        self.verbose = verbose
+
+        # auxiliary
+        self._n_samples = 0
+        self._n_add = 0
+        self._sketches = None
+
+        # timing
+        self._time_streaming_add = 0
+
+        # logger
+        self._class_logger = Logger(__name__)
+        self._logger = self._class_logger.logger
+
+        # Check parameters
+        _check_parameters(**self.get_params())
+
+    def add(self, X, y, check_input=False):
+        """Add new data X, y to the binning sketches of all variables.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Training vector, where n_samples is the number of samples.
+
+        y : array-like of shape (n_samples,)
+            Target vector relative to x.
+
+        check_input : bool (default=False)
+            Whether to check input arrays.
+
+        Returns
+        -------
+        self : object
+        """
+        time_add = time.perf_counter()
+
+        if not isinstance(X, (pd.DataFrame, np.ndarray)):
+            raise TypeError("X must be a pandas.DataFrame or numpy.ndarray.")
+
+        if check_input:
+            X = check_array(X, ensure_2d=False, dtype=None,
+                            force_all_finite='allow-nan')
+
+            y = check_array(y, ensure_2d=False, dtype=None,
+                            force_all_finite=True)
+
+            check_consistent_length(X, y)
+
+        if X.shape[1] != len(self.variable_names):
+            raise ValueError("X must have {} columns; got {}."
+                             .format(len(self.variable_names), X.shape[1]))
+
+        columns = {}
+        for i, name in enumerate(self.variable_names):
+            if isinstance(X, np.ndarray):
+                columns[name] = X[:, i]
+            else:
+                columns[name] = X[name].values
+
+        if self._sketches is None:
+            self._sketches = {
+                name: _sketch_variable(
+                    name, _check_variable_dtype(x),
+                    self.categorical_variables, self.binning_fit_params,
+                    self.sketch, self.eps, self.max_n_prebins,
+                    self.min_n_bins, self.max_n_bins, self.min_bin_size,
+                    self.max_pvalue, self.max_pvalue_policy,
+                    self.special_codes, self.split_digits)
+                for name, x in columns.items()}
+
+        # Numerical variables sharing the process special codes are added
+        # in a single pass, remaining variables are added one by one.
+        block_names = []
+        for name, x in columns.items():
+            optb = self._sketches[name]
+
+            if (optb.dtype == "numerical" and x.dtype.kind in "biuf" and
+                    _equal_special_codes(optb.special_codes,
+                                         self.special_codes)):
+                block_names.append(name)
+            else:
+                optb.add(x, y)
+
+        if block_names:
+            self._add_block([columns[name] for name in block_names],
+                            block_names, y)
+
+        self._n_samples += len(y)
+        self._n_add += 1
+
+        self._time_streaming_add += time.perf_counter() - time_add
+
+        if self.verbose:
+            self._logger.info("Sketch: added new data.")
+
+        return self
+
+    def merge(self, bpsketch):
+        """Merge current instance with another BinningProcessSketch instance.
+
+        Parameters
+        ----------
+        bpsketch : object
+            BinningProcessSketch instance.
+        """
+        if not self.mergeable(bpsketch):
+            raise Exception("bpsketch does not share signature.")
+
+        if bpsketch._sketches is None:
+            return
+
+        if self._sketches is None:
+            self._sketches = copy.deepcopy(bpsketch._sketches)
+        else:
+            for name, optb in self._sketches.items():
+                other = bpsketch._sketches[name]
+
+                if other._bsketch is None:
+                    continue
+                elif optb._bsketch is None:
+                    optb._bsketch = copy.deepcopy(other._bsketch)
+                else:
+                    optb._bsketch.merge(other._bsketch)
+
+                optb._n_add += other._n_add
+
+        self._n_samples += bpsketch._n_samples
+        self._n_add += bpsketch._n_add
+
+        if self.verbose:
+            self._logger.info("Sketch: current sketch was merged.")
+
+    def mergeable(self, bpsketch):
+        """Check whether two BinningProcessSketch instances can be merged.
+
+        Parameters
+        ----------
+        bpsketch : object
+            BinningProcessSketch instance.
+
+        Returns
+        -------
+        mergeable : bool
+        """
+        return self.get_params() == bpsketch.get_params()
+
+    def solve(self):
+        """Solve the optimal binning of all variables using added data.
+
+        Returns
+        -------
+        binning_process : BinningProcess
+            Fitted binning process. The binned variables are fitted
+            :class:`OptimalBinningSketch` instances.
+        """
+        if self._sketches is None:
+            raise ValueError("No data was added. Call 'add' before 'solve'.")
+
+        time_init = time.perf_counter()
+
+        binning_process = BinningProcess(
+            variable_names=self.variable_names,
+            max_n_prebins=self.max_n_prebins, min_n_bins=self.min_n_bins,
+            max_n_bins=self.max_n_bins, min_bin_size=self.min_bin_size,
+            max_pvalue=self.max_pvalue,
+            max_pvalue_policy=self.max_pvalue_policy,
+            selection_criteria=self.selection_criteria,
+            categorical_variables=self.categorical_variables,
+            special_codes=self.special_codes,
+            split_digits=self.split_digits,
+            binning_fit_params=self.binning_fit_params,
+            binning_transform_params=self.binning_transform_params,
+            verbose=self.verbose)
+
+        binning_process._target_dtype = "binary"
+        binning_process._n_samples = self._n_samples
+        binning_process._n_variables = len(self.variable_names)
+
+        # Further calls to add do not modify the fitted binning process
+        sketches = copy.deepcopy(self._sketches)
+
+        return binning_process._fit_sketches(sketches, time_init)
+
+    def _add_block(self, columns, names, y):
+        # Split data of all columns at once: missing, special and clean values
+        # by target class.
+        X = np.empty((len(y), len(columns)), order="F")
+        for j, x in enumerate(columns):
+            X[:, j] = x
+
+        y = np.asarray(y)
+
+        mask_e = (y == 1)[:, None]
+
+        missing_mask = np.isnan(X)
+        if y.dtype.kind == "f":
+            missing_mask |= np.isnan(y)[:, None]
+
+        if self.special_codes is not None:
+            special_mask = np.isin(X, self.special_codes)
+        else:
+            special_mask = np.zeros(X.shape, dtype=bool)
+
+        clean_mask = ~missing_mask & ~special_mask
+        clean_e = clean_mask & mask_e
+        clean_ne = clean_mask & ~mask_e
+
+        missing_e = np.count_nonzero(missing_mask & mask_e, axis=0)
+        missing_ne = np.count_nonzero(missing_mask & (y == 0)[:, None], axis=0)
+        special_e = np.count_nonzero(special_mask & mask_e, axis=0)
+        special_ne = np.count_nonzero(special_mask & (y == 0)[:, None], axis=0)
+
+        for j, name in enumerate(names):
+            optb = self._sketches[name]
+
+            if optb._bsketch is None:
+                optb._bsketch = BSketch(optb.sketch, optb.eps, optb.K,
+                                        optb.special_codes)
+
+            x = X[:, j]
+            optb._bsketch._add_split(x[clean_e[:, j]], x[clean_ne[:, j]],
+                                     missing_e[j], missing_ne[j],
+                                     special_e[j], special_ne[j])
+            optb._n_add += 1
@@ -20,14 +20,15 @@ from ...binning.auto_monotonic import peak_valley_trend_change_heuristic
 from ...binning.binning_statistics import bin_categorical
 from ...binning.binning_statistics import bin_info
 from ...binning.binning_statistics import BinningTable
-from ...binning.cp import BinningCP
-from ...binning.mip import BinningMIP
+from ...binning.histogram import merge_histogram
 from ...binning.transformations import transform_binary_target
+from ...binning.transformations import TransformPlan
 from ...logging import Logger
 from .bsketch_information import print_binning_information
-from .plots import plot_progress_divergence
 
 from .bsketch import BSketch, BCatSketch
+from .serialization import pack
+from .serialization import unpack
 
 
 def _check_parameters(name, dtype, sketch, eps, K, solver, divergence,
@@ -406,14 +407,25 @@ class OptimalBinningSketch(BaseEstimator):
         self._n_event_special = None
         self._n_nonevent_cat_others = None
         self._n_event_cat_others = None
+        self._solution = None
 
         # data storage
         self._bsketch = None
+        self._prebin_counts = None
+
+        # incremental solve
+        self._cache_params = None
+        self._cache_sketch = None
+        self._cache_sketch_n = None
+        self._cache_splits = None
+        self._cache_prebins = None
+        self._cache_optimizer = None
 
         # info
         self._binning_table = None
         self._n_refinements = 0
         self._n_prebins = None
+        self._transform_plan = None
 
         # streaming stats
         self._n_add = 0
@@ -470,6 +482,9 @@ class OptimalBinningSketch(BaseEstimator):
         self._bsketch.add(x, y, check_input)
         self._n_add += 1
 
+        # Exact prebin counts do not include the new data
+        self._prebin_counts = None
+
         self._time_streaming_add += time.perf_counter() - time_add
 
         if self.verbose:
@@ -527,6 +542,7 @@ class OptimalBinningSketch(BaseEstimator):
             raise Exception("optbsketch does not share signature.")
 
         self._bsketch.merge(optbsketch._bsketch)
+        self._prebin_counts = None
 
         if self.verbose:
             self._logger.info("Sketch: current sketch was merged.")
@@ -549,12 +565,24 @@ class OptimalBinningSketch(BaseEstimator):
         """Plot divergence measure progress."""
         self._check_is_fitted()
 
+        from .plots import plot_progress_divergence
+
         df = pd.DataFrame.from_dict(self._solve_stats).T
         plot_progress_divergence(df, self.divergence)
 
-    def solve(self):
+    def solve(self, incremental=False):
         """Solve optimal binning using added data.
 
+        Parameters
+        ----------
+        incremental : bool (default=False)
+            Whether to reuse the results of the previous call to ``solve``.
+            The merged sketch is reused if no data was added, and the previous
+            pre-binning split points and their counts are kept while they
+            remain ``eps``-approximate quantiles. The optimizer is not run if
+            the prebin counts did not change, otherwise the constraint
+            programming solver is warm-started from the previous solution.
+
         Returns
         -------
         self : object
@@ -562,13 +590,26 @@ class OptimalBinningSketch(BaseEstimator):
         """
         time_init = time.perf_counter()
 
+        self._transform_plan = None
+
+        # Discard cached results if parameters changed
+        params = self.get_params()
+        if not incremental or self._cache_params != params:
+            self._cache_sketch = None
+            self._cache_sketch_n = None
+            self._cache_splits = None
+            self._cache_prebins = None
+            self._cache_optimizer = None
+
+        self._cache_params = params
+
         # Pre-binning
         if self.verbose:
             self._logger.info("Pre-binning started.")
 
         time_prebinning = time.perf_counter()
 
-        splits, n_nonevent, n_event = self._prebinning_data()
+        splits, n_nonevent, n_event = self._prebinning_data(incremental)
         self._n_prebins = len(splits) + 1
 
         self._time_prebinning = time.perf_counter() - time_prebinning
@@ -583,7 +624,7 @@ class OptimalBinningSketch(BaseEstimator):
                               .format(self._time_prebinning))
 
         # Optimization
-        self._fit_optimizer(splits, n_nonevent, n_event)
+        self._fit_optimizer(splits, n_nonevent, n_event, incremental)
 
         # Post-processing
         if self.verbose:
@@ -627,6 +668,58 @@ class OptimalBinningSketch(BaseEstimator):
 
         return self
 
+    def to_bytes(self):
+        """Serialize the options and the added data to a compact and
+        versioned binary format.
+
+        The optimal binning is not serialized, call ``solve`` after loading.
+
+        .. versionadded:: 0.7.1
+
+        Returns
+        -------
+        data : bytes
+        """
+        arrays = {}
+        if self._bsketch is not None:
+            arrays["bsketch"] = np.frombuffer(self._bsketch.to_bytes(),
+                                              dtype=np.uint8)
+
+        metadata = {"params": self.get_params(), "n_add": self._n_add}
+
+        return pack("OptimalBinningSketch", metadata, arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load an optimal binning sketch from bytes generated by
+        :meth:`to_bytes`.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized optimal binning sketch.
+
+        Returns
+        -------
+        optbsketch : OptimalBinningSketch
+        """
+        metadata, arrays = unpack(data, "OptimalBinningSketch")
+
+        optbsketch = cls(**metadata["params"])
+        optbsketch._n_add = metadata["n_add"]
+
+        if "bsketch" in arrays:
+            if optbsketch.dtype == "numerical":
+                bsketch_class = BSketch
+            else:
+                bsketch_class = BCatSketch
+
+            optbsketch._bsketch = bsketch_class.from_bytes(arrays["bsketch"])
+
+        return optbsketch
+
     def transform(self, x, metric="woe", metric_special=0,
                   metric_missing=0, show_digits=2, check_input=False):
         """Transform given data to Weight of Evidence (WoE) or event rate using
@@ -678,9 +771,10 @@ class OptimalBinningSketch(BaseEstimator):
                                        self.special_codes, self._categories,
                                        self._cat_others, metric,
                                        metric_special, metric_missing,
-                                       None, show_digits, check_input)
+                                       None, show_digits, check_input,
+                                       self._get_transform_plan())
 
-    def _prebinning_data(self):
+    def _prebinning_data(self, incremental=False):
         self._n_nonevent_missing = self._bsketch._count_missing_ne
         self._n_nonevent_special = self._bsketch._count_special_ne
         self._n_event_missing = self._bsketch._count_missing_e
@@ -690,20 +784,9 @@ class OptimalBinningSketch(BaseEstimator):
         self._t_n_event = self._bsketch.n_event
 
         if self.dtype == "numerical":
-            sketch_all = self._bsketch.merge_sketches()
-
-            if self.sketch == "gk":
-                percentiles = np.linspace(0, 1, self.max_n_prebins + 1)
-
-                splits = np.array([sketch_all.quantile(p)
-                                   for p in percentiles[1:-1]])
-            elif self.sketch == "t-digest":
-                percentiles = np.linspace(0, 100, self.max_n_prebins + 1)
-
-                splits = np.array([sketch_all.percentile(p)
-                                   for p in percentiles[1:-1]])
-
-            splits, n_nonevent, n_event = self._compute_prebins(splits)
+            splits = self._prebinning_splits(incremental)
+            splits, n_nonevent, n_event = self._compute_prebins(
+                splits, incremental)
         else:
             [splits, categories, n_nonevent, n_event, cat_others,
              n_nonevent_others, n_event_others] = self._bsketch.bins()
@@ -721,10 +804,71 @@ class OptimalBinningSketch(BaseEstimator):
 
         return splits, n_nonevent, n_event
 
-    def _compute_prebins(self, splits):
+    def _prebinning_splits(self, incremental=False):
+        sketch_n = (self._bsketch._sketch_e.n, self._bsketch._sketch_ne.n)
+
+        if incremental and self._cache_sketch_n == sketch_n:
+            sketch_all = self._cache_sketch
+        else:
+            sketch_all = self._bsketch.merge_sketches()
+
+        if self.sketch == "gk":
+            quantile = sketch_all.quantile
+        elif self.sketch == "t-digest":
+            def quantile(p):
+                return sketch_all.percentile(100 * p)
+
+        percentiles = np.linspace(0, 1, self.max_n_prebins + 1)[1:-1]
+
+        splits = np.array([quantile(p) for p in percentiles])
+
+        if incremental:
+            self._cache_sketch = sketch_all
+            self._cache_sketch_n = sketch_n
+
+            # Keep previous split points if they are eps-approximate
+            # quantiles of the current data.
+            cache_splits = self._cache_splits
+
+            if cache_splits is not None and len(cache_splits) == len(splits):
+                lower = np.array([quantile(max(p - self.eps, 0))
+                                  for p in percentiles])
+                upper = np.array([quantile(min(p + self.eps, 1))
+                                  for p in percentiles])
+
+                if np.all((lower <= cache_splits) & (cache_splits <= upper)):
+                    splits = cache_splits
+
+                    if self.verbose:
+                        self._logger.info("Pre-binning: reuse previous split "
+                                          "points.")
+
+            self._cache_splits = splits
+
+        return splits
+
+    def _compute_prebins(self, splits, incremental=False):
         self._n_refinements = 0
 
-        n_event, n_nonevent = self._bsketch.bins(splits)
+        # Exact prebin counts computed outside the sketch, if available
+        # for the current split points.
+        if (self._prebin_counts is not None and
+                np.array_equal(self._prebin_counts[0], splits)):
+            n_nonevent, n_event = self._prebin_counts[1:]
+        elif (incremental and self._cache_prebins is not None and
+                self._cache_prebins[0] is splits and
+                self._cache_prebins[1] == self._bsketch.n):
+            n_nonevent, n_event = self._cache_prebins[2:]
+        else:
+            n_event, n_nonevent = self._bsketch.bins(splits)
+
+        if incremental:
+            self._cache_prebins = (splits, self._bsketch.n, n_nonevent,
+                                   n_event)
+
+        return self._refine_prebins(splits, n_nonevent, n_event)
+
+    def _refine_prebins(self, splits, n_nonevent, n_event):
         mask_remove = (n_nonevent == 0) | (n_event == 0)
 
         if np.any(mask_remove):
@@ -737,7 +881,15 @@ class OptimalBinningSketch(BaseEstimator):
                     [mask_remove[:-2], [mask_remove[-2] | mask_remove[-1]]])
 
                 splits = splits[~mask_splits]
-                splits, n_nonevent, n_event = self._compute_prebins(splits)
+
+                # Merge counts of removed prebins instead of recomputing.
+                n_bins = len(splits) + 1
+                n_nonevent = merge_histogram(n_nonevent, mask_splits, n_bins)
+                n_event = merge_histogram(n_event, mask_splits, n_bins)
+
+                if len(splits):
+                    splits, n_nonevent, n_event = self._refine_prebins(
+                        splits, n_nonevent, n_event)
 
         return splits, n_nonevent, n_event
 
@@ -786,12 +938,35 @@ class OptimalBinningSketch(BaseEstimator):
 
         return splits, categories, n_nonevent, n_event
 
-    def _fit_optimizer(self, splits, n_nonevent, n_event):
+    def _fit_optimizer(self, splits, n_nonevent, n_event, incremental=False):
         if self.verbose:
             self._logger.info("Optimizer started.")
 
         time_init = time.perf_counter()
 
+        # Reuse previous solution if the problem data did not change
+        if incremental and self._cache_optimizer is not None:
+            cache_splits, cache_n, cache_n_nonevent, cache_n_event = (
+                self._cache_optimizer)
+
+            if (cache_n == self._bsketch.n and
+                    np.array_equal(cache_splits, splits) and
+                    np.array_equal(cache_n_nonevent, n_nonevent) and
+                    np.array_equal(cache_n_event, n_event)):
+
+                self._time_solver = time.perf_counter() - time_init
+
+                if self.verbose:
+                    self._logger.info("Optimizer: prebin counts did not "
+                                      "change, reuse previous solution.")
+                    self._logger.info("Optimizer terminated. Time: {:.4f}s"
+                                      .format(self._time_solver))
+                return
+
+        if incremental:
+            self._cache_optimizer = (splits, self._bsketch.n, n_nonevent,
+                                     n_event)
+
         if not len(n_nonevent):
             self._status = "OPTIMAL"
             self._splits_optimal = splits
@@ -880,6 +1055,8 @@ class OptimalBinningSketch(BaseEstimator):
                                   "{}.".format(monotonic))
 
         if self.solver == "cp":
+            from ...binning.cp import BinningCP
+
             optimizer = BinningCP(monotonic, self.min_n_bins, self.max_n_bins,
                                   min_bin_size, max_bin_size,
                                   min_bin_n_event, self.max_bin_n_event,
@@ -888,6 +1065,8 @@ class OptimalBinningSketch(BaseEstimator):
                                   self.max_pvalue_policy, self.gamma,
                                   None, self.time_limit)
         elif self.solver == "mip":
+            from ...binning.mip import BinningMIP
+
             optimizer = BinningMIP(monotonic, self.min_n_bins, self.max_n_bins,
                                    min_bin_size, max_bin_size,
                                    min_bin_n_event, self.max_bin_n_event,
@@ -902,6 +1081,14 @@ class OptimalBinningSketch(BaseEstimator):
         optimizer.build_model(self.divergence, n_nonevent, n_event,
                               trend_change)
 
+        if (incremental and self.solver == "cp" and
+                self._solution is not None):
+            optimizer.add_hint(self._solution)
+
+            if self.verbose:
+                self._logger.info("Optimizer: warm start from previous "
+                                  "solution.")
+
         if self.verbose:
             self._logger.info("Optimizer: solve...")
 
@@ -938,6 +1125,14 @@ class OptimalBinningSketch(BaseEstimator):
             "divergence".format(self.divergence): dv
         }
 
+    def _get_transform_plan(self):
+        if self._transform_plan is None:
+            self._transform_plan = TransformPlan(
+                self._splits_optimal, self.dtype, self._categories,
+                self._cat_others, None, self.special_codes)
+
+        return self._transform_plan
+
     def _check_is_fitted(self):
         if not self._is_fitted:
             raise NotFittedError("This {} instance is not fitted yet. Call "
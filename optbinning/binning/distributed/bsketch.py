@@ -8,15 +8,23 @@ Binning sketch.
 import numbers
 
 import numpy as np
+import pandas as pd
 
 from ...preprocessing import split_data
 from .gk import GK
+from .serialization import pack
+from .serialization import unpack
 
-try:
-    from tdigest import TDigest
-    TDIGEST_AVAILABLE = True
-except ImportError:
-    TDIGEST_AVAILABLE = False
+
+def _import_tdigest():
+    # tdigest is an optional dependency imported on first use
+    try:
+        from tdigest import TDigest
+    except ImportError:
+        raise ImportError('Cannot import tdigest. Install tdigest via '
+                          'pip install tdigest or choose "gk".')
+
+    return TDigest
 
 
 def _check_parameters(sketch, eps, K, special_codes):
@@ -24,9 +32,8 @@ def _check_parameters(sketch, eps, K, special_codes):
         raise ValueError('Invalid value for sketch. Allowed string '
                          'values are "gk" and "t-digest".')
 
-    if sketch == "t-digest" and not TDIGEST_AVAILABLE:
-        raise ImportError('Cannot import tdigest. Install tdigest via '
-                          'pip install tdigest or choose "gk".')
+    if sketch == "t-digest":
+        _import_tdigest()
 
     if not isinstance(eps, numbers.Number) and not 0 <= eps <= 1:
         raise ValueError("eps must be a value in [0, 1]; got {}."
@@ -78,6 +85,7 @@ class BSketch:
             self._sketch_e = GK(eps)
             self._sketch_ne = GK(eps)
         elif sketch == "t-digest":
+            TDigest = _import_tdigest()
             self._sketch_e = TDigest(eps, K)
             self._sketch_ne = TDigest(eps, K)
 
@@ -99,30 +107,11 @@ class BSketch:
             dtype=None, x=x, y=y, special_codes=self.special_codes,
             check_input=check_input)
 
-        # Add values to sketch
         mask = yc == 1
 
-        if self.sketch == "gk":
-            for v1 in xc[mask]:
-                self._sketch_e.add(v1)
-
-            for v0 in xc[~mask]:
-                self._sketch_ne.add(v0)
-
-        if self.sketch == "t-digest":
-            self._sketch_e.batch_update(xc[mask])
-            self._sketch_ne.batch_update(xc[~mask])
-
-        # Keep track of missing and special counts
-        n_missing = len(ym)
-        if n_missing:
-            self._count_missing_e += np.count_nonzero(ym == 1)
-            self._count_missing_ne += np.count_nonzero(ym == 0)
-
-        n_special = len(ys)
-        if n_special:
-            self._count_special_e += np.count_nonzero(ys == 1)
-            self._count_special_ne += np.count_nonzero(ys == 0)
+        self._add_split(xc[mask], xc[~mask], np.count_nonzero(ym == 1),
+                        np.count_nonzero(ym == 0), np.count_nonzero(ys == 1),
+                        np.count_nonzero(ys == 0))
 
     def bins(self, splits):
         """Event and non-events counts for each bin given a list of split
@@ -138,15 +127,14 @@ class BSketch:
         bins : tuple of arrays of size n_splits + 1.
         """
         n_bins = len(splits) + 1
-        bins_e = np.zeros(n_bins).astype(np.int64)
-        bins_ne = np.zeros(n_bins).astype(np.int64)
 
         indices_e, count_e = self._indices_count(self._sketch_e, splits)
         indices_ne, count_ne = self._indices_count(self._sketch_ne, splits)
 
-        for i in range(n_bins):
-            bins_e[i] = count_e[(indices_e == i)].sum()
-            bins_ne[i] = count_ne[(indices_ne == i)].sum()
+        bins_e = np.bincount(indices_e, weights=count_e,
+                             minlength=n_bins).astype(np.int64)
+        bins_ne = np.bincount(indices_ne, weights=count_ne,
+                              minlength=n_bins).astype(np.int64)
 
         return bins_e, bins_ne
 
@@ -194,6 +182,75 @@ class BSketch:
 
         return new_sketch
 
+    def to_bytes(self):
+        """Serialize the sketch to a compact and versioned binary format.
+
+        Returns
+        -------
+        data : bytes
+        """
+        metadata = {"sketch": self.sketch, "eps": self.eps, "K": self.K,
+                    "special_codes": self.special_codes,
+                    "count_missing_e": self._count_missing_e,
+                    "count_missing_ne": self._count_missing_ne,
+                    "count_special_e": self._count_special_e,
+                    "count_special_ne": self._count_special_ne}
+
+        if self.sketch == "gk":
+            metadata["e"], arrays = self._sketch_e._get_state("e_")
+            metadata["ne"], arrays_ne = self._sketch_ne._get_state("ne_")
+            arrays.update(arrays_ne)
+        else:
+            arrays = {}
+            for prefix, sketch in (("e_", self._sketch_e),
+                                   ("ne_", self._sketch_ne)):
+                centroids = [sketch.C.get_value(key)
+                             for key in sketch.C.keys()]
+                arrays[prefix + "mean"] = np.array(
+                    [c.mean for c in centroids], dtype=float)
+                arrays[prefix + "count"] = np.array(
+                    [c.count for c in centroids], dtype=np.int64)
+
+        return pack("BSketch", metadata, arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a sketch from bytes generated by :meth:`to_bytes`.
+
+        GK summaries are loaded as read-only views of data without copying.
+        T-digest sketches are rebuilt from their centroids.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized sketch.
+
+        Returns
+        -------
+        bsketch : BSketch
+        """
+        metadata, arrays = unpack(data, "BSketch")
+
+        bsketch = cls(metadata["sketch"], metadata["eps"], metadata["K"],
+                      metadata["special_codes"])
+
+        bsketch._count_missing_e = metadata["count_missing_e"]
+        bsketch._count_missing_ne = metadata["count_missing_ne"]
+        bsketch._count_special_e = metadata["count_special_e"]
+        bsketch._count_special_ne = metadata["count_special_ne"]
+
+        if bsketch.sketch == "gk":
+            bsketch._sketch_e._set_state(metadata["e"], arrays, "e_")
+            bsketch._sketch_ne._set_state(metadata["ne"], arrays, "ne_")
+        else:
+            for prefix, sketch in (("e_", bsketch._sketch_e),
+                                   ("ne_", bsketch._sketch_ne)):
+                for mean, count in zip(arrays[prefix + "mean"].tolist(),
+                                       arrays[prefix + "count"].tolist()):
+                    sketch.update(mean, count)
+
+        return bsketch
+
     def _copy(self, bsketch):
         self._sketch_e = bsketch._sketch_e
         self._sketch_ne = bsketch._sketch_ne
@@ -204,16 +261,34 @@ class BSketch:
         self._count_special_e = bsketch._count_special_e
         self._count_special_ne = bsketch._count_special_ne
 
-    def _indices_count(self, sketch, splits):
-        values = np.zeros(len(sketch))
-        count = np.zeros(len(sketch))
+    def _add_split(self, x_event, x_nonevent, n_missing_e, n_missing_ne,
+                   n_special_e, n_special_ne):
+        # Add clean event and non-event values to sketch and keep track of
+        # missing and special counts.
+        if self.sketch == "gk":
+            self._sketch_e.add_batch(x_event)
+            self._sketch_ne.add_batch(x_nonevent)
+
+        if self.sketch == "t-digest":
+            self._sketch_e.batch_update(x_event)
+            self._sketch_ne.batch_update(x_nonevent)
 
+        self._count_missing_e += n_missing_e
+        self._count_missing_ne += n_missing_ne
+        self._count_special_e += n_special_e
+        self._count_special_ne += n_special_ne
+
+    def _indices_count(self, sketch, splits):
         if self.sketch == "gk":
-            for i, entry in enumerate(sketch.entries):
-                values[i] = entry.value
-                count[i] = entry.g
+            if sketch._n_incoming:
+                sketch.merge_compress()
+            values = sketch.values
+            count = sketch.g
 
         elif self.sketch == "t-digest":
+            values = np.zeros(len(sketch))
+            count = np.zeros(len(sketch))
+
             for i, key in enumerate(sketch.C.keys()):
                 centroid = sketch.C.get_value(key)
                 values[i] = centroid.mean
@@ -297,7 +372,10 @@ class BCatSketch:
         self._count_special_e = 0
         self._count_special_ne = 0
 
-        self._d_categories = {}
+        # Categories in order of appearance and their counts
+        self._categories = pd.Index([], dtype=object)
+        self._n_nonevent = np.array([], dtype=np.int64)
+        self._n_event = np.array([], dtype=np.int64)
 
     def add(self, x, y, check_input=False):
         """
@@ -319,17 +397,15 @@ class BCatSketch:
             check_input=check_input)
 
         # Add values to sketch
-        for i, c in enumerate(xc):
-            if c in self._d_categories:
-                if yc[i] == 0:
-                    self._d_categories[c][0] += 1
-                else:
-                    self._d_categories[c][1] += 1
-            else:
-                if yc[i] == 0:
-                    self._d_categories[c] = [1, 0]
-                else:
-                    self._d_categories[c] = [0, 1]
+        if len(xc):
+            codes, categories = pd.factorize(xc)
+            n_categories = len(categories)
+            mask = yc == 1
+
+            n_event = np.bincount(codes[mask], minlength=n_categories)
+            n_nonevent = np.bincount(codes[~mask], minlength=n_categories)
+
+            self._add_counts(categories, n_nonevent, n_event)
 
         # Keep track of missing and special counts
         n_missing = len(ym)
@@ -350,32 +426,33 @@ class BCatSketch:
         -------
         bins : tuple of arrays.
         """
-        cat_others = []
-
-        dd = {k: v + [v[0] + v[1], v[1] / (v[0] + v[1])]
-              for k, v in self._d_categories.items()}
+        categories = np.asarray(self._categories, dtype=object)
+        n_nonevent = self._n_nonevent
+        n_event = self._n_event
+        n_records = n_nonevent + n_event
 
         if self.cat_cutoff is not None:
-            bin_e_others = 0
-            bin_ne_others = 0
-            for k, v in dd.items():
-                if v[2] / self.n < self.cat_cutoff:
-                    bin_ne_others += v[0]
-                    bin_e_others += v[1]
-                    cat_others.append(k)
-
-            cat_others = np.array(cat_others, dtype=object)
-
-            dd = {k: v for k, v in sorted(dd.items(), key=lambda v: v[1][3])
-                  if k not in cat_others}
+            mask_others = n_records / self.n < self.cat_cutoff
+
+            cat_others = categories[mask_others]
+            bin_ne_others = n_nonevent[mask_others].sum()
+            bin_e_others = n_event[mask_others].sum()
+
+            categories = categories[~mask_others]
+            n_nonevent = n_nonevent[~mask_others]
+            n_event = n_event[~mask_others]
+            n_records = n_records[~mask_others]
         else:
+            cat_others = []
             bin_e_others = []
             bin_ne_others = []
-            dd = {k: v for k, v in sorted(dd.items(), key=lambda v: v[1][3])}
 
-        categories = np.array(list(dd.keys()), dtype=object)
-        bin_ne = np.array([v[0] for v in dd.values()], dtype=np.int64)
-        bin_e = np.array([v[1] for v in dd.values()], dtype=np.int64)
+        # Stable sort by event rate, ties keep the order of appearance
+        sorted_idx = np.argsort(n_event / n_records, kind="mergesort")
+
+        categories = categories[sorted_idx]
+        bin_ne = n_nonevent[sorted_idx]
+        bin_e = n_event[sorted_idx]
 
         splits = np.array([0.5 + i for i in range(len(categories) - 1)])
 
@@ -392,12 +469,8 @@ class BCatSketch:
         """
 
         # Merge categories
-        for k, v in bcatsketch._d_categories.items():
-            if k in self._d_categories:
-                self._d_categories[k][0] += v[0]
-                self._d_categories[k][1] += v[1]
-            else:
-                self._d_categories[k] = v
+        self._add_counts(bcatsketch._categories, bcatsketch._n_nonevent,
+                         bcatsketch._n_event)
 
         # Merge missing and special counts
         self._count_missing_e += bcatsketch._count_missing_e
@@ -405,8 +478,91 @@ class BCatSketch:
         self._count_special_e += bcatsketch._count_special_e
         self._count_special_ne += bcatsketch._count_special_ne
 
+    def _add_counts(self, categories, n_nonevent, n_event):
+        # Fold unique categories and their counts into the sketch. Existing
+        # categories are updated in place and new categories are appended.
+        if not len(categories):
+            return
+
+        indices = self._categories.get_indexer(categories)
+        mask_new = indices < 0
+        mask_old = ~mask_new
+
+        self._n_nonevent[indices[mask_old]] += n_nonevent[mask_old]
+        self._n_event[indices[mask_old]] += n_event[mask_old]
+
+        if np.any(mask_new):
+            new_categories = pd.Index(np.asarray(categories, dtype=object)[
+                mask_new], dtype=object)
+
+            self._categories = self._categories.append(new_categories)
+            self._n_nonevent = np.concatenate(
+                (self._n_nonevent, n_nonevent[mask_new])).astype(np.int64)
+            self._n_event = np.concatenate(
+                (self._n_event, n_event[mask_new])).astype(np.int64)
+
+    def to_bytes(self):
+        """Serialize the sketch to a compact and versioned binary format.
+
+        Categories must be all strings or all numbers.
+
+        Returns
+        -------
+        data : bytes
+        """
+        if self._categories.inferred_type not in (
+                "empty", "string", "integer", "floating",
+                "mixed-integer-float", "boolean"):
+            raise TypeError("categories of mixed or non-numeric types cannot "
+                            "be serialized.")
+
+        categories = np.array(self._categories.tolist())
+
+        metadata = {"cat_cutoff": self.cat_cutoff,
+                    "special_codes": self.special_codes,
+                    "count_missing_e": self._count_missing_e,
+                    "count_missing_ne": self._count_missing_ne,
+                    "count_special_e": self._count_special_e,
+                    "count_special_ne": self._count_special_ne}
+
+        arrays = {"categories": categories, "n_nonevent": self._n_nonevent,
+                  "n_event": self._n_event}
+
+        return pack("BCatSketch", metadata, arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a sketch from bytes generated by :meth:`to_bytes`.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized sketch.
+
+        Returns
+        -------
+        bcatsketch : BCatSketch
+        """
+        metadata, arrays = unpack(data, "BCatSketch")
+
+        bcatsketch = cls(metadata["cat_cutoff"], metadata["special_codes"])
+
+        bcatsketch._count_missing_e = metadata["count_missing_e"]
+        bcatsketch._count_missing_ne = metadata["count_missing_ne"]
+        bcatsketch._count_special_e = metadata["count_special_e"]
+        bcatsketch._count_special_ne = metadata["count_special_ne"]
+
+        bcatsketch._categories = pd.Index(arrays["categories"].tolist(),
+                                          dtype=object)
+        bcatsketch._n_nonevent = arrays["n_nonevent"].copy()
+        bcatsketch._n_event = arrays["n_event"].copy()
+
+        return bcatsketch
+
     def _copy(self, bcatsketch):
-        self._d_categories = bcatsketch._d_categories
+        self._categories = bcatsketch._categories
+        self._n_nonevent = bcatsketch._n_nonevent.copy()
+        self._n_event = bcatsketch._n_event.copy()
         self._count_missing_e = bcatsketch._count_missing_e
         self._count_missing_ne = bcatsketch._count_missing_ne
         self._count_special_e = bcatsketch._count_special_e
@@ -427,7 +583,7 @@ class BCatSketch:
         -------
         n_event : int
         """
-        count = np.sum([v[1] for k, v in self._d_categories.items()])
+        count = self._n_event.sum()
         return count + self._count_missing_e + self._count_special_e
 
     @property
@@ -438,7 +594,7 @@ class BCatSketch:
         -------
         n_nonevent : int
         """
-        count = np.sum([v[0] for k, v in self._d_categories.items()])
+        count = self._n_nonevent.sum()
         return count + self._count_missing_ne + self._count_special_ne
 
     @property
@@ -0,0 +1,176 @@
+"""
+Tree reduction of sketches.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import copy
+import numbers
+
+from multiprocessing import cpu_count
+from multiprocessing import Pool
+
+import numpy as np
+
+from .binning_sketch import OptimalBinningSketch
+from .bsketch import BCatSketch
+from .bsketch import BSketch
+from .gk import GK
+
+
+def _mergeable(sketch, other):
+    if isinstance(sketch, (BSketch, BCatSketch)):
+        return sketch._mergeable(other)
+    else:
+        return sketch.mergeable(other)
+
+
+def _is_empty(sketch):
+    if isinstance(sketch, OptimalBinningSketch):
+        return sketch._bsketch is None
+
+    return False
+
+
+def _merge_pair(sketch, other):
+    if isinstance(sketch, OptimalBinningSketch):
+        # Merge the internal sketches to avoid logging each partial merge
+        sketch._bsketch.merge(other._bsketch)
+        sketch._n_add += other._n_add
+    else:
+        sketch.merge(other)
+
+    return sketch
+
+
+def _tree_reduce(sketches):
+    # Merge adjacent pairs level by level. Returns the merged sketch and the
+    # depth of the reduction tree.
+    sketches = list(sketches)
+    depth = 0
+
+    while len(sketches) > 1:
+        merged = [_merge_pair(sketches[i], sketches[i + 1])
+                  for i in range(0, len(sketches) - 1, 2)]
+
+        if len(sketches) % 2:
+            merged.append(sketches[-1])
+
+        sketches = merged
+        depth += 1
+
+    return sketches[0], depth
+
+
+def _sketch_eps(sketch):
+    if isinstance(sketch, OptimalBinningSketch):
+        if sketch.dtype == "categorical":
+            return 0
+        elif sketch.sketch == "gk":
+            return sketch.eps
+    elif isinstance(sketch, BCatSketch):
+        return 0
+    elif isinstance(sketch, BSketch):
+        if sketch.sketch == "gk":
+            return sketch.eps
+    elif isinstance(sketch, GK):
+        return sketch.eps
+
+    return None
+
+
+def merge_all(sketches, n_jobs=None, return_error_bound=False):
+    """Merge a list of sketches with a balanced tree reduction.
+
+    Sketches are merged by adjacent pairs level by level, therefore each
+    sketch takes part in at most :math:`\\lceil \\log_2 k \\rceil` merges,
+    where :math:`k` is the number of sketches, instead of :math:`k - 1` with
+    a sequential reduction. If ``n_jobs > 1``, the list is split into
+    ``n_jobs`` contiguous groups reduced in parallel by a process pool, and
+    the partial results are reduced in the current process.
+
+    Parameters
+    ----------
+    sketches : list
+        List of OptimalBinningSketch, BSketch, BCatSketch or GK instances of
+        the same type sharing signature.
+
+    n_jobs : int or None, optional (default=None)
+        Number of processes used to merge the sketches. None means 1 and -1
+        means using all processors.
+
+    return_error_bound : bool (default=False)
+        Whether to return the relative rank error bound of the merged sketch.
+        Each level of the reduction tree of Greenwald-Khanna sketches adds at
+        most ``eps`` to the rank error, thus the bound is
+        ``eps * (1 + depth)``, where ``depth`` is the depth of the tree.
+        The bound is 0 for categorical sketches, which are exact, and None
+        for t-digest sketches, which do not provide a guarantee.
+
+    Returns
+    -------
+    sketch : object
+        Merged sketch. The input sketches are not modified.
+
+    error_bound : float or None
+        Relative rank error bound. Only returned if
+        ``return_error_bound=True``.
+    """
+    if not isinstance(sketches, (list, tuple)) or not len(sketches):
+        raise ValueError("sketches must be a non-empty list.")
+
+    if n_jobs is not None and not isinstance(n_jobs, numbers.Integral):
+        raise ValueError("n_jobs must be an integer or None; got {}."
+                         .format(n_jobs))
+
+    sketch = sketches[0]
+    if not isinstance(sketch, (OptimalBinningSketch, BSketch, BCatSketch,
+                               GK)):
+        raise TypeError("sketches must be OptimalBinningSketch, BSketch, "
+                        "BCatSketch or GK instances; got {}."
+                        .format(type(sketch).__name__))
+
+    # Validate signatures before merging any sketch
+    for i, other in enumerate(sketches[1:], start=1):
+        if type(other) is not type(sketch):
+            raise TypeError("sketch {} is a {} instance, expected {}."
+                            .format(i, type(other).__name__,
+                                    type(sketch).__name__))
+
+        if not _mergeable(sketch, other):
+            raise ValueError("sketch {} does not share signature.".format(i))
+
+    nonempty = [s for s in sketches if not _is_empty(s)]
+    if not nonempty:
+        nonempty = [sketch]
+
+    if n_jobs is None:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = max(cpu_count() + 1 + n_jobs, 1)
+
+    n_jobs = min(n_jobs, len(nonempty))
+
+    if n_jobs == 1:
+        # The left operand of each merge is modified, copy the sketches to
+        # preserve the input
+        merged, depth = _tree_reduce(copy.deepcopy(nonempty))
+    else:
+        groups = [[nonempty[i] for i in indices] for indices in
+                  np.array_split(np.arange(len(nonempty)), n_jobs)]
+
+        with Pool(processes=n_jobs) as pool:
+            results = pool.map(_tree_reduce, groups)
+
+        partials = [merged for merged, _ in results]
+        merged, depth = _tree_reduce(partials)
+        depth += max(group_depth for _, group_depth in results)
+
+    if return_error_bound:
+        eps = _sketch_eps(merged)
+        error_bound = None if eps is None else eps * (1 + depth)
+
+        return merged, error_bound
+
+    return merged
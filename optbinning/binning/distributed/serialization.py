@@ -0,0 +1,139 @@
+"""
+Compact binary format for sketches.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import json
+import struct
+
+import numpy as np
+
+
+MAGIC = b"OBSKETCH"
+
+FORMAT_VERSION = 1
+
+# magic, format version and header length
+_PREFIX = struct.Struct("<8sHI")
+
+_ALIGNMENT = 8
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+
+    raise TypeError("Object of type {} is not JSON serializable."
+                    .format(type(obj).__name__))
+
+
+def _padding(size):
+    return -size % _ALIGNMENT
+
+
+def pack(kind, metadata, arrays):
+    """Serialize metadata and arrays to bytes.
+
+    The layout is a fixed-size prefix (magic, format version and header
+    length), a JSON header describing the metadata and the arrays, and the
+    raw array buffers, each aligned to 8 bytes.
+
+    Parameters
+    ----------
+    kind : str
+        The type of the serialized object.
+
+    metadata : dict
+        JSON serializable metadata.
+
+    arrays : dict
+        Dictionary of numeric or unicode arrays.
+
+    Returns
+    -------
+    data : bytes
+    """
+    buffers = []
+    layout = []
+    offset = 0
+
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+
+        if array.dtype.kind not in "biufU":
+            raise TypeError("Array {} of dtype {} cannot be serialized."
+                            .format(name, array.dtype))
+
+        layout.append({"name": name, "dtype": array.dtype.str,
+                       "shape": array.shape, "offset": offset})
+
+        buffer = array.tobytes()
+        buffers.append(buffer)
+        buffers.append(b"\0" * _padding(len(buffer)))
+        offset += len(buffer) + _padding(len(buffer))
+
+    header = json.dumps({"kind": kind, "metadata": metadata,
+                         "arrays": layout},
+                        default=_json_default).encode("utf-8")
+    header += b" " * _padding(_PREFIX.size + len(header))
+
+    prefix = _PREFIX.pack(MAGIC, FORMAT_VERSION, len(header))
+
+    return b"".join([prefix, header] + buffers)
+
+
+def unpack(data, kind):
+    """Deserialize bytes generated by :func:`pack`.
+
+    Arrays are returned as read-only views of ``data`` without copying.
+
+    Parameters
+    ----------
+    data : bytes-like
+        Serialized object.
+
+    kind : str
+        The expected type of the serialized object.
+
+    Returns
+    -------
+    metadata : dict
+
+    arrays : dict
+    """
+    data = memoryview(data)
+
+    if len(data) < _PREFIX.size:
+        raise ValueError("data is not a serialized sketch.")
+
+    magic, version, header_size = _PREFIX.unpack_from(data)
+
+    if magic != MAGIC:
+        raise ValueError("data is not a serialized sketch.")
+
+    if version > FORMAT_VERSION:
+        raise ValueError("Unsupported format version {}; maximum supported "
+                         "version is {}.".format(version, FORMAT_VERSION))
+
+    start = _PREFIX.size + header_size
+    header = json.loads(bytes(data[_PREFIX.size:start]).decode("utf-8"))
+
+    if header["kind"] != kind:
+        raise ValueError("data contains a serialized {}, not a {}."
+                         .format(header["kind"], kind))
+
+    arrays = {}
+    for info in header["arrays"]:
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        count = int(np.prod(shape))
+
+        array = np.frombuffer(data, dtype=dtype, count=count,
+                              offset=start + info["offset"])
+        arrays[info["name"]] = array.reshape(shape)
+
+    return header["metadata"], arrays
@@ -0,0 +1,263 @@
+"""
+Dynamic programming: solve unconstrained and monotonic optimal binning
+problems exactly.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numpy as np
+
+from .model_data import model_data
+
+
+class BinningDP:
+    """Exact dynamic programming solver for the optimal binning problem.
+
+    The objective function is separable over bins, therefore the optimal
+    binning is obtained by a recursion over the last bin of each partial
+    solution. Let :math:`f_k(i, s)` be the maximum divergence of a partition
+    of the prebins :math:`0, \\ldots, i` into :math:`k` bins with last bin
+    :math:`[s, i]`, then
+
+    .. math::
+
+        f_k(i, s) = V_{i, s} + \\max_{t \\le s - 1} f_{k-1}(s - 1, t),
+
+    where the maximum is taken over previous bins :math:`[t, s - 1]`
+    compatible with :math:`[s, i]`. The number of bins dimension is only
+    required when ``min_n_bins`` or ``max_n_bins`` are set.
+
+    Supported constraints: ascending and descending monotonic trend,
+    ``min_n_bins``, ``max_n_bins``, bin size and number of (non-)events per
+    bin constraints, ``min_event_rate_diff``, ``max_pvalue`` with
+    ``max_pvalue_policy="consecutive"`` and ``user_splits_fixed``. The model
+    data uses the same integer scaling as the constraint programming
+    formulation, so both solvers produce the same optimal objective value.
+    """
+    def __init__(self, monotonic_trend, min_n_bins, max_n_bins, min_bin_size,
+                 max_bin_size, min_bin_n_event, max_bin_n_event,
+                 min_bin_n_nonevent, max_bin_n_nonevent, min_event_rate_diff,
+                 max_pvalue, max_pvalue_policy, gamma, user_splits_fixed,
+                 time_limit):
+
+        self.monotonic_trend = monotonic_trend
+
+        self.min_n_bins = min_n_bins
+        self.max_n_bins = max_n_bins
+        self.min_bin_size = min_bin_size
+        self.max_bin_size = max_bin_size
+        self.min_bin_n_event = min_bin_n_event
+        self.max_bin_n_event = max_bin_n_event
+        self.min_bin_n_nonevent = min_bin_n_nonevent
+        self.max_bin_n_nonevent = max_bin_n_nonevent
+
+        self.min_event_rate_diff = min_event_rate_diff
+        self.max_pvalue = max_pvalue
+        self.max_pvalue_policy = max_pvalue_policy
+        self.gamma = gamma
+        self.user_splits_fixed = user_splits_fixed
+
+        self.time_limit = time_limit
+
+        self.solver_ = None
+
+        self.n_states_ = None
+        self.objective_ = None
+
+        self._n = None
+        self._D = None
+        self._V = None
+        self._feasible = None
+        self._split_allowed = None
+        self._pvalue_last_r = None
+        self._min_event_rate_diff = None
+
+    def is_supported(self):
+        """Whether the problem constraints are supported by the dynamic
+        programming solver.
+
+        Returns
+        -------
+        supported : bool
+        """
+        if self.monotonic_trend not in (None, "ascending", "descending"):
+            return False
+
+        if self.gamma:
+            return False
+
+        if (self.max_pvalue is not None and
+                self.max_pvalue_policy != "consecutive"):
+            return False
+
+        return True
+
+    def build_model(self, divergence, n_nonevent, n_event, trend_change):
+        # Parameters
+        M = int(1e6)
+        D, V, NE, E, pvalue_violation_indices = model_data(
+            divergence, n_nonevent, n_event, self.max_pvalue,
+            self.max_pvalue_policy, M, True)
+
+        n = len(n_nonevent)
+        R = NE + E
+
+        # Feasible bins [s, i], stored at position (i, s)
+        feasible = np.tril(np.ones((n, n), dtype=bool))
+
+        for S, min_size, max_size in (
+                (R, self.min_bin_size, self.max_bin_size),
+                (NE, self.min_bin_n_nonevent, self.max_bin_n_nonevent),
+                (E, self.min_bin_n_event, self.max_bin_n_event)):
+
+            if min_size is not None:
+                feasible &= (S >= min_size)
+
+            if max_size is not None:
+                feasible &= (S <= max_size)
+
+        # Fixed splits: bins cannot contain a fixed split point
+        if self.user_splits_fixed is not None:
+            fixed = np.zeros(n, dtype=np.int64)
+            fixed[:n - 1] = np.asarray(self.user_splits_fixed[:n - 1],
+                                       dtype=bool)
+            C = np.concatenate(([0], np.cumsum(fixed)))
+            feasible &= (C[:n, None] - C[None, :n]) == 0
+
+        # Splits removed by the monotonicity preprocessing
+        split_allowed = np.ones(n, dtype=bool)
+
+        if self.min_event_rate_diff == 0:
+            if self.monotonic_trend == "ascending":
+                sign = 1
+            elif self.monotonic_trend == "descending":
+                sign = -1
+            else:
+                sign = 0
+
+            if sign:
+                for i in range(n - 1):
+                    if sign * (D[i+1, i] - D[i+1, i+1]) > 0:
+                        split_allowed[i] = False
+                        for j in range(n - i - 1):
+                            if sign * (D[i+1+j, i] - D[i+1+j, i+1+j]) > 0:
+                                split_allowed[i+j] = False
+
+        # Max p-value, consecutive policy: the bin ending at i containing
+        # prebin r cannot be followed by the bin [i + 1, j]. Store the
+        # largest such r for each pair (i, j).
+        pvalue_last_r = np.full((n, n), -1, dtype=np.int64)
+        for i, r, j, _ in pvalue_violation_indices.tolist():
+            pvalue_last_r[i, j] = max(pvalue_last_r[i, j], r)
+
+        self._n = n
+        self._D = D
+        self._V = V.astype(float)
+        self._feasible = feasible
+        self._split_allowed = split_allowed
+        self._pvalue_last_r = pvalue_last_r
+        self._min_event_rate_diff = int(M * self.min_event_rate_diff)
+
+    def solve(self):
+        n = self._n
+        D = self._D
+        V = self._V
+
+        if self.min_n_bins is not None or self.max_n_bins is not None:
+            if self.max_n_bins is not None:
+                n_layers = min(self.max_n_bins, n)
+            else:
+                n_layers = n
+
+            if self.min_n_bins is not None:
+                min_layer = self.min_n_bins - 1
+            else:
+                min_layer = 0
+
+            count_bins = True
+        else:
+            n_layers = 1
+            min_layer = 0
+            count_bins = False
+
+        # f[k, i, s]: best objective with last bin [s, i] and k + 1 bins (if
+        # count_bins), b[k, i, s]: start of the previous bin.
+        f = np.full((n_layers, n, n), -np.inf)
+        b = np.full((n_layers, n, n), -1, dtype=np.int64)
+
+        f[0, :, 0] = np.where(self._feasible[:, 0], V[:, 0], -np.inf)
+
+        for s in range(1, n):
+            if not self._split_allowed[s - 1]:
+                continue
+
+            feasible = self._feasible[s:, s]
+            if not np.any(feasible):
+                continue
+
+            # Compatible previous bins [t, s - 1] for each bin [s, i]
+            allowed = np.ones((n - s, s), dtype=bool)
+
+            if self.monotonic_trend == "ascending":
+                allowed &= (D[s - 1, :s][None, :] + self._min_event_rate_diff
+                            <= D[s:, s][:, None])
+            elif self.monotonic_trend == "descending":
+                allowed &= (D[s:, s][:, None] + self._min_event_rate_diff
+                            <= D[s - 1, :s][None, :])
+
+            if self.max_pvalue is not None:
+                allowed &= (np.arange(s)[None, :] >
+                            self._pvalue_last_r[s - 1, s:][:, None])
+
+            rows = np.arange(n - s)
+
+            for k in range(n_layers):
+                if count_bins:
+                    if k == 0:
+                        continue
+                    prev = f[k - 1, s - 1, :s]
+                else:
+                    prev = f[0, s - 1, :s]
+
+                candidates = np.where(allowed, prev[None, :], -np.inf)
+                t = np.argmax(candidates, axis=1)
+                best = candidates[rows, t]
+
+                f[k, s:, s] = np.where(feasible, best + V[s:, s], -np.inf)
+                b[k, s:, s] = t
+
+        self.n_states_ = n_layers * n * (n + 1) // 2
+
+        # Best last bin
+        solution = np.zeros(n, dtype=bool)
+
+        if min_layer < n_layers:
+            last = f[min_layer:, n - 1, :]
+            k, s = np.unravel_index(np.argmax(last), last.shape)
+            k += min_layer
+            feasible = np.isfinite(f[k, n - 1, s])
+        else:
+            feasible = False
+
+        if not feasible:
+            status_name = "INFEASIBLE"
+            solution[-1] = True
+        else:
+            status_name = "OPTIMAL"
+            self.objective_ = int(f[k, n - 1, s])
+
+            i = n - 1
+            while True:
+                solution[i] = True
+                if s == 0:
+                    break
+                t = b[k, i, s]
+                i = s - 1
+                s = t
+                if count_bins:
+                    k -= 1
+
+        self.solver_ = self
+
+        return status_name, solution
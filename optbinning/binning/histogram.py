@@ -0,0 +1,203 @@
+"""
+Histogram functions to compute prebin statistics.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numpy as np
+
+
+def bin_indices(x, splits, right=False):
+    """Return the bin index of each sample. Equivalent to ``np.digitize`` for
+    monotonically increasing splits.
+
+    Parameters
+    ----------
+    x : array-like, shape = (n_samples,)
+        Data samples.
+
+    splits : array-like, shape = (n_splits,)
+        Sorted split points.
+
+    right : bool (default=False)
+        Whether the intervals include the right or the left bin edge.
+
+    Returns
+    -------
+    indices : numpy.ndarray, shape = (n_samples,)
+    """
+    side = "left" if right else "right"
+
+    return np.searchsorted(splits, x, side=side)
+
+
+def binary_histogram(indices, n_bins, y, sample_weight=None):
+    """Compute the weighted number of non-events and events per bin in a
+    single pass.
+
+    Parameters
+    ----------
+    indices : array-like, shape = (n_samples,)
+        Bin index of each sample.
+
+    n_bins : int
+        The number of bins. Samples with index >= n_bins are discarded.
+
+    y : array-like, shape = (n_samples,)
+        Binary target.
+
+    sample_weight : array-like, shape = (n_samples,) or None (default=None)
+        Sample weights. If None, each sample is given unit weight.
+
+    Returns
+    -------
+    n_nonevent : numpy.ndarray, shape = (n_bins,)
+
+    n_event : numpy.ndarray, shape = (n_bins,)
+    """
+    # Event samples are mapped to the second half of a histogram of size
+    # 2 * (n_bins + 1) to count both classes with a single bincount.
+    y1 = (np.asarray(y) != 0)
+    n = n_bins + 1
+    codes = np.minimum(indices, n_bins) + n * y1
+
+    if sample_weight is not None and len(sample_weight):
+        sample_weight = np.asarray(sample_weight, dtype=float)
+    else:
+        sample_weight = None
+
+    counts = np.bincount(codes, weights=sample_weight, minlength=2 * n)
+
+    return counts[:n_bins], counts[n:n + n_bins]
+
+
+def multiclass_histogram(indices, n_bins, y, classes):
+    """Compute the number of records of each class per bin in a single pass.
+
+    Parameters
+    ----------
+    indices : array-like, shape = (n_samples,)
+        Bin index of each sample.
+
+    n_bins : int
+        The number of bins.
+
+    y : array-like, shape = (n_samples,)
+        Multiclass target.
+
+    classes : array-like, shape = (n_classes,)
+        Sorted unique classes.
+
+    Returns
+    -------
+    n_nonevent : numpy.ndarray, shape = (n_bins, n_classes)
+        Number of records not belonging to each class (one-vs-rest).
+
+    n_event : numpy.ndarray, shape = (n_bins, n_classes)
+        Number of records belonging to each class.
+    """
+    n_classes = len(classes)
+    class_indices = np.searchsorted(classes, y)
+
+    n_event = np.bincount(indices * n_classes + class_indices,
+                          minlength=n_bins * n_classes).reshape(
+                            n_bins, n_classes)
+
+    n_records = n_event.sum(axis=1)
+    n_nonevent = n_records[:, None] - n_event
+
+    return n_nonevent, n_event
+
+
+def continuous_histogram(indices, n_bins, y):
+    """Compute the number of records, sum, standard deviation, minimum,
+    maximum and number of zeros of the target per bin.
+
+    Parameters
+    ----------
+    indices : array-like, shape = (n_samples,)
+        Bin index of each sample.
+
+    n_bins : int
+        The number of bins.
+
+    y : array-like, shape = (n_samples,)
+        Continuous target.
+
+    Returns
+    -------
+    n_records : numpy.ndarray, shape = (n_bins,)
+
+    sums : numpy.ndarray, shape = (n_bins,)
+
+    stds : numpy.ndarray, shape = (n_bins,)
+
+    min_target : numpy.ndarray, shape = (n_bins,)
+
+    max_target : numpy.ndarray, shape = (n_bins,)
+
+    n_zeros : numpy.ndarray, shape = (n_bins,)
+    """
+    y = np.asarray(y, dtype=float)
+
+    n_records = np.bincount(indices, minlength=n_bins)
+    sums = np.bincount(indices, weights=y, minlength=n_bins)
+    n_zeros = np.bincount(indices, weights=(y == 0),
+                          minlength=n_bins).astype(np.int64)
+
+    # Two-pass standard deviation for numerical stability.
+    nonempty = n_records > 0
+    means = np.zeros(n_bins)
+    means[nonempty] = sums[nonempty] / n_records[nonempty]
+    sq_dev = np.bincount(indices, weights=(y - means[indices]) ** 2,
+                         minlength=n_bins)
+
+    stds = np.full(n_bins, np.nan)
+    stds[nonempty] = np.sqrt(sq_dev[nonempty] / n_records[nonempty])
+
+    # Group samples by bin with a stable sort and reduce contiguous runs.
+    min_target = np.full(n_bins, -np.inf)
+    max_target = np.full(n_bins, np.inf)
+
+    if np.any(nonempty):
+        y_sorted = y[np.argsort(indices, kind="stable")]
+        starts = np.concatenate(([0], np.cumsum(n_records)[:-1]))[nonempty]
+        min_target[nonempty] = np.minimum.reduceat(y_sorted, starts)
+        max_target[nonempty] = np.maximum.reduceat(y_sorted, starts)
+
+    return n_records, sums, stds, min_target, max_target, n_zeros
+
+
+def merge_histogram(counts, mask_splits, n_bins):
+    """Merge histogram counts after removing split points, avoiding a new pass
+    over the data. Removing split ``i`` merges bins ``i`` and ``i + 1``.
+
+    Parameters
+    ----------
+    counts : array-like, shape = (n_bins_old,) or (n_bins_old, n_columns)
+        Histogram counts for the current split points.
+
+    mask_splits : array-like, shape = (n_splits,)
+        Boolean mask of split points to be removed.
+
+    n_bins : int
+        The number of bins after merging. Bins with index >= n_bins are
+        discarded.
+
+    Returns
+    -------
+    counts : numpy.ndarray, shape = (n_bins,) or (n_bins, n_columns)
+        Merged histogram counts.
+    """
+    counts = np.asarray(counts)
+    n_bins_old = counts.shape[0]
+
+    new_indices = np.concatenate(
+        ([0], np.cumsum(~np.asarray(mask_splits))))[:n_bins_old]
+
+    mask = new_indices < n_bins
+    new_counts = np.zeros((n_bins,) + counts.shape[1:], dtype=counts.dtype)
+    np.add.at(new_counts, new_indices[mask], counts[mask])
+
+    return new_counts
@@ -64,10 +64,10 @@ class BinningLS:
         ls = LocalSolver()
         model = ls.model
 
-        array_V = model.array(model.array(V[i][::-1]) for i in range(n))
-        array_D = model.array(model.array(D[i][::-1]) for i in range(n))
-        array_NE = model.array(model.array(NE[i][::-1]) for i in range(n))
-        array_E = model.array(model.array(E[i][::-1]) for i in range(n))
+        array_V = model.array(model.array(V[i, i::-1]) for i in range(n))
+        array_D = model.array(model.array(D[i, i::-1]) for i in range(n))
+        array_NE = model.array(model.array(NE[i, i::-1]) for i in range(n))
+        array_E = model.array(model.array(E[i, i::-1]) for i in range(n))
 
         # Decision variables
         x = [model.bool() for i in range(n)]
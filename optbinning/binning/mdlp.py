@@ -52,7 +52,9 @@ class MDLP(BaseEstimator):
     split strategy based on binning the number of candidate splits [CMR2001]
     is implemented to increase efficiency. For large size datasets, it is
     recommended to use a smaller ``max_candidates`` (e.g. 16) to get a
-    significant speed up.
+    significant speed up. The entropy gain of all candidate splits of a
+    partition is computed in a single pass from the cumulative class counts,
+    thus the target can be binary or multiclass.
 
     References
     ----------
@@ -96,40 +98,69 @@ class MDLP(BaseEstimator):
         """
         return self._fit(x, y)
 
-    def _fit(self, x, y):
+    def _fit(self, x, y, presorted=False):
         _check_parameters(**self.get_params())
 
         x = check_array(x, ensure_2d=False, force_all_finite=True)
-        y = check_array(y, ensure_2d=False, force_all_finite=True)
+        y = check_array(y, ensure_2d=False, force_all_finite=True,
+                        dtype=None)
 
-        idx = np.argsort(x)
-        x = x[idx]
-        y = y[idx]
+        if not presorted:
+            idx = np.argsort(x)
+            x = x[idx]
+            y = y[idx]
 
-        self._recurse(x, y, 0)
+        _, y = np.unique(y, return_inverse=True)
+
+        self._x = x
+        self._splits = []
+        self._compute_statistics(y)
+
+        # Partitions are index ranges [start, end) of the sorted samples
+        partitions = [(0, len(x))]
+
+        while partitions:
+            start, end = partitions.pop()
+            split, t = self._find_split(start, end)
+
+            if split is not None:
+                self._splits.append(split)
+
+                if not self._terminate(start, t, end):
+                    partitions.append((t, end))
+                    partitions.append((start, t))
+
+        del self._x, self._cum_counts, self._change, self._midpoints
 
         self._is_fitted = True
 
         return self
 
-    def _recurse(self, x, y, id):
-        u_x = np.unique(x)
-        n_x = len(u_x)
-        n_y = len(np.bincount(y))
+    def _compute_statistics(self, y):
+        # Cumulative class counts of the sorted samples and midpoints of
+        # consecutive samples with different class, the split candidates.
+        n_samples = len(y)
+        n_classes = max(2, y.max() + 1) if n_samples else 2
 
-        split = self._find_split(u_x, x, y)
+        cum_counts = np.zeros((n_samples + 1, n_classes), dtype=np.int64)
+        cum_counts[np.arange(1, n_samples + 1), y] = 1
+        np.cumsum(cum_counts, axis=0, out=cum_counts)
 
-        if split is not None:
-            self._splits.append(split)
-            t = np.searchsorted(x, split, side="right")
+        change = np.flatnonzero(y[1:] != y[:-1])
+        x = self._x
 
-            if not self._terminate(n_x, n_y, y, y[:t], y[t:]):
-                self._recurse(x[:t], y[:t], id + 1)
-                self._recurse(x[t:], y[t:], id + 2)
+        self._cum_counts = cum_counts
+        self._change = change
+        self._midpoints = 0.5 * (x[change + 1] + x[change])
 
-    def _find_split(self, u_x, x, y):
-        n_x = len(x)
-        u_x = np.unique(0.5 * (x[1:] + x[:-1])[(y[1:] - y[:-1]) != 0])
+    def _find_split(self, start, end):
+        n_x = end - start
+
+        # Sorted unique candidates within the partition
+        lo, hi = np.searchsorted(self._change, [start, end - 1])
+        u_x = self._midpoints[lo:hi]
+        if len(u_x):
+            u_x = u_x[np.r_[True, u_x[1:] != u_x[:-1]]]
 
         if len(u_x) > self.max_candidates:
             percentiles = np.linspace(1, 100, self.max_candidates)
@@ -137,52 +168,69 @@ class MDLP(BaseEstimator):
         else:
             splits = u_x
 
-        max_entropy_gain = 0
-        best_split = None
+        tt = start + np.searchsorted(self._x[start:end], splits,
+                                     side="right")
+
+        mask = ((tt - start >= self.min_samples_leaf) &
+                (n_x - (tt - start) >= self.min_samples_leaf))
 
-        tt = np.searchsorted(x, splits, side="right")
-        for i, t in enumerate(tt):
-            samples_l = t >= self.min_samples_leaf
-            samples_r = n_x - t >= self.min_samples_leaf
+        if not np.any(mask):
+            return None, None
 
-            if samples_l and samples_r:
-                entropy_gain = self._entropy_gain(y, y[:t], y[t:])
-                if entropy_gain > max_entropy_gain:
-                    max_entropy_gain = entropy_gain
-                    best_split = splits[i]
+        # Entropy gain of all candidates in a single pass
+        splits = splits[mask]
+        tt = tt[mask]
 
-        return best_split
+        counts = self._cum_counts[end] - self._cum_counts[start]
+        counts_l = self._cum_counts[tt] - self._cum_counts[start]
+        counts_r = counts - counts_l
 
-    def _entropy(self, x):
-        n = len(x)
-        ns1 = np.sum(x)
-        ns0 = n - ns1
-        p = np.array([ns0, ns1]) / n
-        return -special.xlogy(p, p).sum()
+        entropy_gain = self._entropy_gain(counts, counts_l, counts_r)
+        best = np.argmax(entropy_gain)
 
-    def _entropy_gain(self, y, y1, y2):
-        n = len(y)
-        n1 = len(y1)
+        if entropy_gain[best] > 0:
+            return splits[best], tt[best]
+
+        return None, None
+
+    def _entropy(self, counts):
+        n = counts.sum(axis=-1, keepdims=True)
+        p = counts / n
+        return -special.xlogy(p, p).sum(axis=-1)
+
+    def _entropy_gain(self, counts, counts_l, counts_r):
+        n = counts.sum()
+        n1 = counts_l.sum(axis=-1)
         n2 = n - n1
-        ent_y = self._entropy(y)
-        ent_y1 = self._entropy(y1)
-        ent_y2 = self._entropy(y2)
+        ent_y = self._entropy(counts)
+        ent_y1 = self._entropy(counts_l)
+        ent_y2 = self._entropy(counts_r)
         return ent_y - (n1 * ent_y1 + n2 * ent_y2) / n
 
-    def _terminate(self, n_x, n_y, y, y1, y2):
-        splittable = (n_x >= self.min_samples_split) and (n_y >= 2)
+    def _terminate(self, start, t, end):
+        x = self._x[start:end]
+        n_x = np.count_nonzero(x[1:] != x[:-1]) + 1
 
-        n = len(y)
-        n1 = len(y1)
-        n2 = n - n1
-        ent_y = self._entropy(y)
-        ent_y1 = self._entropy(y1)
-        ent_y2 = self._entropy(y2)
-        gain = ent_y - (n1 * ent_y1 + n2 * ent_y2) / n
-
-        k = len(np.bincount(y))
-        k1 = len(np.bincount(y1))
-        k2 = len(np.bincount(y2))
+        counts = self._cum_counts[end] - self._cum_counts[start]
+        counts_l = self._cum_counts[t] - self._cum_counts[start]
+        counts_r = counts - counts_l
+
+        # Number of classes in each partition. Binary targets keep the
+        # largest class index + 1, as in previous versions.
+        if self._cum_counts.shape[1] > 2:
+            k, k1, k2 = (np.count_nonzero(c)
+                         for c in (counts, counts_l, counts_r))
+        else:
+            k, k1, k2 = (np.flatnonzero(c)[-1] + 1
+                         for c in (counts, counts_l, counts_r))
+
+        splittable = (n_x >= self.min_samples_split) and (k >= 2)
+
+        n = end - start
+        ent_y = self._entropy(counts)
+        ent_y1 = self._entropy(counts_l)
+        ent_y2 = self._entropy(counts_r)
+        gain = self._entropy_gain(counts, counts_l, counts_r)
 
         t0 = np.log(3**k - 2)
         t1 = k * ent_y
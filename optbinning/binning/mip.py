@@ -8,8 +8,6 @@ Mixed-Integer programming implementation.
 
 import numpy as np
 
-from ortools.linear_solver import pywraplp
-
 from .model_data import model_data
 
 
@@ -45,7 +43,18 @@ class BinningMIP:
         self._n = None
         self._x = None
 
+    def __getstate__(self):
+        # Solver and model objects cannot be pickled, for instance, when
+        # returning fitted binnings from worker processes.
+        state = self.__dict__.copy()
+        state["solver_"] = None
+        state["_x"] = None
+
+        return state
+
     def build_model(self, divergence, n_nonevent, n_event, trend_change):
+        from ortools.linear_solver import pywraplp
+
         # Parameters
         D, V, pvalue_violation_indices = model_data(divergence, n_nonevent,
                                                     n_event, self.max_pvalue,
@@ -173,6 +182,8 @@ class BinningMIP:
         self._x = x
 
     def solve(self):
+        from ortools.linear_solver import pywraplp
+
         self.solver_.SetTimeLimit(self.time_limit * 1000)
         status = self.solver_.Solve()
 
@@ -460,8 +471,8 @@ class BinningMIP:
                             solver.Add(x[i+j, i+j] == 0)
 
     def add_max_pvalue_constraint(self, solver, x, pvalue_violation_indices):
-        for ind1, ind2 in pvalue_violation_indices:
-            solver.Add(x[ind1[0], ind1[1]] + x[ind2[0], ind2[1]] <= 1)
+        for i, r, j, k in pvalue_violation_indices.tolist():
+            solver.Add(x[i, r] + x[j, k] <= 1)
 
     def add_constraint_fixed_splits(self, solver, n, x):
         if self.user_splits_fixed is not None:
@@ -23,135 +23,264 @@ def test_proportions(e1, ne1, e2, ne2, zscore):
     p2 = e2 / n2
     p = (e1 + e2) / (n1 + n2)
 
-    z = (p1 - p2) / np.sqrt(p * (1 - p) * (1 / n1 + 1 / n2))
-    return abs(z) < zscore
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (p1 - p2) / np.sqrt(p * (1 - p) * (1 / n1 + 1 / n2))
 
+    return np.absolute(z) < zscore
 
-def find_pvalue_violation_indices(n, E, NE, max_pvalue, max_pvalue_policy):
-    pvalue_violation_indices = []
-    zscore = stats.norm.ppf(1.0 - max_pvalue / 2)
 
-    if max_pvalue_policy == "all":
-        for i in range(n - 1):
-            for r in range(i + 1):
-                ev = E[i][r]
-                nev = NE[i][r]
-                for j in range(i + 1, n):
-                    for k in range(i + 1, j + 1):
-                        ev2 = E[j][k]
-                        nev2 = NE[j][k]
-                        if test_proportions(ev, nev, ev2, nev2, zscore):
-                            pvalue_violation_indices.append(([i, r], [j, k]))
-
-    elif max_pvalue_policy == "consecutive":
-        for i in range(n - 1):
-            for r in range(i + 1):
-                ev = E[i][r]
-                nev = NE[i][r]
-                for j in range(i + 1, n):
-                    ev2 = E[j][i + 1]
-                    nev2 = NE[j][i + 1]
-                    if test_proportions(ev, nev, ev2, nev2, zscore):
-                        pvalue_violation_indices.append(([i, r], [j, i+1]))
-
-    return pvalue_violation_indices
+def cumsum_lower_triangular(a):
+    """Return the dense lower triangular matrix of cumulative sums
+    ``S[i, j] = a[j] + ... + a[i]`` for ``j <= i``, zero otherwise.
 
+    Sums are accumulated backwards from ``a[i]``, matching the order of the
+    reversed cumulative sum of ``a[:i + 1]``.
 
-def find_pvalue_violation_indices_continuous(n, U, S, R, max_pvalue,
-                                             max_pvalue_policy):
-    pvalue_violation_indices = []
+    Parameters
+    ----------
+    a : array-like, shape = (n,)
 
-    if max_pvalue_policy == "all":
-        for i in range(n - 1):
-            for t in range(i + 1):
-                u = U[i][t]
-                s = S[i][t]
-                r = R[i][t]
-                for j in range(i + 1, n):
-                    for k in range(i + 1, j + 1):
-                        u2 = U[j][k]
-                        s2 = S[j][k]
-                        r2 = R[j][k]
-                        if stats.ttest_ind_from_stats(
-                                u, s, r, u2, s2, r2, False)[1] > max_pvalue:
-                            pvalue_violation_indices.append(([i, t], [j, k]))
-
-    elif max_pvalue_policy == "consecutive":
-        for i in range(n - 1):
-            for k in range(i + 1):
-                u = U[i][k]
-                s = S[i][k]
-                r = R[i][k]
-                for j in range(i + 1, n):
-                    u2 = U[j][i + 1]
-                    s2 = S[j][i + 1]
-                    r2 = R[j][i + 1]
-                    if stats.ttest_ind_from_stats(
-                            u, s, r, u2, s2, r2, False)[1] > max_pvalue:
-                        pvalue_violation_indices.append(([i, k], [j, i+1]))
-
-    return pvalue_violation_indices
+    Returns
+    -------
+    S : numpy.ndarray, shape = (n, n)
+    """
+    a = np.asarray(a)
+    n = len(a)
 
+    A = np.tril(np.broadcast_to(a, (n, n)))
 
-def model_data(divergence, n_nonevent, n_event, max_pvalue, max_pvalue_policy,
-               scale=None, return_nonevent_event=False):
+    return A[:, ::-1].cumsum(axis=1)[:, ::-1]
+
+
+def pack_lower_triangular(M):
+    """Pack a lower triangular matrix into a one-dimensional array in
+    row-major order. Element ``(i, j)``, ``j <= i``, is stored at position
+    ``i * (i + 1) // 2 + j``.
+
+    Parameters
+    ----------
+    M : array-like, shape = (..., n, n)
+
+    Returns
+    -------
+    packed : numpy.ndarray, shape = (..., n * (n + 1) // 2)
+    """
+    M = np.asarray(M)
+    rows, cols = np.tril_indices(M.shape[-1])
+
+    return M[..., rows, cols]
+
+
+def unpack_lower_triangular(packed, n):
+    """Unpack a one-dimensional row-major lower triangular array into a dense
+    matrix with zero upper triangle.
+
+    Parameters
+    ----------
+    packed : array-like, shape = (..., n * (n + 1) // 2)
+
+    n : int
+        The matrix dimension.
+
+    Returns
+    -------
+    M : numpy.ndarray, shape = (..., n, n)
+    """
+    packed = np.asarray(packed)
+    rows, cols = np.tril_indices(n)
+
+    M = np.zeros(packed.shape[:-1] + (n, n), dtype=packed.dtype)
+    M[..., rows, cols] = packed
+
+    return M
+
+
+def _divergence(divergence, p, q):
+    if divergence == "iv":
+        return jeffrey(p, q)
+    elif divergence == "js":
+        return jensen_shannon(p, q)
+    elif divergence == "hellinger":
+        return hellinger(p, q)
+    elif divergence == "triangular":
+        return triangular(p, q)
+
+
+def _layout(matrices, layout):
+    if layout == "packed":
+        return [pack_lower_triangular(M) for M in matrices]
+
+    return matrices
+
+
+def _binary_model_data(divergence, n_nonevent, n_event, scale):
+    # Dense lower triangular event rate and divergence matrices: row i holds
+    # the bins [j, i] for j <= i. Statistics are only evaluated on the lower
+    # triangle, the upper triangle is zero.
     n = len(n_nonevent)
 
     t_n_event = n_event.sum()
     t_n_nonevent = n_nonevent.sum()
 
-    D = []
-    V = []
+    E = cumsum_lower_triangular(n_event)
+    NE = cumsum_lower_triangular(n_nonevent)
 
-    E = []
-    NE = []
+    rows, cols = np.tril_indices(n)
+    s_event = E[rows, cols]
+    s_nonevent = NE[rows, cols]
 
-    for i in range(1, n + 1):
-        s_event = n_event[:i][::-1].cumsum()[::-1]
-        s_nonevent = n_nonevent[:i][::-1].cumsum()[::-1]
-        rate = s_event / (s_nonevent + s_event)
+    rate = s_event / (s_nonevent + s_event)
+    iv = _divergence(divergence, s_event / t_n_event,
+                     s_nonevent / t_n_nonevent)
 
-        p = s_event / t_n_event
-        q = s_nonevent / t_n_nonevent
+    if scale is not None:
+        rate = (rate * scale).astype(np.int64)
+        iv = (iv * scale).astype(np.int64)
 
-        if divergence == "iv":
-            iv = jeffrey(p, q)
-        elif divergence == "js":
-            iv = jensen_shannon(p, q)
-        elif divergence == "hellinger":
-            iv = hellinger(p, q)
-        elif divergence == "triangular":
-            iv = triangular(p, q)
+    D = np.zeros((n, n), dtype=rate.dtype)
+    V = np.zeros((n, n), dtype=iv.dtype)
+    D[rows, cols] = rate
+    V[rows, cols] = iv
 
-        if scale is not None:
-            rate *= scale
-            iv *= scale
+    return D, V, E, NE
 
-            D.append(rate.astype(np.int64))
-            V.append(iv.astype(np.int64))
-        else:
-            D.append(rate)
-            V.append(iv)
 
-        if max_pvalue is not None or return_nonevent_event:
-            E.append(s_event)
-            NE.append(s_nonevent)
+def _pvalue_candidate_indices(n, i, max_pvalue_policy):
+    # Bins [r, i] are compared with bins [k, j], k > i. Policy "consecutive"
+    # only compares with the bin starting at i + 1.
+    r = np.arange(i + 1)
+
+    if max_pvalue_policy == "all":
+        j, k = np.tril_indices(n - i - 1)
+        j = j + i + 1
+        k = k + i + 1
+    else:
+        j = np.arange(i + 1, n)
+        k = np.full(n - i - 1, i + 1)
+
+    rr = np.repeat(r, len(j))
+    jj = np.tile(j, len(r))
+    kk = np.tile(k, len(r))
+
+    return rr, jj, kk
+
+
+def _pvalue_violation_array(indices):
+    if indices:
+        return np.vstack(indices)
+    else:
+        return np.empty((0, 4), dtype=np.int64)
+
+
+def find_pvalue_violation_indices(n, E, NE, max_pvalue, max_pvalue_policy):
+    """Find pairs of bins not satisfying the max p-value constraint using
+    the Z-test for proportions.
+
+    Returns
+    -------
+    pvalue_violation_indices : numpy.ndarray, shape = (n_violations, 4)
+        Each row ``[i, r, j, k]`` indicates that bins ``[r, i]`` and
+        ``[k, j]`` cannot be simultaneously selected.
+    """
+    zscore = stats.norm.ppf(1.0 - max_pvalue / 2)
+
+    pvalue_violation_indices = []
+
+    for i in range(n - 1):
+        r, j, k = _pvalue_candidate_indices(n, i, max_pvalue_policy)
+
+        mask = test_proportions(E[i, r], NE[i, r], E[j, k], NE[j, k],
+                                zscore)
+
+        if np.any(mask):
+            pvalue_violation_indices.append(np.column_stack(
+                (np.full(np.count_nonzero(mask), i), r[mask], j[mask],
+                 k[mask])))
+
+    return _pvalue_violation_array(pvalue_violation_indices)
+
+
+def find_pvalue_violation_indices_continuous(n, U, S, R, max_pvalue,
+                                             max_pvalue_policy):
+    """Find pairs of bins not satisfying the max p-value constraint using
+    the Welch's t-test.
+
+    Returns
+    -------
+    pvalue_violation_indices : numpy.ndarray, shape = (n_violations, 4)
+        Each row ``[i, r, j, k]`` indicates that bins ``[r, i]`` and
+        ``[k, j]`` cannot be simultaneously selected.
+    """
+    pvalue_violation_indices = []
+
+    for i in range(n - 1):
+        r, j, k = _pvalue_candidate_indices(n, i, max_pvalue_policy)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pvalues = stats.ttest_ind_from_stats(
+                U[i, r], S[i, r], R[i, r], U[j, k], S[j, k], R[j, k],
+                False)[1]
+
+        mask = pvalues > max_pvalue
+
+        if np.any(mask):
+            pvalue_violation_indices.append(np.column_stack(
+                (np.full(np.count_nonzero(mask), i), r[mask], j[mask],
+                 k[mask])))
+
+    return _pvalue_violation_array(pvalue_violation_indices)
+
+
+def model_data(divergence, n_nonevent, n_event, max_pvalue, max_pvalue_policy,
+               scale=None, return_nonevent_event=False, layout="dense"):
+    """Compute the event rate and divergence of every bin [j, i], j <= i.
+
+    Returns
+    -------
+    D, V : numpy.ndarray, shape = (n, n)
+        Lower triangular event rate and divergence matrices. If
+        ``layout="packed"`` the lower triangles are returned as
+        one-dimensional arrays of length ``n * (n + 1) // 2``, see
+        :func:`pack_lower_triangular`.
+
+    NE, E : numpy.ndarray, shape = (n, n)
+        Lower triangular number of non-events and events. Only returned if
+        ``return_nonevent_event=True``.
+
+    pvalue_violation_indices : numpy.ndarray, shape = (n_violations, 4)
+    """
+    n = len(n_nonevent)
+
+    D, V, E, NE = _binary_model_data(divergence, n_nonevent, n_event, scale)
 
     if max_pvalue is not None:
         pvalue_violation_indices = find_pvalue_violation_indices(
             n, E, NE, max_pvalue, max_pvalue_policy)
     else:
-        pvalue_violation_indices = []
+        pvalue_violation_indices = _pvalue_violation_array([])
 
     if return_nonevent_event:
+        D, V, NE, E = _layout([D, V, NE, E], layout)
         return D, V, NE, E, pvalue_violation_indices
 
+    D, V = _layout([D, V], layout)
+
     return D, V, pvalue_violation_indices
 
 
 def multiclass_model_data(n_nonevent, n_event, max_pvalue, max_pvalue_policy,
-                          scale=None):
-
+                          scale=None, layout="dense"):
+    """Compute the one-vs-rest event rate and divergence of every bin [j, i],
+    j <= i, for each class.
+
+    Returns
+    -------
+    D, V : numpy.ndarray, shape = (n_classes, n, n)
+        Lower triangular event rate and divergence matrices per class.
+
+    pvalue_violation_indices : list
+        The p-value violation indices per class.
+    """
     n, n_classes = n_nonevent.shape
 
     DD = []
@@ -159,92 +288,72 @@ def multiclass_model_data(n_nonevent, n_event, max_pvalue, max_pvalue_policy,
     VV = []
 
     for c in range(n_classes):
-        t_n_event = n_event[:, c].sum()
-        t_n_nonevent = n_nonevent[:, c].sum()
-
-        D = []
-        V = []
-
-        E = []
-        NE = []
-
-        for i in range(1, n + 1):
-            s_event = n_event[:i, c][::-1].cumsum()[::-1]
-            s_nonevent = n_nonevent[:i, c][::-1].cumsum()[::-1]
-            rate = s_event / (s_nonevent + s_event)
-
-            p = s_event / t_n_event
-            q = s_nonevent / t_n_nonevent
-            iv = jeffrey(p, q)
-
-            if scale is not None:
-                rate *= scale
-                iv *= scale
-
-                rate = rate.astype(np.int64)
-                iv = iv.astype(np.int64)
-
-            D.append(rate)
-            V.append(iv)
-
-            if max_pvalue is not None:
-                E.append(s_event)
-                NE.append(s_nonevent)
+        D, V, E, NE = _binary_model_data("iv", n_nonevent[:, c],
+                                         n_event[:, c], scale)
 
         if max_pvalue is not None:
             pvalue_violation_indices = find_pvalue_violation_indices(
                 n, E, NE, max_pvalue, max_pvalue_policy)
         else:
-            pvalue_violation_indices = []
+            pvalue_violation_indices = _pvalue_violation_array([])
 
         DD.append(D)
         VV.append(V)
         PV.append(pvalue_violation_indices)
 
+    DD, VV = _layout([np.stack(DD), np.stack(VV)], layout)
+
     return DD, VV, PV
 
 
 def continuous_model_data(n_records, sums, stds, max_pvalue,
-                          max_pvalue_policy, scale=None):
+                          max_pvalue_policy, scale=None, layout="dense"):
+    """Compute the mean and the l1-norm objective term of every bin [j, i],
+    j <= i.
+
+    Returns
+    -------
+    U, V : numpy.ndarray, shape = (n, n)
+        Lower triangular mean and norm matrices.
 
+    pvalue_violation_indices : numpy.ndarray, shape = (n_violations, 4)
+    """
     n = len(n_records)
 
-    U = []
-    UP = []
-    S = []
-    R = []
-    V = []
-
-    for i in range(1, n + 1):
-        s_n_records = n_records[:i][::-1].cumsum()[::-1]
-        s_sums = sums[:i][::-1].cumsum()[::-1]
-        s_stds = stds[:i][::-1].cumsum()[::-1]
-        mean = s_sums / s_n_records
-        norm = np.absolute(sums[i-1] - s_sums)
-        mean_std = s_stds / s_n_records
-
-        if scale is not None:
-            mean_scaled = mean * scale
-            norm_scaled = norm * scale
-
-            mean_scaled = mean_scaled.astype(np.int64)
-            norm_scaled = norm_scaled.astype(np.int64)
-
-            U.append(mean_scaled)
-            V.append(norm_scaled)
-        else:
-            U.append(mean)
-            V.append(norm)
+    R = cumsum_lower_triangular(n_records)
+    S = cumsum_lower_triangular(sums)
 
-        if max_pvalue is not None:
-            UP.append(mean)
-            R.append(s_n_records)
-            S.append(mean_std)
+    rows, cols = np.tril_indices(n)
+    s_n_records = R[rows, cols]
+    s_sums = S[rows, cols]
+
+    mean = s_sums / s_n_records
+    norm = np.absolute(sums[rows] - s_sums)
+
+    if scale is not None:
+        u = (mean * scale).astype(np.int64)
+        v = (norm * scale).astype(np.int64)
+    else:
+        u = mean
+        v = norm
+
+    U = np.zeros((n, n), dtype=u.dtype)
+    V = np.zeros((n, n), dtype=v.dtype)
+    U[rows, cols] = u
+    V[rows, cols] = v
 
     if max_pvalue is not None:
+        UP = np.zeros((n, n))
+        SD = np.zeros((n, n))
+        UP[rows, cols] = mean
+        SD[rows, cols] = (cumsum_lower_triangular(stds)[rows, cols] /
+                          s_n_records)
+
         pvalue_violation_indices = find_pvalue_violation_indices_continuous(
-            n, UP, S, R, max_pvalue, max_pvalue_policy)
+            n, UP, SD, R, max_pvalue, max_pvalue_policy)
     else:
-        pvalue_violation_indices = []
+        pvalue_violation_indices = _pvalue_violation_array([])
+
+    U, V = _layout([U, V], layout)
 
     return U, V, pvalue_violation_indices
@@ -20,9 +20,12 @@ from .binning import OptimalBinning
 from .binning_statistics import multiclass_bin_info
 from .binning_statistics import MulticlassBinningTable
 from .binning_statistics import target_info
-from .multiclass_cp import MulticlassBinningCP
-from .multiclass_mip import MulticlassBinningMIP
+from .histogram import bin_indices
+from .histogram import merge_histogram
+from .histogram import multiclass_histogram
+from .solution_cache import SolutionCache
 from .transformations import transform_multiclass_target
+from .transformations import TransformPlan
 
 
 def _check_parameters(name, prebinning_method, solver, max_n_prebins,
@@ -30,14 +33,16 @@ def _check_parameters(name, prebinning_method, solver, max_n_prebins,
                       max_bin_size, monotonic_trend, max_pvalue,
                       max_pvalue_policy, outlier_detector, outlier_params,
                       user_splits, user_splits_fixed, special_codes,
-                      split_digits, mip_solver, time_limit, verbose):
+                      split_digits, mip_solver, time_limit,
+                      solution_cache, verbose):
 
     if not isinstance(name, str):
         raise TypeError("name must be a string.")
 
-    if prebinning_method not in ("cart", "quantile", "uniform"):
+    if prebinning_method not in ("cart", "mdlp", "quantile", "uniform"):
         raise ValueError('Invalid value for prebinning_method. Allowed string '
-                         'values are "cart", "quantile" and "uniform".')
+                         'values are "cart", "mdlp", "quantile" and '
+                         '"uniform".')
 
     if solver not in ("cp", "mip"):
         raise ValueError('Invalid value for solver. Allowed string '
@@ -162,6 +167,11 @@ def _check_parameters(name, prebinning_method, solver, max_n_prebins,
         raise ValueError("time_limit must be a positive value in seconds; "
                          "got {}.".format(time_limit))
 
+    if solution_cache is not None and not isinstance(solution_cache,
+                                                     SolutionCache):
+        raise TypeError("solution_cache must be a SolutionCache instance or "
+                        "None.")
+
     if not isinstance(verbose, bool):
         raise TypeError("verbose must be a boolean; got {}.".format(verbose))
 
@@ -182,9 +192,10 @@ class MulticlassOptimalBinning(OptimalBinning):
 
     prebinning_method : str, optional (default="cart")
         The pre-binning method. Supported methods are "cart" for a CART
-        decision tree, "quantile" to generate prebins with approximately same
-        frequency and "uniform" to generate prebins with equal width. Method
-        "cart" uses `sklearn.tree.DecistionTreeClassifier
+        decision tree, "mdlp" for Minimum Description Length Principle (MDLP),
+        "quantile" to generate prebins with approximately same frequency and
+        "uniform" to generate prebins with equal width. Method "cart" uses
+        `sklearn.tree.DecistionTreeClassifier
         <https://scikit-learn.org/stable/modules/generated/sklearn.tree.
         DecisionTreeClassifier.html>`_.
 
@@ -264,6 +275,13 @@ class MulticlassOptimalBinning(OptimalBinning):
     time_limit : int (default=100)
         The maximum time in seconds to run the optimization solver.
 
+    solution_cache : SolutionCache or None (default=None)
+        Cache of optimal solutions. If the prebinning statistics and the
+        optimizer parameters match a cached solution, the optimization model
+        is neither built nor solved. See :class:`SolutionCache`.
+
+        .. versionadded:: 0.7.1
+
     verbose : bool (default=False)
         Enable verbose output.
 
@@ -290,7 +308,8 @@ class MulticlassOptimalBinning(OptimalBinning):
                  max_pvalue_policy="consecutive", outlier_detector=None,
                  outlier_params=None, user_splits=None, user_splits_fixed=None,
                  special_codes=None, split_digits=None, mip_solver="bop",
-                 time_limit=100, verbose=False, **prebinning_kwargs):
+                 time_limit=100, solution_cache=None, verbose=False,
+                 **prebinning_kwargs):
 
         self.name = name
         self.dtype = "numerical"
@@ -320,6 +339,7 @@ class MulticlassOptimalBinning(OptimalBinning):
         self.mip_solver = mip_solver
         self.time_limit = time_limit
 
+        self.solution_cache = solution_cache
         self.verbose = verbose
         self.prebinning_kwargs = prebinning_kwargs
 
@@ -335,16 +355,21 @@ class MulticlassOptimalBinning(OptimalBinning):
         self._n_classes = None
         self._n_prebins = None
         self._n_refinements = 0
+        self._presorted = None
         self._n_samples = None
         self._optimizer = None
+        self._solver_type = None
         self._splits_optimal = None
         self._status = None
+        self._transform_plan = None
 
         # timing
         self._time_total = None
         self._time_preprocessing = None
         self._time_prebinning = None
         self._time_solver = None
+        self._time_model_generation = None
+        self._time_optimizer = None
         self._time_postprocessing = None
 
         # logger
@@ -467,11 +492,14 @@ class MulticlassOptimalBinning(OptimalBinning):
                                            self._n_event, self.special_codes,
                                            metric,  metric_special,
                                            metric_missing, show_digits,
-                                           check_input)
+                                           check_input,
+                                           self._get_transform_plan())
 
     def _fit(self, x, y, check_input):
         time_init = time.perf_counter()
 
+        self._transform_plan = None
+
         if self.verbose:
             self._logger.info("Optimal binning started.")
             self._logger.info("Options: check parameters.")
@@ -724,6 +752,8 @@ class MulticlassOptimalBinning(OptimalBinning):
                 self._logger.info("Optimizer: monotonic trend not set.")
 
         if self.solver == "cp":
+            from .multiclass_cp import MulticlassBinningCP
+
             optimizer = MulticlassBinningCP(monotonic, self.min_n_bins,
                                             self.max_n_bins, min_bin_size,
                                             max_bin_size, self.max_pvalue,
@@ -731,6 +761,8 @@ class MulticlassOptimalBinning(OptimalBinning):
                                             self.user_splits_fixed,
                                             self.time_limit)
         else:
+            from .multiclass_mip import MulticlassBinningMIP
+
             optimizer = MulticlassBinningMIP(monotonic, self.min_n_bins,
                                              self.max_n_bins, min_bin_size,
                                              max_bin_size, self.max_pvalue,
@@ -738,19 +770,13 @@ class MulticlassOptimalBinning(OptimalBinning):
                                              self.mip_solver,
                                              self.user_splits_fixed,
                                              self.time_limit)
-        if self.verbose:
-            self._logger.info("Optimizer: build model...")
-
-        optimizer.build_model(n_nonevent, n_event, trend_changes)
-
-        if self.verbose:
-            self._logger.info("Optimizer: solve...")
-
-        status, solution = optimizer.solve()
+        optimizer, status, solution = self._solve(
+            optimizer, n_nonevent, n_event, trend_changes)
 
         self._solution = solution
 
         self._optimizer = optimizer
+        self._solver_type = self.solver
         self._status = status
         self._splits_optimal = splits[solution[:-1]]
 
@@ -766,23 +792,19 @@ class MulticlassOptimalBinning(OptimalBinning):
         if not n_splits:
             return splits_prebinning, np.array([]), np.array([])
 
-        indices = np.digitize(x, splits_prebinning, right=False)
-
+        indices = bin_indices(x, splits_prebinning, right=False)
         n_bins = n_splits + 1
-        n_nonevent = np.empty((n_bins, self._n_classes)).astype(np.int64)
-        n_event = np.empty((n_bins, self._n_classes)).astype(np.int64)
-        mask_remove = np.zeros(n_bins).astype(np.bool)
 
-        for idx, cl in enumerate(self._classes):
-            y1 = (y == cl)
-            y0 = ~y1
+        n_nonevent, n_event = multiclass_histogram(indices, n_bins, y,
+                                                   self._classes)
 
-            for i in range(n_bins):
-                mask = (indices == i)
-                n_nonevent[i, idx] = np.count_nonzero(y0 & mask)
-                n_event[i, idx] = np.count_nonzero(y1 & mask)
+        return self._refine_prebins(splits_prebinning, n_nonevent, n_event)
 
-            mask_remove |= (n_nonevent[:, idx] == 0) | (n_event[:, idx] == 0)
+    def _refine_prebins(self, splits_prebinning, n_nonevent, n_event):
+        if not len(splits_prebinning):
+            return splits_prebinning, np.array([]), np.array([])
+
+        mask_remove = np.any((n_nonevent == 0) | (n_event == 0), axis=1)
 
         if np.any(mask_remove):
             self._n_refinements += 1
@@ -811,11 +833,22 @@ class MulticlassOptimalBinning(OptimalBinning):
                 self._logger.info("Pre-binning: number prebins removed: {}"
                                   .format(np.count_nonzero(mask_remove)))
 
-            [splits_prebinning, n_nonevent, n_event] = self._compute_prebins(
-                splits, x, y)
+            # Merge counts of removed prebins instead of recomputing.
+            n_bins = len(splits) + 1
+            n_nonevent = merge_histogram(n_nonevent, mask_splits, n_bins)
+            n_event = merge_histogram(n_event, mask_splits, n_bins)
+
+            return self._refine_prebins(splits, n_nonevent, n_event)
 
         return splits_prebinning, n_nonevent, n_event
 
+    def _get_transform_plan(self):
+        if self._transform_plan is None:
+            self._transform_plan = TransformPlan(
+                self._splits_optimal, special_codes=self.special_codes)
+
+        return self._transform_plan
+
     @property
     def binning_table(self):
         """Return an instantiated binning table. Please refer to
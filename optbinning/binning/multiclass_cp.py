@@ -6,9 +6,8 @@ problem. Constraint programming implementation.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
-from ortools.sat.python import cp_model
-
 from .cp import BinningCP
+from .cp import _weighted_sum
 from .model_data import multiclass_model_data
 
 
@@ -38,6 +37,8 @@ class MulticlassBinningCP(BinningCP):
         self._x = None
 
     def build_model(self, n_nonevent, n_event, trend_changes):
+        from ortools.sat.python import cp_model
+
         # Parameters
         M = int(1e6)
         D, V, pvalue_violation_indices = multiclass_model_data(
@@ -55,10 +56,7 @@ class MulticlassBinningCP(BinningCP):
             model, n, n_classes)
 
         # Objective function
-        model.Maximize(sum([sum([(V[c][i][i] * x[i, i]) +
-                            sum([(V[c][i][j] - V[c][i][j+1]) * x[i, j]
-                                 for j in range(i)]) for i in range(n)])
-                            for c in range(n_classes)]))
+        model.Maximize(_weighted_sum(*self.objective_terms(n, x, V)))
 
         # Constraint: unique assignment
         self.add_constraint_unique_assignment(model, n, x)
@@ -154,39 +152,9 @@ class MulticlassBinningCP(BinningCP):
         return x, y, t, d, u, bin_size_diff
 
     def add_constraint_monotonic_peak(self, model, n, D, x, c, y, M):
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    M * (y[c, i] + y[c, z]) + M + (D[z][z] - M) * x[z, z] +
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    D[i][i] * x[i, i] >= 0)
-
-                model.Add(
-                    M * (2 - y[c, i] - y[c, z]) + M + (D[i][i] - M) * x[i, i] +
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    D[z][z] * x[z, z] >= 0)
+        y_c = [y[c, i] for i in range(n)]
+        self._add_constraint_monotonic_change(model, n, D, x, y_c, M, True)
 
     def add_constraint_monotonic_valley(self, model, n, D, x, c, y, M):
-        for i in range(1, n):
-            for z in range(i):
-                model.Add(
-                    M * (y[c, i] + y[c, z]) + M + (D[i][i] - M) * x[i, i] +
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    D[z][z] * x[z, z] >= 0)
-
-                model.Add(
-                    M * (2 - y[c, i] - y[c, z]) + M + (D[z][z] - M) * x[z, z] +
-                    sum([(D[z][j] - D[z][j+1]) * x[z, j]
-                         for j in range(z)]) -
-                    sum([(D[i][j] - D[i][j + 1]) * x[i, j]
-                         for j in range(i)]) -
-                    D[i][i] * x[i, i] >= 0)
+        y_c = [y[c, i] for i in range(n)]
+        self._add_constraint_monotonic_change(model, n, D, x, y_c, M, False)
@@ -6,8 +6,6 @@ problem. Mixed-Integer programming implementation.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
-from ortools.linear_solver import pywraplp
-
 from .mip import BinningMIP
 from .model_data import multiclass_model_data
 
@@ -39,6 +37,8 @@ class MulticlassBinningMIP(BinningMIP):
         self._x = None
 
     def build_model(self, n_nonevent, n_event, trend_changes):
+        from ortools.linear_solver import pywraplp
+
         # Parameters
         D, V, pvalue_violation_indices = multiclass_model_data(
             n_nonevent, n_event, self.max_pvalue, self.max_pvalue_policy)
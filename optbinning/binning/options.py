@@ -35,6 +35,7 @@ optimal_binning_default_options = {
     "split_digits": None,
     "mip_solver": "bop",
     "time_limit": 100,
+    "solution_cache": None,
     "verbose": False
 }
 
@@ -58,6 +59,7 @@ multiclass_optimal_binning_default_options = {
     "split_digits": None,
     "mip_solver": "bop",
     "time_limit": 100,
+    "solution_cache": None,
     "verbose": False
 }
 
@@ -82,6 +84,7 @@ continuous_optimal_binning_default_options = {
     "special_codes": None,
     "split_digits": None,
     "time_limit": 100,
+    "solution_cache": None,
     "verbose": False
 }
 
@@ -101,6 +104,7 @@ binning_process_default_options = {
     "split_digits": None,
     "binning_fit_params": None,
     "binning_transform_params": None,
+    "solution_cache": None,
     "verbose": False
 }
 
@@ -7,11 +7,8 @@ Pre-binning class.
 
 import numpy as np
 
-from sklearn.preprocessing import KBinsDiscretizer
-from sklearn.tree import _tree
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.tree import DecisionTreeRegressor
-
+from .cart import HistogramCART
+from .cart import supports_options
 from .mdlp import MDLP
 
 
@@ -47,6 +44,12 @@ class PreBinning:
 
         * ``method="mdlp"``: optbinning.binning.mdlp.MDLP.
 
+    The "cart" method grows the tree on the histogram of the distinct values
+    using :class:`optbinning.binning.cart.HistogramCART`, which produces the
+    same splits as sklearn. Keyword arguments not supported by
+    ``HistogramCART``, for example ``splitter="random"``, fall back to the
+    sklearn decision tree.
+
     """
     def __init__(self, problem_type, method, n_bins, min_bin_size,
                  class_weight=None, **kwargs):
@@ -60,7 +63,7 @@ class PreBinning:
 
         self._splits = None
 
-    def fit(self, x, y, sample_weight=None):
+    def fit(self, x, y, sample_weight=None, presorted=None):
         """Fit PreBinning algorithm.
 
         Parameters
@@ -74,6 +77,10 @@ class PreBinning:
         sample_weight : array-like of shape (n_samples,) (default=None)
             Array of weights that are assigned to individual samples.
 
+        presorted : PresortedColumn or None (default=None)
+            Presorted x and y. Used by methods sorting the data or building
+            histograms of the distinct values to avoid sorting again.
+
         Returns
         -------
         self : object
@@ -89,10 +96,12 @@ class PreBinning:
                              '"regression".')
 
         if self.problem_type == "regression" and self.method == "mdlp":
-            raise ValueError("mdlp method can only handle binary "
-                             "classification problems.")
+            raise ValueError("mdlp method can only handle classification "
+                             "problems.")
 
         if self.method in ("uniform", "quantile"):
+            from sklearn.preprocessing import KBinsDiscretizer
+
             unsup_kwargs = {"n_bins": self.n_bins, "strategy": self.method}
             unsup_kwargs.update(**self.kwargs)
 
@@ -107,27 +116,59 @@ class PreBinning:
 
             if self.problem_type == "classification":
                 cart_kwargs["class_weight"] = self.class_weight
-                cart_kwargs.update(**self.kwargs)
 
-                est = DecisionTreeClassifier(**cart_kwargs)
-            else:
-                cart_kwargs.update(**self.kwargs)
-                est = DecisionTreeRegressor(**cart_kwargs)
+            cart_kwargs.update(**self.kwargs)
+
+            if supports_options(self.problem_type, cart_kwargs):
+                est = HistogramCART(problem_type=self.problem_type,
+                                    **cart_kwargs)
 
-            est.fit(x.reshape(-1, 1), y, sample_weight=sample_weight)
-            splits = np.unique(est.tree_.threshold)
-            self._splits = splits[splits != _tree.TREE_UNDEFINED]
+                # Presorted histograms count samples with zero weight
+                if presorted is not None and (
+                        sample_weight is None or np.all(sample_weight)):
+                    stats = np.column_stack((presorted.n_nonevent,
+                                             presorted.n_event))
+                    est._fit_histogram(presorted.values, presorted.counts,
+                                       stats, len(x))
+                else:
+                    est.fit(x, y, sample_weight)
+
+                self._splits = est.splits
+            else:
+                self._splits = self._fit_sklearn_cart(cart_kwargs, x, y,
+                                                      sample_weight)
 
         elif self.method == "mdlp":
             mdlp_kwargs = {"min_samples_leaf": self.min_bin_size}
             mdlp_kwargs.update(**self.kwargs)
 
             est = MDLP(**mdlp_kwargs)
-            est.fit(x, y)
+
+            if presorted is not None:
+                est._fit(presorted.x_sorted, presorted.y_sorted,
+                         presorted=True)
+            else:
+                est.fit(x, y)
+
             self._splits = est.splits
 
         return self
 
+    def _fit_sklearn_cart(self, cart_kwargs, x, y, sample_weight):
+        from sklearn.tree import _tree
+        from sklearn.tree import DecisionTreeClassifier
+        from sklearn.tree import DecisionTreeRegressor
+
+        if self.problem_type == "classification":
+            est = DecisionTreeClassifier(**cart_kwargs)
+        else:
+            est = DecisionTreeRegressor(**cart_kwargs)
+
+        est.fit(x.reshape(-1, 1), y, sample_weight=sample_weight)
+        splits = np.unique(est.tree_.threshold)
+
+        return splits[splits != _tree.TREE_UNDEFINED]
+
     @property
     def splits(self):
         """List of split points
@@ -0,0 +1,209 @@
+"""
+Cache of optimal binning solutions.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import hashlib
+import numbers
+import os
+import threading
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _update_hash(h, value):
+    # Canonical, type-tagged encoding of optimizer parameters and data
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        h.update("array:{}:{}:".format(value.dtype.str, value.shape).encode())
+        h.update(value.tobytes())
+    elif isinstance(value, (list, tuple)):
+        h.update("seq:{}:".format(len(value)).encode())
+        for v in value:
+            _update_hash(h, v)
+    elif isinstance(value, dict):
+        h.update("dict:{}:".format(len(value)).encode())
+        for k in sorted(value, key=str):
+            _update_hash(h, str(k))
+            _update_hash(h, value[k])
+    elif isinstance(value, np.generic):
+        _update_hash(h, value.item())
+    elif value is None or isinstance(value, (str, bool, numbers.Number)):
+        h.update("{}:{!r};".format(type(value).__name__, value).encode())
+    else:
+        raise TypeError("Object of type {} cannot be hashed."
+                        .format(type(value).__name__))
+
+
+class SolutionCache:
+    """Cache of optimal binning solutions shared across fits.
+
+    Solutions are keyed by a hash of the optimizer, all its parameters
+    (monotonic trend, number of bins, bin size, p-value and event rate
+    constraints, regularization, user splits and time limit) and the
+    prebinning statistics passed to the optimization model, such as the
+    number of non-events and events per prebin. Refitting a binning with the
+    same prebins and constraints, for example after changing the
+    ``selection_criteria`` of a binning process or the estimator of a
+    scorecard, returns the cached solution without building and solving the
+    optimization model. Only optimal solutions are cached.
+
+    Solutions are kept in memory with least-recently-used eviction. If
+    ``path`` is given, solutions are also stored on disk, one file per
+    solution, and are shared across processes and sessions.
+
+    .. versionadded:: 0.7.1
+
+    Parameters
+    ----------
+    maxsize : int (default=1024)
+        The maximum number of solutions kept in memory.
+
+    path : str or None (default=None)
+        Directory of the on-disk store. The directory is created if it does
+        not exist. If None, solutions are only kept in memory.
+
+    Example
+    -------
+    >>> from optbinning import BinningProcess
+    >>> from optbinning import SolutionCache
+    >>> cache = SolutionCache(path="binning_cache")
+    >>> binning_process = BinningProcess(variable_names,
+    >>>                                  solution_cache=cache)
+    >>> binning_process.fit(X, y)
+    >>> binning_process.set_params(selection_criteria={"iv": {"min": 0.02}})
+    >>> binning_process.fit(X, y)
+    """
+    def __init__(self, maxsize=1024, path=None):
+        if not isinstance(maxsize, numbers.Integral) or maxsize < 0:
+            raise ValueError("maxsize must be an integer >= 0; got {}."
+                             .format(maxsize))
+
+        if path is not None and not isinstance(path, str):
+            raise TypeError("path must be a string or None.")
+
+        self.maxsize = maxsize
+        self.path = path
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+        self._solutions = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._n_hits = 0
+        self._n_misses = 0
+
+    def __len__(self):
+        return len(self._solutions)
+
+    def __deepcopy__(self, memo):
+        # The cache is a shared resource: cloned estimators keep using it.
+        return self
+
+    def __getstate__(self):
+        # In-memory solutions are not sent to worker processes, which use
+        # the on-disk store.
+        state = self.__dict__.copy()
+        state["_solutions"] = OrderedDict()
+        state["_lock"] = None
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Remove all cached solutions from memory and disk."""
+        with self._lock:
+            self._solutions.clear()
+
+        if self.path is not None:
+            for filename in os.listdir(self.path):
+                if filename.endswith(".npz"):
+                    os.remove(os.path.join(self.path, filename))
+
+    @property
+    def stats(self):
+        """Number of cache hits and misses.
+
+        Returns
+        -------
+        stats : dict
+        """
+        return {"hits": self._n_hits, "misses": self._n_misses}
+
+    def _key(self, optimizer, *model_data):
+        h = hashlib.sha256()
+
+        _update_hash(h, type(optimizer).__name__)
+
+        params = {key: value for key, value in vars(optimizer).items()
+                  if not key.startswith("_") and not key.endswith("_")}
+        _update_hash(h, params)
+        _update_hash(h, list(model_data))
+
+        return h.hexdigest()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._solutions.get(key)
+
+            if entry is not None:
+                self._solutions.move_to_end(key)
+
+        if entry is None and self.path is not None:
+            try:
+                with np.load(self._filename(key)) as data:
+                    entry = (str(data["status"]), data["solution"])
+            except (OSError, KeyError, ValueError):
+                entry = None
+
+            if entry is not None:
+                self._add(key, entry)
+
+        if entry is None:
+            self._n_misses += 1
+            return None
+
+        self._n_hits += 1
+        status, solution = entry
+
+        return status, solution.copy()
+
+    def _set(self, key, status, solution):
+        if status != "OPTIMAL":
+            return
+
+        entry = (status, np.array(solution, dtype=bool))
+        self._add(key, entry)
+
+        if self.path is not None:
+            # Atomic write, concurrent readers never load partial files
+            filename = self._filename(key)
+            tmp_filename = "{}.{}.{}.tmp".format(filename, os.getpid(),
+                                                 threading.get_ident())
+
+            with open(tmp_filename, "wb") as f:
+                np.savez(f, status=np.array(status), solution=entry[1])
+
+            os.replace(tmp_filename, filename)
+
+    def _add(self, key, entry):
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._solutions[key] = entry
+            self._solutions.move_to_end(key)
+
+            while len(self._solutions) > self.maxsize:
+                self._solutions.popitem(last=False)
+
+    def _filename(self, key):
+        return os.path.join(self.path, "{}.npz".format(key))
@@ -5,6 +5,7 @@ Binning transformations.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
+import bisect
 import numbers
 
 import numpy as np
@@ -91,121 +92,316 @@ def _check_show_digits(show_digits):
                          "got {}.".format(show_digits))
 
 
-def transform_binary_target(splits, dtype, x, n_nonevent, n_event,
-                            special_codes, categories, cat_others, metric,
-                            metric_special, metric_missing, user_splits,
-                            show_digits, check_input=False):
+class TransformPlan:
+    """Compiled bin lookup of a fitted binning.
 
-    if metric not in ("event_rate", "woe", "indices", "bins"):
-        raise ValueError('Invalid value for metric. Allowed string '
-                         'values are "event_rate", "woe", "indices" and '
-                         '"bins".')
+    The plan maps raw values to bin indices with a single vectorized pass:
+    ``searchsorted`` over the split points for numerical variables and a
+    hashed category to bin index map for categorical variables. Clean values
+    are assigned indices in ``[0, n_bins)``, special codes ``n_bins``,
+    missing values ``n_bins + 1`` and unknown categories -1.
 
-    _check_metric_special_missing(metric_special, metric_missing)
-    _check_show_digits(show_digits)
+    Parameters
+    ----------
+    splits : array-like
+        The optimal split points.
 
-    if check_input:
-        x = check_array(x, ensure_2d=False, dtype=None,
-                        force_all_finite='allow-nan')
+    dtype : str, optional (default="numerical")
+        The variable data type, "numerical" or "categorical".
+
+    categories : array-like or None, optional (default=None)
+        List of categories.
 
-    x = np.asarray(x)
+    cat_others : array-like or None, optional (default=None)
+        List of categories in others' bin.
+
+    user_splits : array-like or None, optional (default=None)
+        The list of user-defined pre-binning split points.
+
+    special_codes : array-like or None, optional (default=None)
+        List of special codes.
+    """
+    def __init__(self, splits, dtype="numerical", categories=None,
+                 cat_others=None, user_splits=None, special_codes=None):
+        self.dtype = dtype
+        self.special_codes = special_codes
+
+        if dtype == "numerical":
+            self.splits = np.asarray(splits, dtype=float)
+            self.bins = np.concatenate([[-np.inf], self.splits, [np.inf]])
+            self.n_bins = len(self.splits) + 1
+
+            self._splits_list = self.splits.tolist()
+        else:
+            self.splits = splits
+            self.bins = bin_categorical(splits, categories, cat_others,
+                                        user_splits)
+            self.n_bins = len(self.bins)
+
+            bin_categories = [c for b in self.bins for c in b]
+            bin_sizes = [len(b) for b in self.bins]
+
+            self._category_index = pd.Index(bin_categories, dtype=object)
+            self._category_bins = np.repeat(np.arange(self.n_bins),
+                                            bin_sizes)
+
+            self._category_map = dict(zip(bin_categories,
+                                          self._category_bins.tolist()))
+
+        if special_codes is None:
+            self._special_set = frozenset()
+        else:
+            self._special_set = frozenset(special_codes)
+
+    def indices(self, x):
+        """Return the bin index of each value.
+
+        Parameters
+        ----------
+        x : array-like, shape = (n_samples,)
+            Data samples.
+
+        Returns
+        -------
+        indices : numpy.ndarray, shape = (n_samples,)
+        """
+        x = np.asarray(x)
 
-    if isinstance(x.dtype, object):
         missing_mask = pd.isnull(x)
-    else:
-        missing_mask = np.isinan(x)
 
-    if special_codes is None:
-        clean_mask = ~missing_mask
-    else:
-        special_mask = pd.Series(x).isin(special_codes).values
-        clean_mask = ~missing_mask & ~special_mask
+        if self.special_codes is None:
+            special_mask = None
+            clean_mask = ~missing_mask
+        else:
+            special_mask = pd.Series(x).isin(self.special_codes).values
+            clean_mask = ~missing_mask & ~special_mask
 
-    x_clean = x[clean_mask]
+        indices = np.full(x.shape, -1, dtype=np.int64)
 
-    if dtype == "numerical":
-        if len(splits):
-            indices = np.digitize(x_clean, splits, right=False)
+        if self.dtype == "numerical":
+            if np.all(clean_mask):
+                indices[:] = np.searchsorted(self.splits, x, side="right")
+            else:
+                indices[clean_mask] = np.searchsorted(
+                    self.splits, x[clean_mask], side="right")
         else:
-            indices = np.zeros(x_clean.shape)
+            codes = self._category_index.get_indexer(x)
+            mask = codes >= 0
+            indices[mask] = self._category_bins[codes[mask]]
 
-        bins = np.concatenate([[-np.inf], splits, [np.inf]])
-        bins_str = bin_str_format(bins, show_digits)
-        n_bins = len(splits) + 1
-    else:
-        bins = bin_categorical(splits, categories, cat_others, user_splits)
-        bins_str = [str(b) for b in bins]
-        n_bins = len(bins)
-
-    if metric in ("woe", "event_rate"):
-        # Compute event rate and WoE
-        n_records = n_event + n_nonevent
-        t_n_nonevent = n_nonevent.sum()
-        t_n_event = n_event.sum()
-
-        if "empirical" not in (metric_special, metric_missing):
-            n_event = n_event[:n_bins]
-            n_nonevent = n_nonevent[:n_bins]
-            n_records = n_records[:n_bins]
-
-        # default woe and event rate is 0
-        mask = (n_event > 0) & (n_nonevent > 0)
-        event_rate = np.zeros(len(n_records))
-        woe = np.zeros(len(n_records))
-        event_rate[mask] = n_event[mask] / n_records[mask]
-        constant = np.log(t_n_event / t_n_nonevent)
-        woe[mask] = np.log(1 / event_rate[mask] - 1) + constant
-
-        if metric == "woe":
-            metric_value = woe
+        if special_mask is not None:
+            indices[special_mask] = self.n_bins
+
+        indices[missing_mask] = self.n_bins + 1
+
+        return indices
+
+    def index(self, value):
+        """Return the bin index of a single value.
+
+        Scalar counterpart of :meth:`indices` using Python data structures,
+        suitable for low-latency transformation of individual records.
+
+        Parameters
+        ----------
+        value : object
+            Data value. None, NaN, NaT and pd.NA are considered missing
+            values.
+
+        Returns
+        -------
+        index : int
+        """
+        # pd.NA does not support boolean comparisons, NaT is not equal to
+        # itself as NaN
+        if value is None or value is pd.NA or value != value:
+            return self.n_bins + 1
+
+        if value in self._special_set:
+            return self.n_bins
+
+        if self.dtype == "numerical":
+            return bisect.bisect_right(self._splits_list, value)
+
+        return self._category_map.get(value, -1)
+
+    def to_dict(self):
+        """Return a JSON serializable description of the plan.
+
+        Returns
+        -------
+        plan : dict
+        """
+        plan = {"dtype": self.dtype, "n_bins": self.n_bins}
+
+        if self.special_codes is None:
+            plan["special_codes"] = None
         else:
-            metric_value = event_rate
+            plan["special_codes"] = list(self.special_codes)
 
-        x_transform = np.zeros(x.shape)
-    else:
-        # Assign corresponding indices or bin intervals
-        if metric == "indices":
-            metric_value = np.arange(n_bins + 2)
-            x_transform = np.full(x.shape, -1, dtype=np.int)
-        elif metric == "bins":
-            bins_str.extend(["Special", "Missing"])
-            metric_value = bins_str
-            x_transform = np.full(x.shape, "", dtype=np.object)
-
-    if dtype == "numerical":
-        if metric == "bins":
-            x_clean_transform = np.full(x_clean.shape, "", dtype=np.object)
+        if self.dtype == "numerical":
+            plan["splits"] = self._splits_list
         else:
-            x_clean_transform = np.zeros(x_clean.shape)
+            plan["bins"] = [np.asarray(b).tolist() for b in self.bins]
 
-        for i in range(n_bins):
-            mask = (indices == i)
-            x_clean_transform[mask] = metric_value[i]
+        return plan
 
-        x_transform[clean_mask] = x_clean_transform
-    else:
-        x_p = pd.Series(x)
-        for i in range(n_bins):
-            mask = x_p.isin(bins[i])
-            x_transform[mask] = metric_value[i]
-
-    if special_codes:
-        if metric_special == "empirical" or metric in ("indices", "bins"):
-            x_transform[special_mask] = metric_value[n_bins]
+    def bins_str(self, show_digits):
+        """Return the string representation of each bin.
+
+        Parameters
+        ----------
+        show_digits : int
+            The number of significant digits of the bin column.
+
+        Returns
+        -------
+        bins_str : list
+        """
+        if self.dtype == "numerical":
+            return bin_str_format(self.bins, show_digits)
         else:
-            x_transform[special_mask] = metric_special
+            return [str(b) for b in self.bins]
+
 
-    if metric_missing == "empirical" or metric in ("indices", "bins"):
-        x_transform[missing_mask] = metric_value[n_bins + 1]
+def _lookup_table(metric_value, n_bins, metric_special, metric_missing,
+                  default, dtype=float):
+    # Lookup table indexed by bin index: clean bins, special, missing and the
+    # default value for unknown categories at position -1.
+    table = np.empty(n_bins + 3, dtype=dtype)
+    table[:n_bins] = metric_value[:n_bins]
+
+    if metric_special == "empirical":
+        table[n_bins] = metric_value[n_bins]
+    else:
+        table[n_bins] = metric_special
+
+    if metric_missing == "empirical":
+        table[n_bins + 1] = metric_value[n_bins + 1]
+    else:
+        table[n_bins + 1] = metric_missing
+
+    table[-1] = default
+
+    return table
+
+
+def _binary_target_table(n_nonevent, n_event, n_bins, metric,
+                         metric_special, metric_missing):
+    # Compute event rate and WoE
+    n_records = n_event + n_nonevent
+    t_n_nonevent = n_nonevent.sum()
+    t_n_event = n_event.sum()
+
+    # default woe and event rate is 0
+    mask = (n_event > 0) & (n_nonevent > 0)
+    event_rate = np.zeros(len(n_records))
+    woe = np.zeros(len(n_records))
+    event_rate[mask] = n_event[mask] / n_records[mask]
+    constant = np.log(t_n_event / t_n_nonevent)
+    woe[mask] = np.log(1 / event_rate[mask] - 1) + constant
+
+    if metric == "woe":
+        metric_value = woe
     else:
-        x_transform[missing_mask] = metric_missing
+        metric_value = event_rate
+
+    return _lookup_table(metric_value, n_bins, metric_special,
+                         metric_missing, 0)
+
+
+def _continuous_target_table(n_records, sums, n_bins, metric_special,
+                             metric_missing):
+    if "empirical" not in (metric_special, metric_missing):
+        n_records = n_records[:n_bins]
+        sums = sums[:n_bins]
 
-    return x_transform
+    # Compute mean
+    metric_value = sums / n_records
+
+    return _lookup_table(metric_value, n_bins, metric_special,
+                         metric_missing, 0)
+
+
+def _multiclass_target_table(n_event, n_bins, metric, metric_special,
+                             metric_missing):
+    # Build non-event to compute one-vs-all WoE
+    n_classes = n_event.shape[1]
+    n_records = np.tile(n_event.sum(axis=1), (n_classes, 1)).T
+    n_nonevent = n_records - n_event
+    t_n_nonevent = n_nonevent.sum(axis=0)
+    t_n_event = n_event.sum(axis=0)
+
+    if "empirical" not in (metric_special, metric_missing):
+        n_event = n_event[:n_bins, :]
+        n_nonevent = n_nonevent[:n_bins, :]
+        n_records = n_records[:n_bins, :]
+
+    event_rate = n_event / n_records
+    woe = np.zeros(n_event.shape)
+
+    for i in range(n_classes):
+        woe[:,  i] = transform_event_rate_to_woe(
+            event_rate[:, i], t_n_nonevent[i], t_n_event[i])
+
+    if metric == "mean_woe":
+        metric_value = woe.mean(axis=1)
+    elif metric == "weighted_mean_woe":
+        metric_value = np.average(woe, weights=t_n_event, axis=1)
+
+    return _lookup_table(metric_value, n_bins, metric_special,
+                         metric_missing, 0)
+
+
+def _transform_indices_bins(plan, indices, metric, show_digits):
+    if metric == "indices":
+        return indices
+    else:
+        bins_str = plan.bins_str(show_digits)
+        bins_str.extend(["Special", "Missing", ""])
+
+        table = np.empty(len(bins_str), dtype=object)
+        table[:] = bins_str
+
+        return table[indices]
+
+
+def transform_binary_target(splits, dtype, x, n_nonevent, n_event,
+                            special_codes, categories, cat_others, metric,
+                            metric_special, metric_missing, user_splits,
+                            show_digits, check_input=False, plan=None):
+
+    if metric not in ("event_rate", "woe", "indices", "bins"):
+        raise ValueError('Invalid value for metric. Allowed string '
+                         'values are "event_rate", "woe", "indices" and '
+                         '"bins".')
+
+    _check_metric_special_missing(metric_special, metric_missing)
+    _check_show_digits(show_digits)
+
+    if check_input:
+        x = check_array(x, ensure_2d=False, dtype=None,
+                        force_all_finite='allow-nan')
+
+    if plan is None:
+        plan = TransformPlan(splits, dtype, categories, cat_others,
+                             user_splits, special_codes)
+
+    indices = plan.indices(x)
+    n_bins = plan.n_bins
+
+    if metric in ("indices", "bins"):
+        return _transform_indices_bins(plan, indices, metric, show_digits)
+
+    table = _binary_target_table(n_nonevent, n_event, n_bins, metric,
+                                 metric_special, metric_missing)
+
+    return table[indices]
 
 
 def transform_multiclass_target(splits, x, n_event, special_codes, metric,
                                 metric_special, metric_missing, show_digits,
-                                check_input=False):
+                                check_input=False, plan=None):
 
     if metric not in ("mean_woe", "weighted_mean_woe", "indices", "bins"):
         raise ValueError('Invalid value for metric. Allowed string '
@@ -219,93 +415,26 @@ def transform_multiclass_target(splits, x, n_event, special_codes, metric,
         x = check_array(x, ensure_2d=False, dtype=None,
                         force_all_finite='allow-nan')
 
-    x = np.asarray(x)
-
-    if isinstance(x.dtype, object):
-        missing_mask = pd.isnull(x)
-    else:
-        missing_mask = np.isinan(x)
-
-    if special_codes is None:
-        clean_mask = ~missing_mask
-    else:
-        special_mask = pd.Series(x).isin(special_codes).values
-        clean_mask = ~missing_mask & ~special_mask
+    if plan is None:
+        plan = TransformPlan(splits, "numerical",
+                             special_codes=special_codes)
 
-    x_clean = x[clean_mask]
+    indices = plan.indices(x)
+    n_bins = plan.n_bins
 
-    if len(splits):
-        indices = np.digitize(x_clean, splits, right=False)
-    else:
-        indices = np.zeros(x_clean.shape)
-
-    bins = np.concatenate([[-np.inf], splits, [np.inf]])
-    bins_str = bin_str_format(bins, show_digits)
-    n_bins = len(splits) + 1
-
-    if metric in ("mean_woe", "weighted_mean_woe"):
-        # Build non-event to compute one-vs-all WoE
-        n_classes = n_event.shape[1]
-        n_records = np.tile(n_event.sum(axis=1), (n_classes, 1)).T
-        n_nonevent = n_records - n_event
-        t_n_nonevent = n_nonevent.sum(axis=0)
-        t_n_event = n_event.sum(axis=0)
-
-        if "empirical" not in (metric_special, metric_missing):
-            n_event = n_event[:n_bins, :]
-            n_nonevent = n_nonevent[:n_bins, :]
-            n_records = n_records[:n_bins, :]
-
-        event_rate = n_event / n_records
-        woe = np.zeros(n_event.shape)
-
-        for i in range(n_classes):
-            woe[:,  i] = transform_event_rate_to_woe(
-                event_rate[:, i], t_n_nonevent[i], t_n_event[i])
-
-        if metric == "mean_woe":
-            metric_value = woe.mean(axis=1)
-        elif metric == "weighted_mean_woe":
-            metric_value = np.average(woe, weights=t_n_event, axis=1)
-
-        x_transform = np.zeros(x.shape)
-        x_clean_transform = np.zeros(x_clean.shape)
-    else:
-        # Assign corresponding indices or bin intervals
-        if metric == "indices":
-            metric_value = np.arange(n_bins + 2)
-            x_transform = np.full(x.shape, -1, dtype=np.int)
-        elif metric == "bins":
-            bins_str.extend(["Special", "Missing"])
-            metric_value = bins_str
-            x_transform = np.full(x.shape, "", dtype=np.object)
-
-        x_clean_transform = np.full(x_clean.shape, "").astype(np.object)
-
-    for i in range(n_bins):
-        mask = (indices == i)
-        x_clean_transform[mask] = metric_value[i]
-
-    x_transform[clean_mask] = x_clean_transform
-
-    if special_codes:
-        if metric_special == "empirical" or metric in ("indices", "bins"):
-            x_transform[special_mask] = metric_value[n_bins]
-        else:
-            x_transform[special_mask] = metric_special
+    if metric in ("indices", "bins"):
+        return _transform_indices_bins(plan, indices, metric, show_digits)
 
-    if metric_missing == "empirical" or metric in ("indices", "bins"):
-        x_transform[missing_mask] = metric_value[n_bins + 1]
-    else:
-        x_transform[missing_mask] = metric_missing
+    table = _multiclass_target_table(n_event, n_bins, metric,
+                                     metric_special, metric_missing)
 
-    return x_transform
+    return table[indices]
 
 
 def transform_continuous_target(splits, dtype, x, n_records, sums,
                                 special_codes, categories, cat_others, metric,
                                 metric_special, metric_missing, user_splits,
-                                show_digits, check_input):
+                                show_digits, check_input, plan=None):
 
     if metric not in ("mean", "indices", "bins"):
         raise ValueError('Invalid value for metric. Allowed string '
@@ -318,79 +447,17 @@ def transform_continuous_target(splits, dtype, x, n_records, sums,
         x = check_array(x, ensure_2d=False, dtype=None,
                         force_all_finite='allow-nan')
 
-    x = np.asarray(x)
-
-    if isinstance(x.dtype, object):
-        missing_mask = pd.isnull(x)
-    else:
-        missing_mask = np.isinan(x)
-
-    if special_codes is None:
-        clean_mask = ~missing_mask
-    else:
-        special_mask = pd.Series(x).isin(special_codes).values
-        clean_mask = ~missing_mask & ~special_mask
-
-    x_clean = x[clean_mask]
-
-    if dtype == "numerical":
-        if len(splits):
-            indices = np.digitize(x_clean, splits, right=False)
-        else:
-            indices = np.zeros(x_clean.shape)
-
-        bins = np.concatenate([[-np.inf], splits, [np.inf]])
-        bins_str = bin_str_format(bins, show_digits)
-        n_bins = len(splits) + 1
-    else:
-        bins = bin_categorical(splits, categories, cat_others, user_splits)
-        bins_str = [str(b) for b in bins]
-        n_bins = len(bins)
-
-    if "empirical" not in (metric_special, metric_missing):
-        n_records = n_records[:n_bins]
-        sums = sums[:n_bins]
-
-    if metric == "mean":
-        # Compute mean
-        metric_value = sums / n_records
-        x_transform = np.zeros(x.shape)
-    else:
-        # Assign corresponding indices or bin intervals
-        if metric == "indices":
-            metric_value = np.arange(n_bins + 2)
-            x_transform = np.full(x.shape, -1, dtype=np.int)
-        elif metric == "bins":
-            bins_str.extend(["Special", "Missing"])
-            metric_value = bins_str
-            x_transform = np.full(x.shape, "", dtype=np.object)
-
-    if dtype == "numerical":
-        if metric == "bins":
-            x_clean_transform = np.full(x_clean.shape, "").astype(np.object)
-        else:
-            x_clean_transform = np.zeros(x_clean.shape)
+    if plan is None:
+        plan = TransformPlan(splits, dtype, categories, cat_others,
+                             user_splits, special_codes)
 
-        for i in range(n_bins):
-            mask = (indices == i)
-            x_clean_transform[mask] = metric_value[i]
+    indices = plan.indices(x)
+    n_bins = plan.n_bins
 
-        x_transform[clean_mask] = x_clean_transform
-    else:
-        x_p = pd.Series(x)
-        for i in range(n_bins):
-            mask = x_p.isin(bins[i])
-            x_transform[mask] = metric_value[i]
-
-    if special_codes:
-        if metric_special == "empirical" or metric in ("indices", "bins"):
-            x_transform[special_mask] = metric_value[n_bins]
-        else:
-            x_transform[special_mask] = metric_special
+    if metric in ("indices", "bins"):
+        return _transform_indices_bins(plan, indices, metric, show_digits)
 
-    if metric_missing == "empirical" or metric in ("indices", "bins"):
-        x_transform[missing_mask] = metric_value[n_bins + 1]
-    else:
-        x_transform[missing_mask] = metric_missing
+    table = _continuous_target_table(n_records, sums, n_bins,
+                                     metric_special, metric_missing)
 
-    return x_transform
+    return table[indices]
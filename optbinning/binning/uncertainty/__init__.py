@@ -1,4 +1,9 @@
-from .binning_scenarios import SBOptimalBinning
+from ..._lazy import lazy_attributes
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'SBOptimalBinning': '.binning_scenarios'
+})
 
 
 __all__ = ['SBOptimalBinning']
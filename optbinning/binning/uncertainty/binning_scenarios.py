@@ -19,7 +19,9 @@ from ..binning import OptimalBinning
 from ..binning_statistics import bin_info
 from ..binning_statistics import BinningTable
 from ..binning_statistics import target_info
-from ..cp import BinningCP
+from ..histogram import bin_indices
+from ..histogram import binary_histogram
+from ..histogram import merge_histogram
 from ..prebinning import PreBinning
 
 
@@ -317,14 +319,18 @@ class SBOptimalBinning(OptimalBinning):
         self._n_samples_scenario = None
         self._n_samples = None
         self._optimizer = None
+        self._solver_type = None
         self._splits_optimal = None
         self._status = None
+        self._transform_plan = None
 
         # timing
         self._time_total = None
         self._time_preprocessing = None
         self._time_prebinning = None
         self._time_solver = None
+        self._time_model_generation = None
+        self._time_optimizer = None
         self._time_postprocessing = None
 
         # logger
@@ -415,6 +421,8 @@ class SBOptimalBinning(OptimalBinning):
     def _fit(self, X, Y, weights, check_input):
         time_init = time.perf_counter()
 
+        self._transform_plan = None
+
         # Check parameters and input arrays
         _check_parameters(**self.get_params())
         _check_X_Y_weights(X, Y, weights)
@@ -612,22 +620,21 @@ class SBOptimalBinning(OptimalBinning):
             return splits_prebinning, np.array([]), np.array([])
 
         n_bins = n_splits + 1
-        n_nonevent = np.empty((n_bins, self._n_scenarios)).astype(np.int)
-        n_event = np.empty((n_bins, self._n_scenarios)).astype(np.int)
-        mask_remove = np.zeros(n_bins).astype(np.bool)
+        n_nonevent = np.empty((n_bins, self._n_scenarios)).astype(np.int64)
+        n_event = np.empty((n_bins, self._n_scenarios)).astype(np.int64)
 
         for s in range(self._n_scenarios):
-            y0 = (y[s] == 0)
-            y1 = ~y0
+            indices = bin_indices(x[s], splits_prebinning, right=False)
+            n_nonevent[:, s], n_event[:, s] = binary_histogram(
+                indices, n_bins, y[s])
 
-            indices = np.digitize(x[s], splits_prebinning, right=False)
+        return self._refine_prebins(splits_prebinning, n_nonevent, n_event)
 
-            for i in range(n_bins):
-                mask = (indices == i)
-                n_nonevent[i, s] = np.count_nonzero(y0 & mask)
-                n_event[i, s] = np.count_nonzero(y1 & mask)
+    def _refine_prebins(self, splits_prebinning, n_nonevent, n_event):
+        if not len(splits_prebinning):
+            return splits_prebinning, np.array([]), np.array([])
 
-            mask_remove |= (n_nonevent[:, s] == 0) | (n_event[:, s] == 0)
+        mask_remove = np.any((n_nonevent == 0) | (n_event == 0), axis=1)
 
         if np.any(mask_remove):
             self._n_refinements += 1
@@ -656,8 +663,12 @@ class SBOptimalBinning(OptimalBinning):
                 self._logger.info("Pre-binning: number prebins removed: {}"
                                   .format(np.count_nonzero(mask_remove)))
 
-            [splits_prebinning, n_nonevent, n_event] = self._compute_prebins(
-                splits, x, y)
+            # Merge counts of removed prebins instead of recomputing.
+            n_bins = len(splits) + 1
+            n_nonevent = merge_histogram(n_nonevent, mask_splits, n_bins)
+            n_event = merge_histogram(n_event, mask_splits, n_bins)
+
+            return self._refine_prebins(splits, n_nonevent, n_event)
 
         return splits_prebinning, n_nonevent, n_event
 
@@ -690,6 +701,8 @@ class SBOptimalBinning(OptimalBinning):
         else:
             max_bin_size = self.max_bin_size
 
+        from ..cp import BinningCP
+
         optimizer = BinningCP(self.monotonic_trend, self.min_n_bins,
                               self.max_n_bins, min_bin_size, max_bin_size,
                               None, None, None, None, self.min_event_rate_diff,
@@ -701,16 +714,22 @@ class SBOptimalBinning(OptimalBinning):
         if self.verbose:
             self._logger.info("Optimizer: build model...")
 
+        time_model_generation = time.perf_counter()
         optimizer.build_model_scenarios(n_nonevent, n_event, weights)
-
-        status, solution = optimizer.solve()
+        self._time_model_generation = (
+            time.perf_counter() - time_model_generation)
 
         if self.verbose:
             self._logger.info("Optimizer: solve...")
 
+        time_optimizer = time.perf_counter()
+        status, solution = optimizer.solve()
+        self._time_optimizer = time.perf_counter() - time_optimizer
+
         self._solution = solution
 
         self._optimizer = optimizer
+        self._solver_type = self.solver
         self._status = status
 
         self._splits_optimal = splits[solution[:-1]]
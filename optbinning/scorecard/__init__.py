@@ -1,5 +1,12 @@
-from .scorecard import Scorecard
-from .plots import plot_auc_roc, plot_cap, plot_ks
+from .._lazy import lazy_attributes
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'Scorecard': '.scorecard',
+    'plot_auc_roc': '.plots',
+    'plot_cap': '.plots',
+    'plot_ks': '.plots'
+})
 
 
 __all__ = ["Scorecard",
@@ -8,8 +8,6 @@ Scorecard monitoring (System stability report)
 import numbers
 import time
 
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mtick
 import numpy as np
 import pandas as pd
 
@@ -36,7 +34,7 @@ PSI_VERDICT_MSG = {0: "No significant change",
 
 
 def _check_parameters(target, scorecard, psi_method, psi_n_bins,
-                      psi_min_bin_size, show_digits, verbose):
+                      psi_min_bin_size, show_digits, n_jobs, verbose):
 
     if not isinstance(target, str):
         raise TypeError("target must be a string.")
@@ -66,10 +64,70 @@ def _check_parameters(target, scorecard, psi_method, psi_n_bins,
         raise ValueError("show_digits must be an integer in [0, 8]; "
                          "got {}.".format(show_digits))
 
+    if n_jobs is not None and not isinstance(n_jobs, numbers.Integral):
+        raise ValueError("n_jobs must be an integer or None; got {}."
+                         .format(n_jobs))
+
     if not isinstance(verbose, bool):
         raise TypeError("verbose must be a boolean; got {}.".format(verbose))
 
 
+def _iter_chunks(data, name):
+    # A dataframe or an iterable of dataframes, e.g., a reader returned by
+    # pandas.read_csv with chunksize.
+    if isinstance(data, pd.DataFrame):
+        yield data
+        return
+
+    try:
+        chunks = iter(data)
+    except TypeError:
+        raise TypeError("{} must be a pandas.DataFrame or an iterable of "
+                        "pandas.DataFrame.".format(name))
+
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("{} chunks must be pandas.DataFrame; got {}."
+                            .format(name, type(chunk).__name__))
+        yield chunk
+
+
+def _bin_mean_std(indices, y, n_records):
+    # Mean and sample standard deviation of y at each bin, consistent with
+    # pandas.Series.mean and pandas.Series.std (ddof=1).
+    n_bins = len(n_records)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.bincount(indices, weights=y, minlength=n_bins) / n_records
+        sq = np.bincount(indices, weights=(y - mean[indices]) ** 2,
+                         minlength=n_bins)
+        std = np.sqrt(sq / (n_records - 1))
+
+    return mean, std
+
+
+def _system_counts(indices, y, n_bins, target_dtype):
+    # Number of records and target statistics at each PSI bin
+    n_records = np.bincount(indices, minlength=n_bins)
+
+    if target_dtype == "binary":
+        n_nonevent = np.bincount(indices[y == 0], minlength=n_bins)
+
+        return {"n_records": n_records, "n_event": n_records - n_nonevent,
+                "n_nonevent": n_nonevent}
+
+    mean, std = _bin_mean_std(indices, y, n_records)
+
+    return {"n_records": n_records, "mean": mean, "std": std}
+
+
+def _target_summary(y):
+    # Mean, standard deviation and quartiles of a continuous target
+    p25, median, p75 = np.percentile(y, [25, 50, 75])
+
+    return [y.mean(), y.std(ddof=1), p25, median, p75]
+
+
 def print_psi_report(df_psi):
     t_psi = df_psi.PSI.values[-1]
     psi = df_psi.PSI.values[:-1]
@@ -160,7 +218,9 @@ def print_system_report(df_psi, df_tests, df_target_analysis, df_performance):
     print_psi_report(df_psi)
     print_tests_report(df_tests)
     print_target_report(df_target_analysis)
-    print_performance_report(df_performance)
+
+    if df_performance is not None:
+        print_performance_report(df_performance)
 
 
 class ScorecardMonitoring(BaseEstimator):
@@ -192,11 +252,19 @@ class ScorecardMonitoring(BaseEstimator):
     show_digits : int, optional (default=2)
         The number of significant digits of the bin column.
 
+    n_jobs : int or None, optional (default=None)
+        Number of threads used to compute the bin indices of the scorecard
+        variables of each chunk of data. None means 1 and -1 means using
+        all processors.
+
+        .. versionadded:: 0.7.1
+
     verbose : bool (default=False)
         Enable verbose output.
     """
     def __init__(self, target, scorecard, psi_method="cart", psi_n_bins=20,
-                 psi_min_bin_size=0.05, show_digits=2, verbose=False):
+                 psi_min_bin_size=0.05, show_digits=2, n_jobs=None,
+                 verbose=False):
 
         self.target = target
         self.scorecard = scorecard
@@ -206,6 +274,7 @@ class ScorecardMonitoring(BaseEstimator):
         self.psi_min_bin_size = psi_min_bin_size
 
         self.show_digits = show_digits
+        self.n_jobs = n_jobs
         self.verbose = verbose
 
         # auxiliary data
@@ -233,12 +302,17 @@ class ScorecardMonitoring(BaseEstimator):
     def fit(self, df_actual, df_expected):
         """Fit monitoring with actual and expected data.
 
+        Data can be provided as a dataframe or as an iterable of dataframes,
+        e.g., ``pandas.read_csv(path, chunksize=chunksize)``. Each chunk is
+        processed once: the bin indices of the scorecard variables are
+        shared by the score, the predictions and the variables histograms.
+
         Parameters
         ----------
-        df_actual : pandas.DataFrame
+        df_actual : pandas.DataFrame or iterable of pandas.DataFrame
             Score of the training or actual input samples.
 
-        df_expected : pandas.DataFrame
+        df_expected : pandas.DataFrame or iterable of pandas.DataFrame
             Trainning data used for fitting the scorecard.
 
         Returns
@@ -258,11 +332,22 @@ class ScorecardMonitoring(BaseEstimator):
         # Check if scorecard is fitted
         self.scorecard._check_is_fitted()
 
-        y_actual = df_actual[self.target]
-        y_expected = df_expected[self.target]
+        # Single pass over both datasets
+        if self.verbose:
+            self._logger.info("Data scan started.")
 
-        target_dtype = type_of_target(y_actual)
-        target_dtype_e = type_of_target(y_expected)
+        time_scan = time.perf_counter()
+        scan_expected = self._scan(df_expected, "df_expected", None)
+        scan_actual = self._scan(df_actual, "df_actual",
+                                 scan_expected["columns"])
+        time_scan = time.perf_counter() - time_scan
+
+        if self.verbose:
+            self._logger.info("Data scan terminated. Time: {:.4f}s"
+                              .format(time_scan))
+
+        target_dtype = type_of_target(scan_actual["y"])
+        target_dtype_e = type_of_target(scan_expected["y"])
 
         if target_dtype not in ("binary", "continuous"):
             raise ValueError("Target type {} is not supported."
@@ -274,18 +359,13 @@ class ScorecardMonitoring(BaseEstimator):
 
         self._target_dtype = target_dtype
 
-        # Check variable names
-        if list(df_actual.columns) != list(df_expected.columns):
-            raise ValueError("Dataframes df_actual and df_expected must "
-                             "have the same columns.")
-
         # Statistics at system level
         if self.verbose:
             self._logger.info("System stability analysis started.")
 
         time_system = time.perf_counter()
-        self._fit_system(df_actual, y_actual, df_expected, y_expected)
-        self._time_system = time.perf_counter() - time_system
+        self._fit_system(scan_actual, scan_expected)
+        self._time_system = time.perf_counter() - time_system + time_scan
 
         if self.verbose:
             self._logger.info("System stability analysis terminated. Time: "
@@ -296,7 +376,7 @@ class ScorecardMonitoring(BaseEstimator):
             self._logger.info("Variable analysis started.")
 
         time_variable = time.perf_counter()
-        self._fit_variables(df_actual, df_expected)
+        self._fit_variables(scan_actual["counts"], scan_expected["counts"])
         self._time_variable = time.perf_counter() - time_variable
 
         if self.verbose:
@@ -430,6 +510,9 @@ class ScorecardMonitoring(BaseEstimator):
         """
         self._check_is_fitted()
 
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mtick
+
         fig, ax1 = plt.subplots()
 
         n_bins = len(self._n_records_a)
@@ -480,79 +563,121 @@ class ScorecardMonitoring(BaseEstimator):
             plt.savefig(savefig)
             plt.close()
 
-    def _fit_system(self, df_actual, y_actual, df_expected, y_expected):
+    def _scan(self, data, name, columns):
+        # Bin indices of the scorecard variables are computed once per chunk
+        # and used to compute the score, the predictions and the histogram
+        # of each variable, stored in the layout of the flat tables of the
+        # scorecard. Only per-record vectors are kept in memory.
+        scorecard = self.scorecard
+        points = scorecard._compiled_points
+        n_flat = len(points)
+
+        is_binary = scorecard._target_dtype == "binary"
+
+        counts = np.zeros(n_flat, dtype=np.int64)
+        l_y = []
+        l_score = []
+        l_pred = []
+        l_pred_proba = []
+
+        for chunk in _iter_chunks(data, name):
+            if columns is None:
+                columns = list(chunk.columns)
+            elif list(chunk.columns) != columns:
+                raise ValueError("Dataframes df_actual and df_expected must "
+                                 "have the same columns.")
+
+            indices = scorecard._compiled_indices(chunk, self.n_jobs)
+            counts += np.bincount(indices.ravel(), minlength=n_flat)
+
+            l_y.append(chunk[self.target].values)
+            l_score.append(points[indices].sum(axis=1))
+            l_pred.append(scorecard._compiled_predict(indices))
+
+            if is_binary:
+                l_pred_proba.append(
+                    scorecard._compiled_predict_proba(indices)[:, 1])
+
+        if not l_y:
+            raise ValueError("{} does not contain data.".format(name))
+
+        if l_pred_proba:
+            pred_proba = np.concatenate(l_pred_proba)
+        else:
+            pred_proba = None
+
+        return {
+            "columns": columns,
+            "counts": counts,
+            "y": np.concatenate(l_y),
+            "score": np.concatenate(l_score) + scorecard.intercept_,
+            "pred": np.concatenate(l_pred),
+            "pred_proba": pred_proba
+            }
+
+    def _fit_system(self, scan_actual, scan_expected):
         if self._target_dtype == "binary":
             problem_type = "classification"
         else:
             problem_type = "regression"
 
-        score_actual = self.scorecard.score(df_actual)
-        score_expected = self.scorecard.score(df_expected)
+        y_actual = scan_actual["y"]
+        y_expected = scan_expected["y"]
 
         prebinning = PreBinning(problem_type=problem_type,
                                 method=self.psi_method,
                                 n_bins=self.psi_n_bins,
                                 min_bin_size=self.psi_min_bin_size
-                                ).fit(score_expected, y_expected)
+                                ).fit(scan_expected["score"], y_expected)
 
         splits = prebinning.splits
         n_bins = len(splits) + 1
 
-        # Compute basic metrics
-        indices_a = np.digitize(score_actual, splits, right=True)
-        indices_e = np.digitize(score_expected, splits, right=True)
+        # Compute basic metrics. Bin i contains scores in
+        # (splits[i - 1], splits[i]].
+        indices_a = np.searchsorted(splits, scan_actual["score"], side="left")
+        indices_e = np.searchsorted(splits, scan_expected["score"],
+                                    side="left")
 
-        if self._target_dtype == "binary":
-            n_nonevent_a = np.empty(n_bins).astype(np.int64)
-            n_event_a = np.empty(n_bins).astype(np.int64)
-            n_nonevent_e = np.empty(n_bins).astype(np.int64)
-            n_event_e = np.empty(n_bins).astype(np.int64)
+        system_a = _system_counts(indices_a, y_actual, n_bins,
+                                  self._target_dtype)
+        system_e = _system_counts(indices_e, y_expected, n_bins,
+                                  self._target_dtype)
 
-            y0_a = (y_actual == 0)
-            y1_a = ~ y0_a
-
-            y0_e = (y_expected == 0)
-            y1_e = ~ y0_e
-
-            for i in range(n_bins):
-                mask_a = (indices_a == i)
-                n_nonevent_a[i] = np.count_nonzero(y0_a & mask_a)
-                n_event_a[i] = np.count_nonzero(y1_a & mask_a)
+        if self._target_dtype == "binary":
+            target_a = None
+            target_e = None
+        else:
+            target_a = _target_summary(y_actual)
+            target_e = _target_summary(y_expected)
 
-                mask_e = (indices_e == i)
-                n_nonevent_e[i] = np.count_nonzero(y0_e & mask_e)
-                n_event_e[i] = np.count_nonzero(y1_e & mask_e)
+        self._system_statistics(splits, system_a, system_e, target_a,
+                                target_e)
 
-            n_records_a = n_nonevent_a + n_event_a
-            n_records_e = n_nonevent_e + n_event_e
+        # Performance analysis
+        if self._target_dtype == "binary":
+            self._system_performance_binary(scan_actual, scan_expected)
         else:
-            n_records_a = np.empty(n_bins).astype(np.int64)
-            n_records_e = np.empty(n_bins).astype(np.int64)
-            mean_a = np.empty(n_bins)
-            mean_e = np.empty(n_bins)
-            std_a = np.empty(n_bins)
-            std_e = np.empty(n_bins)
-
-            for i in range(n_bins):
-                mask_a = (indices_a == i)
-                n_records_a[i] = np.count_nonzero(mask_a)
-                mean_a[i] = y_actual[mask_a].mean()
-                std_a[i] = y_actual[mask_a].std()
-
-                mask_e = (indices_e == i)
-                n_records_e[i] = np.count_nonzero(mask_e)
-                mean_e[i] = y_expected[mask_e].mean()
-                std_e[i] = y_expected[mask_e].std()
+            self._system_performance_continuous(scan_actual, scan_expected)
 
+    def _system_statistics(self, splits, system_a, system_e, target_a,
+                           target_e):
+        # Target analysis, PSI and significance tests from the statistics
+        # of each PSI bin. For continuous target, target_a and target_e are
+        # the mean, standard deviation and quartiles of the target.
         bins = np.concatenate([[-np.inf], splits, [np.inf]])
         bin_str = bin_str_format(bins, self.show_digits)
 
+        n_records_a = system_a["n_records"]
+        n_records_e = system_e["n_records"]
+
         # Target analysis
         if self._target_dtype == "binary":
-            self._system_target_binary(n_records_a, n_event_a, n_nonevent_a,
-                                       n_records_e, n_event_e, n_nonevent_e)
+            self._system_target_binary(
+                n_records_a, system_a["n_event"], system_a["n_nonevent"],
+                n_records_e, system_e["n_event"], system_e["n_nonevent"])
         else:
-            self._system_target_continuous(y_actual, y_expected)
+            self._system_target_continuous(target_a, target_e)
 
         # Population Stability Information (PSI)
         self._system_psi(bin_str, n_records_a, n_records_e)
@@ -560,19 +685,15 @@ class ScorecardMonitoring(BaseEstimator):
         # Significance tests
         if self._target_dtype == "binary":
             self._system_tests_binary(
-                bin_str, n_records_a, n_event_a, n_nonevent_a,
-                n_records_e, n_event_e, n_nonevent_e)
+                bin_str, n_records_a, system_a["n_event"],
+                system_a["n_nonevent"], n_records_e, system_e["n_event"],
+                system_e["n_nonevent"])
         else:
             self._system_tests_continuous(
-                bin_str, n_records_a, mean_a, std_a,
-                n_records_e, mean_e, std_e)
-
-        # Performance analysis
-        if self._target_dtype == "binary":
-            self._system_performance_binary(df_actual, df_expected)
-        else:
-            self._system_performance_continuous(df_actual, df_expected)
+                bin_str, n_records_a, system_a["mean"], system_a["std"],
+                n_records_e, system_e["mean"], system_e["std"])
 
+        self._splits = splits
         self._n_records_a = n_records_a
         self._n_records_e = n_records_e
 
@@ -690,32 +811,24 @@ class ScorecardMonitoring(BaseEstimator):
 
         self._df_target_analysis = df_target
 
-    def _system_target_continuous(self, y_actual, y_expected):
-
-        mean_a = y_actual.mean()
-        mean_e = y_expected.mean()
-        std_a = y_actual.std()
-        std_e = y_expected.std()
-
-        p25_a, median_a, p75_a = np.percentile(y_actual, [25, 50, 75])
-        p25_e, median_e, p75_e = np.percentile(y_expected, [25, 50, 75])
+    def _system_target_continuous(self, target_a, target_e):
 
         df_target = pd.DataFrame({
             "Metric": ["Mean", "Std", "p25", "Median", "p75"],
-            "Actual": [mean_a, std_a, p25_a, median_a, p75_a],
-            "Expected": [mean_e, std_e, p25_e, median_e, p75_e]
+            "Actual": target_a,
+            "Expected": target_e
             })
 
         self._df_target_analysis = df_target
 
-    def _system_performance_binary(self, df_actual, df_expected):
+    def _system_performance_binary(self, scan_actual, scan_expected):
         # Metrics derived from confusion matrix
-        y_true_a = df_actual[self.target]
-        y_pred_a = self.scorecard.predict(df_actual)
+        y_true_a = scan_actual["y"]
+        y_pred_a = scan_actual["pred"]
         d_metrics_a = imbalanced_classification_metrics(y_true_a, y_pred_a)
 
-        y_true_e = df_expected[self.target]
-        y_pred_e = self.scorecard.predict(df_expected)
+        y_true_e = scan_expected["y"]
+        y_pred_e = scan_expected["pred"]
         d_metrics_e = imbalanced_classification_metrics(y_true_e, y_pred_e)
 
         metric_names = list(d_metrics_a.keys())
@@ -723,11 +836,8 @@ class ScorecardMonitoring(BaseEstimator):
         metrics_e = list(d_metrics_e.values())
 
         # Gini
-        y_pred_proba_a = self.scorecard.predict_proba(df_actual)[:, 1]
-        gini_a = gini(y_true_a, y_pred_proba_a)
-
-        y_pred_proba_e = self.scorecard.predict_proba(df_expected)[:, 1]
-        gini_e = gini(y_true_e, y_pred_proba_e)
+        gini_a = gini(y_true_a, scan_actual["pred_proba"])
+        gini_e = gini(y_true_e, scan_expected["pred_proba"])
 
         metric_names.append("Gini")
         metrics_a.append(gini_a)
@@ -744,13 +854,13 @@ class ScorecardMonitoring(BaseEstimator):
 
         self._df_performance = df_performance
 
-    def _system_performance_continuous(self, df_actual, df_expected):
-        y_true_a = df_actual[self.target]
-        y_pred_a = self.scorecard.predict(df_actual)
+    def _system_performance_continuous(self, scan_actual, scan_expected):
+        y_true_a = scan_actual["y"]
+        y_pred_a = scan_actual["pred"]
         d_metrics_a = regression_metrics(y_true_a, y_pred_a)
 
-        y_true_e = df_expected[self.target]
-        y_pred_e = self.scorecard.predict(df_expected)
+        y_true_e = scan_expected["y"]
+        y_pred_e = scan_expected["pred"]
         d_metrics_e = regression_metrics(y_true_e, y_pred_e)
 
         metric_names = list(d_metrics_a.keys())
@@ -768,48 +878,58 @@ class ScorecardMonitoring(BaseEstimator):
 
         self._df_performance = df_performance
 
-    def _fit_variables(self, df_actual, df_expected):
-        variables = self.scorecard.binning_process_.get_support(names=True)
-        sc_table = self.scorecard.table()
-
-        l_df_psi = []
+    def _fit_variables(self, counts_a, counts_e):
+        # The histogram of each variable is a slice of the flat counts. Bins
+        # are truncated after the last non-empty bin of the expected data
+        # and unknown categories, stored at the last position, are
+        # discarded. PSI is computed for all variables at once.
+        scorecard = self.scorecard
+        bin_labels = scorecard.table()["Bin"].values
+
+        l_names = []
+        l_index = []
+        l_labels = []
+        l_counts_a = []
+        l_counts_e = []
+
+        label_offset = 0
+        for name, size, offset in zip(scorecard._compiled_variables,
+                                      scorecard._compiled_sizes,
+                                      scorecard._compiled_offsets):
+            records_e = counts_e[offset:offset + size - 1]
+            nonzero = np.flatnonzero(records_e)
+            n_bins = nonzero[-1] + 1 if len(nonzero) else 0
+
+            l_names.append(np.repeat(name, n_bins))
+            l_index.append(np.arange(n_bins))
+            l_labels.append(bin_labels[label_offset:label_offset + n_bins])
+            l_counts_a.append(counts_a[offset:offset + n_bins])
+            l_counts_e.append(records_e[:n_bins])
+
+            label_offset += size - 1
+
+        n_records_a = np.concatenate(l_counts_a)
+        n_records_e = np.concatenate(l_counts_e)
+
+        # Totals per variable, broadcast to bins
+        n_bins = [len(c) for c in l_counts_e]
+        t_n_records_a = np.repeat([c.sum() for c in l_counts_a], n_bins)
+        t_n_records_e = np.repeat([c.sum() for c in l_counts_e], n_bins)
 
-        for name in variables:
-            optb = self.scorecard.binning_process_.get_binned_variable(name)
-            ta = optb.transform(df_actual[name], metric="indices")
-            te = optb.transform(df_expected[name], metric="indices")
-
-            n_bins = te.max() + 1
-
-            n_records_a = np.empty(n_bins).astype(np.int64)
-            n_records_e = np.empty(n_bins).astype(np.int64)
-
-            for i in range(n_bins):
-                n_records_a[i] = np.count_nonzero(ta == i)
-                n_records_e[i] = np.count_nonzero(te == i)
-
-            t_n_records_a = n_records_a.sum()
-            t_n_records_e = n_records_e.sum()
-            p_records_a = n_records_a / t_n_records_a
-            p_records_e = n_records_e / t_n_records_e
-
-            psi = jeffrey(p_records_a, p_records_e, return_sum=False)
-            bins = sc_table[sc_table.Variable == name]["Bin"].values[:n_bins]
-
-            df_psi = pd.DataFrame({
-                "Variable": [name] * n_bins,
-                "Bin": bins,
-                "Count A": n_records_a,
-                "Count E": n_records_e,
-                "Count A (%)": p_records_a,
-                "Count E (%)": p_records_e,
-                "PSI": psi
-                })
+        p_records_a = n_records_a / t_n_records_a
+        p_records_e = n_records_e / t_n_records_e
 
-            l_df_psi.append(df_psi)
+        psi = jeffrey(p_records_a, p_records_e, return_sum=False)
 
-        self._df_psi_variable = pd.concat(l_df_psi)
-        self._df_psi_variable.reset_index()
+        self._df_psi_variable = pd.DataFrame({
+            "Variable": np.concatenate(l_names),
+            "Bin": np.concatenate(l_labels),
+            "Count A": n_records_a,
+            "Count E": n_records_e,
+            "Count A (%)": p_records_a,
+            "Count E (%)": p_records_e,
+            "PSI": psi
+            }, index=np.concatenate(l_index))
 
     def _check_is_fitted(self):
         if not self._is_fitted:
@@ -827,4 +947,4 @@ class ScorecardMonitoring(BaseEstimator):
         """
         self._check_is_fitted()
 
-        self._splits
+        return self._splits
@@ -0,0 +1,551 @@
+"""
+Scorecard monitoring over time partitions.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numbers
+import time
+
+import numpy as np
+
+from sklearn.base import BaseEstimator
+from sklearn.exceptions import NotFittedError
+from sklearn.utils.multiclass import type_of_target
+
+from ..binning.distributed.gk import GK
+from ..binning.distributed.serialization import pack
+from ..binning.distributed.serialization import unpack
+from ..binning.prebinning import PreBinning
+from ..logging import Logger
+from .monitoring import _check_parameters as _check_monitoring_parameters
+from .monitoring import _iter_chunks
+from .monitoring import _target_summary
+from .monitoring import ScorecardMonitoring
+
+
+def _check_parameters(target, scorecard, psi_method, psi_n_bins,
+                      psi_min_bin_size, show_digits, eps, n_jobs, verbose):
+
+    _check_monitoring_parameters(target, scorecard, psi_method, psi_n_bins,
+                                 psi_min_bin_size, show_digits, n_jobs,
+                                 verbose)
+
+    if not isinstance(eps, numbers.Number) or not 0 < eps <= 1:
+        raise ValueError("eps must be a value in (0, 1]; got {}."
+                         .format(eps))
+
+
+def _check_partition(partition):
+    # Partition keys are stored in the JSON header of the serialized state
+    if not isinstance(partition, (str, numbers.Integral)):
+        raise TypeError("partition must be a string or an integer; got {}."
+                        .format(type(partition).__name__))
+
+
+class ScorecardMonitoringAccumulator(BaseEstimator):
+    """Incremental scorecard monitoring over time partitions.
+
+    The accumulator stores the statistics of the expected data and of each
+    partition of actual data, e.g., a day: the number of records and the
+    target statistics at each PSI bin of the score, and the number of
+    records at each bin of the scorecard variables. The monitoring of a
+    window of partitions is computed by summing the stored statistics, thus
+    adding new data only requires processing the new records.
+
+    .. versionadded:: 0.7.1
+
+    Parameters
+    ----------
+    target : str
+        Target column.
+
+    scorecard : object
+        A ``Scorecard`` fitted instance.
+
+    psi_method : str, optional (default="cart")
+        The binning method to compute the Population Stability Index (PSI).
+        See :class:`ScorecardMonitoring`.
+
+    psi_n_bins : int (default=20)
+        The maximum number of bins to compute PSI.
+
+    psi_min_bin_size : float (default=0.05)
+        The fraction of mininum number of records for PSI bin.
+
+    show_digits : int, optional (default=2)
+        The number of significant digits of the bin column.
+
+    eps : float, optional (default=1e-3)
+        Relative error epsilon of the quantile sketch used to compute the
+        quartiles of a continuous target.
+
+    n_jobs : int or None, optional (default=None)
+        Number of threads used to compute the bin indices of the scorecard
+        variables of each chunk of data. None means 1 and -1 means using
+        all processors.
+
+    verbose : bool (default=False)
+        Enable verbose output.
+
+    Notes
+    -----
+    Performance metrics require the predictions of each record, therefore
+    these are not included in the window monitoring. The quartiles of a
+    continuous target are approximated using the Greenwald-Khanna's
+    sketch of each partition.
+    """
+    def __init__(self, target, scorecard, psi_method="cart", psi_n_bins=20,
+                 psi_min_bin_size=0.05, show_digits=2, eps=1e-3,
+                 n_jobs=None, verbose=False):
+
+        self.target = target
+        self.scorecard = scorecard
+
+        self.psi_method = psi_method
+        self.psi_n_bins = psi_n_bins
+        self.psi_min_bin_size = psi_min_bin_size
+
+        self.show_digits = show_digits
+        self.eps = eps
+        self.n_jobs = n_jobs
+        self.verbose = verbose
+
+        # auxiliary data
+        self._target_dtype = None
+        self._splits = None
+        self._shift = 0
+        self._expected = None
+        self._target_expected = None
+        self._partitions = {}
+
+        # logger
+        self._class_logger = Logger(__name__)
+        self._logger = self._class_logger.logger
+
+        # flags
+        self._is_fitted = False
+
+    def fit(self, df_expected):
+        """Fit the PSI bins and the statistics of the expected data.
+
+        Parameters
+        ----------
+        df_expected : pandas.DataFrame or iterable of pandas.DataFrame
+            Trainning data used for fitting the scorecard.
+
+        Returns
+        -------
+        self : object
+            Fitted accumulator.
+        """
+        time_init = time.perf_counter()
+
+        # Check parameters
+        _check_parameters(**self.get_params(deep=False))
+
+        # Check if scorecard is fitted
+        self.scorecard._check_is_fitted()
+
+        l_y = []
+        l_score = []
+        counts = np.zeros(len(self.scorecard._compiled_points),
+                          dtype=np.int64)
+
+        for chunk, indices, score in self._iter_scores(df_expected,
+                                                       "df_expected"):
+            counts += np.bincount(indices.ravel(), minlength=len(counts))
+            l_y.append(chunk[self.target].values)
+            l_score.append(score)
+
+        if not l_y:
+            raise ValueError("df_expected does not contain data.")
+
+        y = np.concatenate(l_y)
+        score = np.concatenate(l_score)
+
+        target_dtype = type_of_target(y)
+
+        if target_dtype not in ("binary", "continuous"):
+            raise ValueError("Target type {} is not supported."
+                             .format(target_dtype))
+
+        if target_dtype == "binary":
+            problem_type = "classification"
+        else:
+            problem_type = "regression"
+
+        prebinning = PreBinning(problem_type=problem_type,
+                                method=self.psi_method,
+                                n_bins=self.psi_n_bins,
+                                min_bin_size=self.psi_min_bin_size
+                                ).fit(score, y)
+
+        self._target_dtype = target_dtype
+        self._splits = prebinning.splits
+
+        # Target sums of continuous target are shifted by the expected mean
+        # to reduce cancellation when computing standard deviations.
+        if target_dtype == "continuous":
+            self._shift = float(y.mean())
+            self._target_expected = _target_summary(y)
+
+        self._expected = self._new_state(sketch=False)
+        self._expected["counts"] = counts
+        self._update_state(self._expected, score, y)
+
+        self._partitions = {}
+
+        if self.verbose:
+            self._logger.info("Accumulator fitted. Time: {:.4f}s"
+                              .format(time.perf_counter() - time_init))
+
+        self._is_fitted = True
+
+        return self
+
+    def add(self, df_actual, partition):
+        """Add actual data to a partition.
+
+        If the partition exists, the statistics of the new data are added
+        to the stored statistics.
+
+        Parameters
+        ----------
+        df_actual : pandas.DataFrame or iterable of pandas.DataFrame
+            Actual input samples, including the target column.
+
+        partition : str or int
+            The partition key, e.g., a date.
+
+        Returns
+        -------
+        self : object
+        """
+        self._check_is_fitted()
+        _check_partition(partition)
+
+        time_init = time.perf_counter()
+
+        state = self._partitions.get(partition)
+        if state is None:
+            state = self._new_state()
+
+        counts = state["counts"]
+        n_records = 0
+
+        for chunk, indices, score in self._iter_scores(df_actual,
+                                                       "df_actual"):
+            counts += np.bincount(indices.ravel(), minlength=len(counts))
+            self._update_state(state, score, chunk[self.target].values)
+            n_records += len(score)
+
+        self._partitions[partition] = state
+
+        if self.verbose:
+            self._logger.info("Partition {}: added {} records. Time: {:.4f}s"
+                              .format(partition, n_records,
+                                      time.perf_counter() - time_init))
+
+        return self
+
+    def remove(self, partition):
+        """Remove a partition.
+
+        Parameters
+        ----------
+        partition : str or int
+            The partition key.
+        """
+        self._check_is_fitted()
+
+        if partition not in self._partitions:
+            raise ValueError("partition {} does not exist."
+                             .format(partition))
+
+        del self._partitions[partition]
+
+    def monitoring(self, partitions=None):
+        """Scorecard monitoring of a window of partitions with respect to
+        the expected data.
+
+        Parameters
+        ----------
+        partitions : array-like or None (default=None)
+            The partition keys of the window. If None, all partitions are
+            included.
+
+        Returns
+        -------
+        monitoring : ScorecardMonitoring
+            Fitted monitoring, without performance metrics.
+        """
+        self._check_is_fitted()
+
+        time_init = time.perf_counter()
+
+        if partitions is None:
+            partitions = self.partitions
+
+        if not len(partitions):
+            raise ValueError("partitions must include at least one "
+                             "partition.")
+
+        for partition in partitions:
+            if partition not in self._partitions:
+                raise ValueError("partition {} does not exist."
+                                 .format(partition))
+
+        states = [self._partitions[partition] for partition in partitions]
+        window = {key: sum(state[key] for state in states)
+                  for key in states[0] if key != "gk"}
+
+        if self._target_dtype == "continuous":
+            gk = GK(self.eps)
+            for state in states:
+                gk.merge(state["gk"])
+
+            target_a = self._target_summary_state(window, gk)
+        else:
+            target_a = None
+
+        monitoring = ScorecardMonitoring(
+            target=self.target, scorecard=self.scorecard,
+            psi_method=self.psi_method, psi_n_bins=self.psi_n_bins,
+            psi_min_bin_size=self.psi_min_bin_size,
+            show_digits=self.show_digits, n_jobs=self.n_jobs,
+            verbose=self.verbose)
+
+        monitoring._target_dtype = self._target_dtype
+
+        time_system = time.perf_counter()
+        monitoring._system_statistics(
+            self._splits, self._system_state(window),
+            self._system_state(self._expected), target_a,
+            self._target_expected)
+        monitoring._df_performance = None
+        monitoring._time_system = time.perf_counter() - time_system
+
+        time_variable = time.perf_counter()
+        monitoring._fit_variables(window["counts"], self._expected["counts"])
+        monitoring._time_variable = time.perf_counter() - time_variable
+
+        monitoring._time_total = time.perf_counter() - time_init
+        monitoring._is_fitted = True
+
+        return monitoring
+
+    def to_bytes(self):
+        """Serialize the accumulator state to a compact binary format. The
+        scorecard is not included.
+
+        Returns
+        -------
+        data : bytes
+        """
+        self._check_is_fitted()
+
+        params = self.get_params(deep=False)
+        del params["scorecard"]
+
+        partitions = self.partitions
+        states = [self._partitions[partition] for partition in partitions]
+
+        arrays = {"splits": self._splits}
+        for key, array in self._expected.items():
+            if key != "gk":
+                arrays["expected_" + key] = array
+
+                # Partition states are stacked, one row per partition
+                arrays["partitions_" + key] = np.array(
+                    [state[key] for state in states], dtype=array.dtype
+                    ).reshape((len(states),) + array.shape)
+
+        metadata_gk = []
+        for i, state in enumerate(states):
+            if "gk" in state:
+                metadata, state_arrays = state["gk"]._get_state(
+                    "gk{}_".format(i))
+                metadata_gk.append(metadata)
+                arrays.update(state_arrays)
+
+        metadata = {
+            "params": params,
+            "variables": list(self.scorecard._compiled_variables),
+            "target_dtype": self._target_dtype,
+            "shift": self._shift,
+            "target_expected": self._target_expected,
+            "partitions": partitions,
+            "gk": metadata_gk
+            }
+
+        return pack("ScorecardMonitoringAccumulator", metadata, arrays)
+
+    @classmethod
+    def from_bytes(cls, data, scorecard):
+        """Load accumulator from bytes generated by :meth:`to_bytes`.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized accumulator.
+
+        scorecard : object
+            The ``Scorecard`` fitted instance used by the serialized
+            accumulator.
+
+        Returns
+        -------
+        accumulator : ScorecardMonitoringAccumulator
+        """
+        metadata, arrays = unpack(data, "ScorecardMonitoringAccumulator")
+
+        accumulator = cls(scorecard=scorecard, **metadata["params"])
+        _check_parameters(**accumulator.get_params(deep=False))
+        scorecard._check_is_fitted()
+
+        if (metadata["variables"] != list(scorecard._compiled_variables) or
+                len(arrays["expected_counts"]) != len(
+                    scorecard._compiled_points)):
+            raise ValueError("scorecard does not match the serialized "
+                             "accumulator.")
+
+        accumulator._target_dtype = metadata["target_dtype"]
+        accumulator._shift = metadata["shift"]
+        accumulator._target_expected = metadata["target_expected"]
+        accumulator._splits = np.array(arrays["splits"])
+
+        keys = [name[len("expected_"):] for name in arrays
+                if name.startswith("expected_")]
+
+        accumulator._expected = {
+            key: np.array(arrays["expected_" + key]) for key in keys}
+
+        for i, partition in enumerate(metadata["partitions"]):
+            state = {key: np.array(arrays["partitions_" + key][i])
+                     for key in keys}
+
+            if accumulator._target_dtype == "continuous":
+                gk = GK(accumulator.eps)
+                gk._set_state(metadata["gk"][i], arrays, "gk{}_".format(i))
+                state["gk"] = gk
+
+            accumulator._partitions[partition] = state
+
+        accumulator._is_fitted = True
+
+        return accumulator
+
+    @property
+    def partitions(self):
+        """List of partition keys.
+
+        Returns
+        -------
+        partitions : list
+        """
+        self._check_is_fitted()
+
+        return list(self._partitions)
+
+    @property
+    def psi_splits(self):
+        """List of splits points used to compute system PSI.
+
+        Returns
+        -------
+        splits : numpy.ndarray
+        """
+        self._check_is_fitted()
+
+        return self._splits
+
+    def _iter_scores(self, data, name):
+        # Chunks, bin indices of the scorecard variables and scores
+        scorecard = self.scorecard
+        points = scorecard._compiled_points
+
+        for chunk in _iter_chunks(data, name):
+            indices = scorecard._compiled_indices(chunk, self.n_jobs)
+            score = points[indices].sum(axis=1) + scorecard.intercept_
+
+            yield chunk, indices, score
+
+    def _new_state(self, sketch=True):
+        n_bins = len(self._splits) + 1
+
+        state = {
+            "n_records": np.zeros(n_bins, dtype=np.int64),
+            "counts": np.zeros(len(self.scorecard._compiled_points),
+                               dtype=np.int64)
+            }
+
+        if self._target_dtype == "binary":
+            state["n_event"] = np.zeros(n_bins, dtype=np.int64)
+        else:
+            state["sum"] = np.zeros(n_bins)
+            state["sum_sq"] = np.zeros(n_bins)
+
+            if sketch:
+                state["gk"] = GK(self.eps)
+
+        return state
+
+    def _update_state(self, state, score, y):
+        # Bin i contains scores in (splits[i - 1], splits[i]]
+        n_bins = len(self._splits) + 1
+        indices = np.searchsorted(self._splits, score, side="left")
+
+        state["n_records"] += np.bincount(indices, minlength=n_bins)
+
+        if self._target_dtype == "binary":
+            state["n_event"] += np.bincount(indices[y != 0],
+                                            minlength=n_bins)
+        else:
+            y_shift = y - self._shift
+            state["sum"] += np.bincount(indices, weights=y_shift,
+                                        minlength=n_bins)
+            state["sum_sq"] += np.bincount(indices, weights=y_shift ** 2,
+                                           minlength=n_bins)
+
+            if "gk" in state:
+                state["gk"].add_batch(y)
+
+    def _system_state(self, state):
+        # Statistics at each PSI bin in the format of _system_counts
+        n_records = state["n_records"]
+
+        if self._target_dtype == "binary":
+            return {"n_records": n_records, "n_event": state["n_event"],
+                    "n_nonevent": n_records - state["n_event"]}
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = state["sum"] / n_records
+            var = (state["sum_sq"] - state["sum"] * mean) / (n_records - 1)
+            std = np.sqrt(np.maximum(var, 0))
+
+        return {"n_records": n_records, "mean": mean + self._shift,
+                "std": std}
+
+    def _target_summary_state(self, state, gk):
+        # Mean, standard deviation and approximate quartiles of the target
+        n = state["n_records"].sum()
+        t_sum = state["sum"].sum()
+        mean = t_sum / n
+
+        if n > 1:
+            std = np.sqrt(max(state["sum_sq"].sum() - t_sum * mean, 0) /
+                          (n - 1))
+        else:
+            std = np.nan
+
+        quartiles = [gk.quantile(q) for q in (0.25, 0.5, 0.75)]
+
+        return [mean + self._shift, std] + quartiles
+
+    def _check_is_fitted(self):
+        if not self._is_fitted:
+            raise NotFittedError("This {} instance is not fitted yet. Call "
+                                 "'fit' with appropriate arguments."
+                                 .format(self.__class__.__name__))
@@ -16,6 +16,7 @@ scorecard_monitoring_default_options = {
     "psi_n_bins": 20,
     "psi_min_bin_size": 0.05,
     "show_digits": 2,
+    "n_jobs": None,
     "verbose": False
 }
 
@@ -7,8 +7,6 @@ Rounding strategy.
 
 import numpy as np
 
-from ortools.linear_solver import pywraplp
-
 
 class RoundingMIP:
     def __init__(self):
@@ -19,6 +17,8 @@ class RoundingMIP:
         self._p = None
 
     def build_model(self, df_scorecard):
+        from ortools.linear_solver import pywraplp
+
         # Parameters
         points = []
         mins = []
@@ -82,6 +82,8 @@ class RoundingMIP:
         self._p = p
 
     def solve(self):
+        from ortools.linear_solver import pywraplp
+
         status = self.solver_.Solve()
 
         if status in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
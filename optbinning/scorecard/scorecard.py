@@ -9,17 +9,22 @@ import numbers
 import pickle
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
+from scipy import special
 from sklearn.base import BaseEstimator
 from sklearn.base import clone
 from sklearn.exceptions import NotFittedError
 from sklearn.utils.multiclass import type_of_target
 
+from ..binning.binning_process import _effective_n_jobs
+from ..binning.binning_process import _metric_table
 from ..binning.binning_process import BinningProcess
 from ..logging import Logger
-from .rounding import RoundingMIP
+from ..scoring import write_artifact
 from .scorecard_information import print_scorecard_information
 
 
@@ -329,9 +334,7 @@ class Scorecard(BaseEstimator):
         """
         self._check_is_fitted()
 
-        df_t = df[self.binning_process_.variable_names]
-        df_t = self.binning_process_.transform(df_t)
-        return self.estimator_.predict(df_t)
+        return self._compiled_predict(self._compiled_indices(df))
 
     def predict_proba(self, df):
         """Predict class probabilities using the fitted underlying estimator
@@ -349,9 +352,7 @@ class Scorecard(BaseEstimator):
         """
         self._check_is_fitted()
 
-        df_t = df[self.binning_process_.variable_names]
-        df_t = self.binning_process_.transform(df_t)
-        return self.estimator_.predict_proba(df_t)
+        return self._compiled_predict_proba(self._compiled_indices(df))
 
     def score(self, df):
         """Score of the dataset.
@@ -368,19 +369,68 @@ class Scorecard(BaseEstimator):
         """
         self._check_is_fitted()
 
-        df_t = df[self.binning_process_.variable_names]
-        df_t = self.binning_process_.transform(df_t, metric="indices")
+        indices = self._compiled_indices(df)
 
-        score_ = np.zeros(df_t.shape[0])
-        selected_variables = self.binning_process_.get_support(names=True)
+        return self._compiled_points[indices].sum(axis=1) + self.intercept_
 
-        for variable in selected_variables:
-            mask = self._df_scorecard.Variable == variable
-            points = self._df_scorecard[mask].Points.values
-            score_ += points[df_t[variable]]
+    def score_record(self, record):
+        """Score of a single record.
+
+        The record is scored with Python data structures compiled at fit
+        time, avoiding the overhead of pandas and NumPy for online scoring.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        record : dict
+            Mapping from variable name to value. Variables not present in
+            the record are considered missing values.
+
+        Returns
+        -------
+        score : float
+            The score of the record.
+        """
+        self._check_is_fitted()
+
+        score_ = 0.0
+        for variable, plan, points in self._compiled_records:
+            score_ += points[plan.index(record.get(variable))]
 
         return score_ + self.intercept_
 
+    def score_records(self, records):
+        """Score of a list of records.
+
+        See :meth:`score_record`. For large batches use :meth:`score`.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        records : list of dict
+            List of records mapping from variable name to value.
+
+        Returns
+        -------
+        score: array of shape (n_records)
+            The score of the records.
+        """
+        self._check_is_fitted()
+
+        n_records = len(records)
+        score_ = np.empty(n_records)
+
+        for i, record in enumerate(records):
+            s = 0.0
+            for variable, plan, points in self._compiled_records:
+                s += points[plan.index(record.get(variable))]
+
+            score_[i] = s + self.intercept_
+
+        return score_
+
     def table(self, style="summary"):
         """Scorecard table.
 
@@ -447,6 +497,51 @@ class Scorecard(BaseEstimator):
         with open(path, "wb") as f:
             pickle.dump(self, f)
 
+    def export(self, path):
+        """Export scorecard to a lightweight JSON artifact.
+
+        The artifact contains the split points or categories, special codes
+        and points of each selected variable, and the coefficients of the
+        estimator if it is a linear or logistic regression. Load it with
+        :func:`optbinning.scoring.load_artifact` to score data using NumPy
+        only.
+
+        .. versionadded:: 0.7.1
+
+        Parameters
+        ----------
+        path : str
+            JSON file path.
+        """
+        self._check_is_fitted()
+
+        variables = []
+        for j, (variable, plan, points) in enumerate(self._compiled_records):
+            start = self._compiled_offsets[j]
+            stop = start + self._compiled_sizes[j]
+
+            variables.append({"name": variable, "plan": plan.to_dict(),
+                              "points": points,
+                              "values": self._compiled_metrics[start:stop]})
+
+        if self._compiled_linear is None:
+            model = None
+        else:
+            model = {"coefficients": self._compiled_coefs,
+                     "intercept": self._compiled_intercept}
+
+            if self._target_dtype == "binary":
+                model["classes"] = self.estimator_.classes_
+
+        artifact = {
+            "variable_names": list(self.binning_process_.variable_names),
+            "target_dtype": self._target_dtype,
+            "intercept": self.intercept_,
+            "variables": variables,
+            "model": model}
+
+        write_artifact(path, "scorecard", artifact)
+
     def _fit(self, df, metric_special, metric_missing, show_digits,
              check_input):
 
@@ -566,6 +661,8 @@ class Scorecard(BaseEstimator):
             if self.scaling_method == "pdo_odds":
                 round_points = np.rint(points)
             elif self.scaling_method == "min_max":
+                from .rounding import RoundingMIP
+
                 round_mip = RoundingMIP()
                 round_mip.build_model(df_scorecard)
                 status, round_points = round_mip.solve()
@@ -582,6 +679,8 @@ class Scorecard(BaseEstimator):
 
         self._df_scorecard = df_scorecard
 
+        self._compile(coefs, intercept)
+
         self._time_build_scorecard = time.perf_counter() - time_build_scorecard
         self._time_total = time.perf_counter() - time_init
 
@@ -597,6 +696,150 @@ class Scorecard(BaseEstimator):
 
         return self
 
+    def _compile(self, coefs, intercept):
+        # Compile the bin lookup plans of the selected variables and flat
+        # lookup tables of points and transformed values. The table of the
+        # j-th variable starts at offsets[j] and contains n_bins + 3 values:
+        # clean bins, special, missing and unknown categories. Scoring is a
+        # single gather and sum over the table positions.
+        selected_variables = self.binning_process_.get_support(names=True)
+
+        transform_params = self.binning_process_.binning_transform_params
+        if transform_params is None:
+            transform_params = {}
+
+        plans = []
+        points = []
+        metrics = []
+        for variable in selected_variables:
+            optb = self.binning_process_.get_binned_variable(variable)
+            plan = optb._get_transform_plan()
+
+            # Unknown categories (index -1) are assigned the points of the
+            # missing bin, the last row of the variable binning table.
+            mask = (self._df_scorecard.Variable == variable).values
+            var_points = self._df_scorecard.Points.values[mask]
+            points.append(np.append(var_points, var_points[-1]))
+
+            # Transformed values as used by the estimator
+            params = transform_params.get(variable, {})
+            metric_special = params.get("metric_special", 0)
+            metric_missing = params.get("metric_missing", 0)
+
+            if self._target_dtype == "binary":
+                metric = "woe"
+            else:
+                metric = "mean"
+
+            table = _metric_table(optb, self._target_dtype, metric,
+                                  metric_special, metric_missing)
+
+            plans.append(plan)
+            metrics.append(table)
+
+        sizes = np.array([len(table) for table in metrics], dtype=np.int64)
+
+        self._compiled_variables = selected_variables
+        self._compiled_plans = plans
+        self._compiled_sizes = sizes
+        self._compiled_offsets = np.cumsum(sizes) - sizes
+
+        # Python lists for single record scoring
+        self._compiled_records = [
+            (variable, plan, var_points.astype(float).tolist())
+            for variable, plan, var_points in zip(selected_variables, plans,
+                                                  points)]
+
+        if plans:
+            self._compiled_points = np.concatenate(points).astype(float)
+            self._compiled_metrics = np.concatenate(metrics)
+        else:
+            self._compiled_points = np.zeros(0)
+            self._compiled_metrics = np.zeros(0)
+
+        # Linear models are evaluated as a gather and sum of the transformed
+        # values times the coefficients.
+        from sklearn.linear_model import LinearRegression
+        from sklearn.linear_model import LogisticRegression
+
+        estimator = self.estimator_
+        if self._target_dtype == "binary":
+            is_linear = (type(estimator) is LogisticRegression and
+                         len(estimator.classes_) == 2 and
+                         estimator.multi_class != "multinomial")
+        else:
+            is_linear = type(estimator) is LinearRegression
+
+        self._compiled_coefs = coefs.ravel()
+
+        if is_linear:
+            self._compiled_linear = self._compiled_metrics * np.repeat(
+                self._compiled_coefs, sizes)
+            self._compiled_intercept = float(np.ravel(intercept)[0])
+        else:
+            self._compiled_linear = None
+            self._compiled_intercept = 0
+
+    def _compiled_indices(self, df, n_jobs=None):
+        # Position of each sample and selected variable in the flat tables.
+        # With n_jobs > 1, groups of variables are processed by threads
+        # writing to disjoint columns.
+        n_samples = df.shape[0]
+        n_variables = len(self._compiled_plans)
+
+        indices = np.empty((n_samples, n_variables), dtype=np.int64)
+
+        n_jobs = min(_effective_n_jobs(n_jobs), n_variables)
+
+        if n_jobs <= 1:
+            self._compiled_indices_block(df, indices, range(n_variables))
+        else:
+            groups = np.array_split(np.arange(n_variables), n_jobs)
+
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [executor.submit(self._compiled_indices_block, df,
+                                           indices, group)
+                           for group in groups]
+
+                for future in futures:
+                    future.result()
+
+        return indices
+
+    def _compiled_indices_block(self, df, indices, group):
+        for j in group:
+            plan = self._compiled_plans[j]
+            idx = plan.indices(df[self._compiled_variables[j]].values)
+            np.remainder(idx, self._compiled_sizes[j], out=indices[:, j])
+            indices[:, j] += self._compiled_offsets[j]
+
+    def _compiled_predict(self, indices):
+        if self._compiled_linear is not None:
+            y_pred = self._compiled_linear[indices].sum(axis=1)
+            y_pred += self._compiled_intercept
+
+            if self._target_dtype == "binary":
+                return self.estimator_.classes_[(y_pred > 0).astype(int)]
+
+            return y_pred
+
+        return self.estimator_.predict(self._compiled_transform(indices))
+
+    def _compiled_predict_proba(self, indices):
+        if (self._compiled_linear is not None and
+                self._target_dtype == "binary"):
+            z = self._compiled_linear[indices].sum(axis=1)
+            p = special.expit(z + self._compiled_intercept)
+            return np.column_stack((1 - p, p))
+
+        return self.estimator_.predict_proba(
+            self._compiled_transform(indices))
+
+    def _compiled_transform(self, indices):
+        # Transformed dataset for estimators other than linear models
+        return pd.DataFrame(self._compiled_metrics[indices],
+                            columns=self._compiled_variables)
+
     def _check_is_fitted(self):
         if not self._is_fitted:
             raise NotFittedError("This {} instance is not fitted yet. Call "
@@ -0,0 +1,353 @@
+"""
+Lightweight scoring artifacts.
+
+A fitted :class:`Scorecard` or :class:`BinningProcess` can be exported to a
+versioned JSON artifact holding the split points, categories, special and
+missing values handling and lookup tables of the selected variables. This
+module loads and evaluates artifacts using NumPy only. It does not depend on
+any other optbinning module, thus it can be copied as a single file to
+scoring environments.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import json
+
+import numpy as np
+
+
+ARTIFACT_FORMAT = "optbinning-artifact"
+
+ARTIFACT_VERSION = 1
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+
+    raise TypeError("Object of type {} is not JSON serializable."
+                    .format(type(obj).__name__))
+
+
+def write_artifact(path, kind, artifact):
+    """Write artifact to a JSON file.
+
+    Parameters
+    ----------
+    path : str
+        JSON file path.
+
+    kind : str
+        The type of the exported object, "scorecard" or "binning_process".
+
+    artifact : dict
+        JSON serializable artifact content.
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be a string.")
+
+    content = {"format": ARTIFACT_FORMAT, "version": ARTIFACT_VERSION,
+               "kind": kind}
+    content.update(artifact)
+
+    with open(path, "w") as f:
+        json.dump(content, f, default=_json_default)
+
+
+def load_artifact(path):
+    """Load artifact exported by :meth:`Scorecard.export` or
+    :meth:`BinningProcess.export`.
+
+    Parameters
+    ----------
+    path : str
+        JSON file path.
+
+    Returns
+    -------
+    artifact : ScorecardArtifact or BinningProcessArtifact
+    """
+    if not isinstance(path, str):
+        raise TypeError("path must be a string.")
+
+    with open(path, "r") as f:
+        content = json.load(f)
+
+    if not isinstance(content, dict) or (
+            content.get("format") != ARTIFACT_FORMAT):
+        raise ValueError("{} is not an optbinning artifact.".format(path))
+
+    if content["version"] > ARTIFACT_VERSION:
+        raise ValueError("Unsupported artifact version {}; maximum supported "
+                         "version is {}.".format(content["version"],
+                                                 ARTIFACT_VERSION))
+
+    if content["kind"] == "scorecard":
+        return ScorecardArtifact(content)
+    elif content["kind"] == "binning_process":
+        return BinningProcessArtifact(content)
+
+    raise ValueError("Unsupported artifact kind {}.".format(content["kind"]))
+
+
+class _ArtifactPlan:
+    # NumPy only counterpart of TransformPlan.indices: clean values are
+    # assigned indices in [0, n_bins), special codes n_bins, missing values
+    # n_bins + 1 and unknown categories -1.
+    def __init__(self, plan):
+        self.dtype = plan["dtype"]
+        self.n_bins = plan["n_bins"]
+
+        special_codes = plan["special_codes"]
+        if special_codes is None:
+            self.special_codes = None
+        else:
+            self.special_codes = np.asarray(special_codes)
+            self._special_set = frozenset(special_codes)
+
+        if self.dtype == "numerical":
+            self.splits = np.asarray(plan["splits"], dtype=float)
+        else:
+            self._category_map = {
+                category: i for i, categories in enumerate(plan["bins"])
+                for category in categories}
+
+    def indices(self, x):
+        x = np.asarray(x)
+        n_samples = len(x)
+
+        if x.dtype.kind == "f":
+            missing_mask = np.isnan(x)
+        elif x.dtype.kind == "O":
+            missing_mask = np.fromiter((v is None or v != v for v in x),
+                                       dtype=bool, count=n_samples)
+        else:
+            missing_mask = np.zeros(n_samples, dtype=bool)
+
+        if self.special_codes is None:
+            special_mask = None
+            clean_mask = ~missing_mask
+        else:
+            if x.dtype.kind in "biuf" and self.special_codes.dtype.kind in (
+                    "biuf"):
+                special_mask = np.isin(x, self.special_codes)
+            else:
+                special_mask = np.fromiter(
+                    (v in self._special_set for v in x), dtype=bool,
+                    count=n_samples)
+            clean_mask = ~missing_mask & ~special_mask
+
+        indices = np.full(n_samples, -1, dtype=np.int64)
+
+        if self.dtype == "numerical":
+            indices[clean_mask] = np.searchsorted(
+                self.splits, x[clean_mask].astype(float), side="right")
+        else:
+            x_clean = x[clean_mask]
+            indices[clean_mask] = np.fromiter(
+                (self._category_map.get(v, -1) for v in x_clean),
+                dtype=np.int64, count=len(x_clean))
+
+        if special_mask is not None:
+            indices[special_mask] = self.n_bins
+
+        indices[missing_mask] = self.n_bins + 1
+
+        return indices
+
+
+class _Artifact:
+    def __init__(self, content):
+        self.variable_names = content["variable_names"]
+        self.selected_variables = [
+            variable["name"] for variable in content["variables"]]
+
+        self._plans = [_ArtifactPlan(variable["plan"])
+                       for variable in content["variables"]]
+
+        self._positions = {name: i for i, name in
+                           enumerate(self.variable_names)}
+
+    def _column(self, X, name):
+        if isinstance(X, np.ndarray):
+            return X[:, self._positions[name]]
+
+        return np.asarray(X[name])
+
+    def _indices(self, X):
+        # Position of each sample and selected variable in the flat tables
+        if isinstance(X, np.ndarray) and X.ndim != 2:
+            raise ValueError("X must be a 2-dimensional array.")
+
+        columns = [self._column(X, name) for name in self.selected_variables]
+
+        if columns:
+            n_samples = len(columns[0])
+        elif isinstance(X, np.ndarray):
+            n_samples = X.shape[0]
+        else:
+            n_samples = len(X[self.variable_names[0]])
+
+        indices = np.empty((n_samples, len(columns)), dtype=np.int64)
+
+        for j, (x, plan) in enumerate(zip(columns, self._plans)):
+            np.remainder(plan.indices(x), self._sizes[j], out=indices[:, j])
+            indices[:, j] += self._offsets[j]
+
+        return indices
+
+    @staticmethod
+    def _flat_table(tables):
+        sizes = np.array([len(table) for table in tables], dtype=np.int64)
+        offsets = np.cumsum(sizes) - sizes
+
+        if tables:
+            flat = np.concatenate([np.asarray(table, dtype=float)
+                                   for table in tables])
+        else:
+            flat = np.zeros(0)
+
+        return flat, sizes, offsets
+
+
+class ScorecardArtifact(_Artifact):
+    """Scorecard loaded from an artifact exported by
+    :meth:`Scorecard.export`.
+
+    Input data ``X`` is a mapping from variable name to array, such as a
+    dictionary or a pandas.DataFrame, or a 2-dimensional array with columns
+    ordered as ``variable_names``.
+
+    Parameters
+    ----------
+    content : dict
+        Artifact content.
+    """
+    def __init__(self, content):
+        super().__init__(content)
+
+        self.target_dtype = content["target_dtype"]
+        self.intercept = content["intercept"]
+
+        variables = content["variables"]
+        self._points, self._sizes, self._offsets = self._flat_table(
+            [variable["points"] for variable in variables])
+
+        model = content["model"]
+        if model is None:
+            self._linear = None
+            self._linear_intercept = 0
+        else:
+            self._linear, _, _ = self._flat_table(
+                [np.asarray(variable["values"]) * coef for variable, coef
+                 in zip(variables, model["coefficients"])])
+            self._linear_intercept = model["intercept"]
+            self._classes = np.asarray(model.get("classes", []))
+
+    def score(self, X):
+        """Score of the dataset.
+
+        Parameters
+        ----------
+        X : dict, pandas.DataFrame or numpy.ndarray
+            Input data.
+
+        Returns
+        -------
+        score: array of shape (n_samples)
+            The score of the input samples.
+        """
+        indices = self._indices(X)
+
+        return self._points[indices].sum(axis=1) + self.intercept
+
+    def predict(self, X):
+        """Predict using the exported linear estimator.
+
+        Parameters
+        ----------
+        X : dict, pandas.DataFrame or numpy.ndarray
+            Input data.
+
+        Returns
+        -------
+        y: array of shape (n_samples)
+            The predicted target values.
+        """
+        z = self._decision_function(X)
+
+        if self.target_dtype == "binary":
+            return self._classes[(z > 0).astype(np.int64)]
+
+        return z
+
+    def predict_proba(self, X):
+        """Predict class probabilities using the exported logistic
+        regression.
+
+        Parameters
+        ----------
+        X : dict, pandas.DataFrame or numpy.ndarray
+            Input data.
+
+        Returns
+        -------
+        p: array of shape (n_samples, 2)
+            The class probabilities of the input samples.
+        """
+        if self.target_dtype != "binary":
+            raise ValueError("predict_proba is only available for binary "
+                             "target.")
+
+        p = 1.0 / (1.0 + np.exp(-self._decision_function(X)))
+
+        return np.column_stack((1 - p, p))
+
+    def _decision_function(self, X):
+        if self._linear is None:
+            raise ValueError("The artifact does not include a linear "
+                             "estimator. Only score is available.")
+
+        indices = self._indices(X)
+
+        return self._linear[indices].sum(axis=1) + self._linear_intercept
+
+
+class BinningProcessArtifact(_Artifact):
+    """Binning process loaded from an artifact exported by
+    :meth:`BinningProcess.export`.
+
+    Input data ``X`` is a mapping from variable name to array, such as a
+    dictionary or a pandas.DataFrame, or a 2-dimensional array with columns
+    ordered as ``variable_names``.
+
+    Parameters
+    ----------
+    content : dict
+        Artifact content.
+    """
+    def __init__(self, content):
+        super().__init__(content)
+
+        self.metric = content["metric"]
+
+        self._values, self._sizes, self._offsets = self._flat_table(
+            [variable["values"] for variable in content["variables"]])
+
+    def transform(self, X):
+        """Transform the selected variables to the exported metric.
+
+        Parameters
+        ----------
+        X : dict, pandas.DataFrame or numpy.ndarray
+            Input data.
+
+        Returns
+        -------
+        X_new : numpy.ndarray, shape = (n_samples, n_selected_variables)
+            Transformed array.
+        """
+        return self._values[self._indices(X)]
@@ -10,7 +10,9 @@ import pandas as pd
 
 from pytest import approx, raises
 
+from optbinning import ColumnCache
 from optbinning import OptimalBinning
+from optbinning import SolutionCache
 from sklearn.datasets import load_breast_cancer
 from sklearn.exceptions import NotFittedError
 
@@ -188,8 +190,9 @@ def test_numerical_default_solvers():
     optb_mip_cbc = OptimalBinning(solver="mip", mip_solver="cbc")
     optb_mip_bop = OptimalBinning(solver="mip", mip_solver="bop")
     optb_cp = OptimalBinning(solver="cp")
+    optb_dp = OptimalBinning(solver="dp")
 
-    for optb in [optb_mip_bop, optb_mip_cbc, optb_cp]:
+    for optb in [optb_mip_bop, optb_mip_cbc, optb_cp, optb_dp]:
         optb.fit(x, y)
         assert optb.status == "OPTIMAL"
         assert optb.splits == approx([11.42500019, 12.32999992, 13.09499979,
@@ -372,16 +375,77 @@ def test_auto_modes():
                                      rel=1e-6)
 
 
+def test_numerical_monotonic_trends_cp_mip():
+    for trend in ("concave", "convex", "peak", "valley", "peak_heuristic",
+                  "valley_heuristic"):
+        optb_cp = OptimalBinning(solver="cp", monotonic_trend=trend,
+                                 max_n_prebins=40, min_prebin_size=0.01)
+        optb_mip = OptimalBinning(solver="mip", monotonic_trend=trend,
+                                  max_n_prebins=40, min_prebin_size=0.01)
+        optb_cp.fit(x, y)
+        optb_mip.fit(x, y)
+
+        assert optb_cp.status == "OPTIMAL"
+        assert optb_cp.splits == approx(optb_mip.splits, rel=1e-6)
+
+        assert (optb_cp._time_model_generation + optb_cp._time_optimizer <=
+                optb_cp._time_solver)
+
+
+def test_numerical_cp_public_api(monkeypatch):
+    from optbinning.binning import cp
+
+    params = [{"monotonic_trend": trend} for trend in (
+        "ascending", "descending", "convex", "concave", "peak", "valley")]
+    params.append({"min_bin_size": 0.1, "max_bin_size": 0.5, "gamma": 0.1,
+                   "min_event_rate_diff": 0.02})
+
+    splits = [OptimalBinning(solver="cp", **p).fit(x, y).splits
+              for p in params]
+
+    # Model written through the public API only, as for OR-Tools versions
+    # whose proto layout is not relied upon
+    monkeypatch.setattr(cp, "_proto_linear_constraints", lambda: False)
+
+    for p, p_splits in zip(params, splits):
+        optb = OptimalBinning(solver="cp", **p)
+        optb.fit(x, y)
+
+        assert optb.status == "OPTIMAL"
+        assert optb.splits == approx(p_splits, rel=1e-6)
+
+
 def test_numerical_min_max_n_bins():
     optb_mip = OptimalBinning(solver="mip", min_n_bins=2, max_n_bins=5)
     optb_cp = OptimalBinning(solver="cp", min_n_bins=2, max_n_bins=5)
+    optb_dp = OptimalBinning(solver="dp", min_n_bins=2, max_n_bins=5)
 
-    for optb in [optb_mip, optb_cp]:
+    for optb in [optb_mip, optb_cp, optb_dp]:
         optb.fit(x, y)
         assert optb.status == "OPTIMAL"
         assert 2 <= len(optb.splits + 1) <= 5
 
 
+def test_numerical_dp_solver():
+    for params in [{"monotonic_trend": "descending", "max_n_bins": 4},
+                   {"min_bin_size": 0.1, "max_pvalue": 0.05,
+                    "max_pvalue_policy": "consecutive"}]:
+        optb_cp = OptimalBinning(solver="cp", **params)
+        optb_dp = OptimalBinning(solver="dp", **params)
+        optb_cp.fit(x, y)
+        optb_dp.fit(x, y)
+
+        assert optb_dp.status == "OPTIMAL"
+        assert optb_dp.splits == approx(optb_cp.splits, rel=1e-6)
+
+    # Unsupported constraints fall back to solver "cp"
+    optb = OptimalBinning(solver="dp", monotonic_trend="peak")
+    optb.fit(x, y)
+
+    assert optb.status == "OPTIMAL"
+    assert optb._solver_type == "cp"
+
+
 def test_outlier():
     with raises(ValueError):
         optb = OptimalBinning(outlier_detector="new_outlier")
@@ -422,6 +486,21 @@ def test_numerical_regularization():
     assert len(optb_cp.splits) < 6
 
 
+def test_numerical_prebinning_refinement():
+    optb = OptimalBinning(max_n_prebins=50, min_prebin_size=0.01,
+                          monotonic_trend=None)
+    optb.fit(x, y)
+
+    assert optb._n_refinements > 0
+
+    indices = np.digitize(x, optb.splits, right=False)
+    n_event = np.bincount(indices, weights=y).astype(np.int64)
+    n_nonevent = np.bincount(indices).astype(np.int64) - n_event
+
+    assert optb._n_event[:-2] == approx(n_event)
+    assert optb._n_nonevent[:-2] == approx(n_nonevent)
+
+
 def test_numerical_prebinning_kwargs():
     optb_kwargs = OptimalBinning(solver="mip", prebinning_method="mdlp",
                                  **{"max_candidates": 64})
@@ -443,6 +522,116 @@ def test_numerical_default_transform():
                                   5.28332344], rel=1e-6)
 
 
+def test_numerical_transform_plan():
+    optb = OptimalBinning(special_codes=[-9])
+    optb.fit(x, y)
+
+    x_new = np.array([12, 14, -9, np.nan, 21])
+    x_transform = optb.transform(x_new, metric="indices")
+    plan = optb._transform_plan
+
+    assert x_transform == approx([1, 4, 7, 8, 6])
+
+    x_transform = optb.transform(x_new, metric="woe")
+    assert optb._transform_plan is plan
+    assert x_transform == approx([-2.71097154, -0.15397917, 0, 0,
+                                  5.28332344], rel=1e-6)
+
+    optb.fit(x, y)
+    assert optb._transform_plan is None
+
+
+def test_column_cache():
+    x_special = x.copy()
+    x_special[:10] = np.nan
+    x_special[10:20] = -1
+
+    cache = ColumnCache()
+
+    for method in ("cart", "mdlp"):
+        for max_n_bins in (None, 4):
+            optb = OptimalBinning(prebinning_method=method,
+                                  special_codes=[-1], max_n_bins=max_n_bins)
+            optb.fit(x_special, y)
+
+            optb_cache = OptimalBinning(prebinning_method=method,
+                                        special_codes=[-1],
+                                        max_n_bins=max_n_bins)
+            optb_cache.fit(x_special, y, column_cache=cache)
+
+            assert optb_cache.splits == approx(optb.splits)
+            assert optb_cache.binning_table.build()["IV"].values == approx(
+                optb.binning_table.build()["IV"].values)
+
+    # A single entry per column and options
+    assert len(cache) == 1
+
+    optb_cache.set_params(special_codes=None)
+    optb_cache.fit(x_special, y, column_cache=cache)
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+    # Lists are converted to temporary arrays and not cached
+    for variable in ("mean radius", "mean texture"):
+        x_list = df[variable].tolist()
+
+        optb = OptimalBinning().fit(x_list, y)
+        optb_cache = OptimalBinning().fit(x_list, y, column_cache=cache)
+
+        assert optb_cache.splits == approx(optb.splits)
+
+    assert len(cache) == 0
+
+    # Series are cached
+    optb_cache.fit(df["mean radius"], y, column_cache=cache)
+    optb_cache.fit(df["mean radius"], y, column_cache=cache)
+    assert len(cache) == 1
+
+
+def test_solution_cache(tmp_path):
+    with raises(TypeError):
+        optb = OptimalBinning(solution_cache={})
+        optb.fit(x, y)
+
+    with raises(ValueError):
+        SolutionCache(maxsize=-1)
+
+    optb = OptimalBinning(monotonic_trend="descending")
+    optb.fit(x, y)
+
+    cache = SolutionCache(maxsize=1, path=str(tmp_path))
+
+    for solver in ("cp", "mip", "cp"):
+        optb_cache = OptimalBinning(monotonic_trend="descending",
+                                    solver=solver, solution_cache=cache)
+        optb_cache.fit(x, y)
+
+        assert optb_cache.status == "OPTIMAL"
+        assert optb_cache.splits == approx(optb.splits)
+
+    # Least-recently-used solution evicted from memory and loaded from disk
+    assert len(cache) == 1
+    assert cache.stats == {"hits": 1, "misses": 2}
+
+    cache_disk = SolutionCache(path=str(tmp_path))
+    optb_cache.set_params(solution_cache=cache_disk)
+    optb_cache.fit(x, y)
+    assert cache_disk.stats == {"hits": 1, "misses": 0}
+    assert optb_cache.splits == approx(optb.splits)
+
+    # Any change of the optimizer parameters is a different solution
+    optb_cache.set_params(max_n_bins=3)
+    optb_cache.fit(x, y)
+    assert cache_disk.stats == {"hits": 1, "misses": 1}
+
+    cache_disk.clear()
+    assert len(cache_disk) == 0
+    assert SolutionCache(path=str(tmp_path))._get(
+        next(iter(cache._solutions))) is None
+
+
 def test_numerical_default_fit_transform():
     optb = OptimalBinning()
 
@@ -515,6 +704,10 @@ def test_information():
     optb.fit(x, y)
     optb.information(print_level=2)
 
+    optb = OptimalBinning(solver="dp")
+    optb.fit(x, y)
+    optb.information(print_level=2)
+
 
 def test_verbose():
     optb = OptimalBinning(verbose=True)
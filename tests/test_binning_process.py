@@ -8,7 +8,7 @@ Binning process testing.
 import pandas as pd
 import numpy as np
 
-from pytest import approx, raises
+from pytest import approx, raises, warns
 
 from contextlib import redirect_stdout
 
@@ -16,6 +16,8 @@ from optbinning import BinningProcess
 from optbinning import ContinuousOptimalBinning
 from optbinning import MulticlassOptimalBinning
 from optbinning import OptimalBinning
+from optbinning import SolutionCache
+from optbinning.scoring import load_artifact
 from sklearn.datasets import load_boston
 from sklearn.datasets import load_breast_cancer
 from sklearn.datasets import load_wine
@@ -281,6 +283,108 @@ def test_fit_params():
     assert len(optb.splits) <= 4
 
 
+def test_n_jobs():
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df["category"] = np.where(df["mean radius"] > 14, "A", "B").astype(object)
+    names = list(df.columns)
+
+    process = BinningProcess(names, categorical_variables=["category"])
+    process.fit(df, y)
+
+    process_parallel = BinningProcess(names, categorical_variables=[
+        "category"], n_jobs=2)
+    process_parallel.fit(df, y)
+
+    for name in names:
+        optb = process.get_binned_variable(name)
+        optb_parallel = process_parallel.get_binned_variable(name)
+
+        assert optb_parallel.status == optb.status
+        assert optb_parallel.dtype == optb.dtype
+        if optb.dtype == "numerical":
+            assert optb_parallel.splits == approx(optb.splits, rel=1e-6)
+
+    assert process_parallel.get_support() == approx(process.get_support())
+
+    process_parallel = BinningProcess(variable_names, n_jobs=2)
+    process_parallel.fit(X, y)
+
+    optb = process_parallel.get_binned_variable("mean radius")
+    assert optb.splits == approx([11.42500019, 12.32999992, 13.09499979,
+                                  13.70499992, 15.04500008, 16.92500019],
+                                 rel=1e-6)
+
+
+def test_solution_cache():
+    cache = SolutionCache()
+    process = BinningProcess(variable_names, solution_cache=cache)
+    process.fit(X, y)
+
+    assert cache.stats["hits"] == 0
+
+    process_cache = BinningProcess(variable_names, solution_cache=cache,
+                                   selection_criteria={"iv": {"min": 0.1}})
+    process_cache.fit(X, y)
+
+    assert cache.stats["hits"] == cache.stats["misses"]
+
+    for name in variable_names:
+        optb = process.get_binned_variable(name)
+        optb_cache = process_cache.get_binned_variable(name)
+
+        assert optb_cache.solution_cache is cache
+        assert optb_cache.splits == approx(optb.splits)
+
+
+def test_fit_from_chunks():
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df["target"] = y
+    chunks = [df.iloc[i: i + 100] for i in range(0, len(df), 100)]
+
+    process = BinningProcess(variable_names)
+
+    with raises(TypeError):
+        process.fit_from_chunks(iter(chunks), "target")
+
+    with raises(ValueError):
+        process.fit_from_chunks([], "target")
+
+    process.fit_from_chunks(chunks, "target")
+    process_callable = BinningProcess(variable_names)
+    process_callable.fit_from_chunks(lambda: iter(chunks), "target")
+
+    optb = process.get_binned_variable("mean radius")
+    optb_callable = process_callable.get_binned_variable("mean radius")
+
+    assert optb.status == "OPTIMAL"
+    assert optb.splits == approx(optb_callable.splits)
+
+    # Exact counts of the optimal bins
+    x = df["mean radius"].values
+    indices = np.searchsorted(optb.splits, x, side="right")
+    n_event = np.bincount(indices, weights=y, minlength=len(optb.splits) + 1)
+    assert optb.binning_table.build()["Event"].values[:-3] == approx(n_event)
+
+    X_transform = process.transform(df[variable_names], metric="woe")
+    assert X_transform.shape == (len(df), len(variable_names))
+
+    # Exact counts are discarded when new data is added
+    optb.add(x, y)
+    optb.solve()
+    assert optb.binning_table.build()["Count"].values[-1] == 2 * len(df)
+
+    # Parameters not supported by the sketch are ignored
+    binning_fit_params = {"mean radius": {"prebinning_method": "quantile",
+                                          "max_n_bins": 3}}
+    process = BinningProcess(variable_names,
+                             binning_fit_params=binning_fit_params)
+
+    with warns(UserWarning, match="prebinning_method"):
+        process.fit_from_chunks(chunks, "target")
+
+    assert len(process.get_binned_variable("mean radius").splits) <= 2
+
+
 def test_default_transform():
     process = BinningProcess(variable_names)
     with raises(NotFittedError):
@@ -320,6 +424,35 @@ def test_default_transform_pandas():
         X_transform.values[:, 5], rel=1e-6)
 
 
+def test_transform_chunks():
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+
+    process = BinningProcess(variable_names)
+    process.fit(df, y)
+
+    X_transform = process.transform(df, metric="woe")
+
+    for params in [{"n_jobs": 2}, {"chunk_size": 100},
+                   {"n_jobs": 2, "chunk_size": 77}]:
+        assert process.transform(df, metric="woe", **params).values == approx(
+            X_transform.values, rel=1e-6)
+
+    with raises(ValueError):
+        process.transform(df, chunk_size=0)
+
+    with raises(ValueError):
+        process.transform(df, out=np.empty((10, 10)))
+
+    out = np.empty(X_transform.shape, dtype=np.float32)
+    process.transform(X, metric="woe", out=out, chunk_size=100)
+    assert out == approx(X_transform.values, rel=1e-6)
+
+    chunks = list(process.transform_chunks(df, 100, metric="bins"))
+    assert len(chunks) == 6
+    assert chunks[-1].shape == (69, len(variable_names))
+    assert pd.concat(chunks).equals(process.transform(df, metric="bins"))
+
+
 def test_default_transform_continuous():
     data = load_boston()
     variable_names = data.feature_names
@@ -381,6 +514,41 @@ def test_default_fit_transform_no_selected_variables():
     assert X_transform == approx(np.empty(0).reshape((X.shape[0], 0)))
 
 
+def test_export(tmp_path):
+    X_special = X.copy()
+    X_special[:10, 0] = np.nan
+    X_special[10:20, 1] = -9
+
+    process = BinningProcess(variable_names, special_codes=[-9],
+                             selection_criteria={"iv": {"min": 0.1}})
+
+    with raises(NotFittedError):
+        process.export(str(tmp_path / "process.json"))
+
+    process.fit(X_special, y)
+
+    with raises(ValueError):
+        process.export(str(tmp_path / "process.json"), metric="mean")
+
+    path = str(tmp_path / "process.json")
+    process.export(path, metric="event_rate", metric_missing="empirical")
+    artifact = load_artifact(path)
+
+    assert artifact.selected_variables == list(
+        process.get_support(names=True))
+    assert artifact.transform(X_special) == approx(
+        process.transform(X_special, metric="event_rate",
+                          metric_missing="empirical"))
+
+    # Multiclass target
+    data = load_wine()
+    process = BinningProcess(data.feature_names).fit(data.data, data.target)
+    process.export(path)
+
+    assert load_artifact(path).transform(data.data) == approx(
+        process.transform(data.data))
+
+
 def test_information():
     data = load_breast_cancer()
 
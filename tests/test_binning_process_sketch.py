@@ -0,0 +1,132 @@
+"""
+BinningProcessSketch testing.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import pandas as pd
+import numpy as np
+
+from pytest import approx, raises
+
+from optbinning import BinningProcess
+from optbinning import BinningProcessSketch
+from optbinning import OptimalBinningSketch
+from sklearn.datasets import load_breast_cancer
+
+
+data = load_breast_cancer()
+
+variable_names = data.feature_names
+X = data.data
+y = data.target
+
+
+def test_params():
+    with raises(ValueError):
+        BinningProcessSketch(variable_names, sketch="new_sketch")
+
+    with raises(ValueError):
+        BinningProcessSketch(variable_names, eps=-1e-2)
+
+    with raises(ValueError):
+        BinningProcessSketch(variable_names, max_n_prebins=-1)
+
+    with raises(ValueError):
+        BinningProcessSketch(variable_names,
+                             selection_criteria={"mean": {"min": 0}})
+
+
+def test_default():
+    bpsketch = BinningProcessSketch(variable_names, special_codes=[-9])
+
+    with raises(ValueError):
+        bpsketch.solve()
+
+    X_special = X.copy()
+    X_special[:10, 0] = np.nan
+    X_special[10:20, 1] = -9
+
+    for X_i, y_i in zip(np.array_split(X_special, 3), np.array_split(y, 3)):
+        bpsketch.add(X_i, y_i)
+
+    process = bpsketch.solve()
+
+    assert isinstance(process, BinningProcess)
+
+    for i, name in enumerate(variable_names):
+        optb = OptimalBinningSketch(name=name, special_codes=[-9])
+        optb.add(X_special[:, i], y)
+        optb.solve()
+
+        optb_process = process.get_binned_variable(name)
+        assert optb_process.splits == approx(optb.splits)
+        assert optb_process.binning_table.iv == approx(optb.binning_table.iv)
+
+    X_transform = process.transform(X_special, metric="woe")
+    assert X_transform.shape == X.shape
+
+
+def test_special_codes_block():
+    # Equal special codes given per variable use the block path
+    binning_fit_params = {name: {"special_codes": [-9]}
+                          for name in variable_names}
+    bpsketch = BinningProcessSketch(variable_names, special_codes=[-9],
+                                    binning_fit_params=binning_fit_params)
+
+    block_names = []
+    add_block = bpsketch._add_block
+
+    def _add_block(columns, names, y):
+        block_names.extend(names)
+        add_block(columns, names, y)
+
+    bpsketch._add_block = _add_block
+    bpsketch.add(X, y)
+
+    assert block_names == list(variable_names)
+
+
+def test_dataframe_categorical_merge():
+    df = pd.DataFrame(X, columns=variable_names)
+    df["category"] = np.array(["a", "b", "c"], dtype=object)[
+        np.arange(len(df)) % 3]
+    names = list(variable_names) + ["category"]
+
+    selection_criteria = {"iv": {"min": 0.1}}
+
+    bpsketch1 = BinningProcessSketch(names,
+                                     selection_criteria=selection_criteria)
+    bpsketch2 = BinningProcessSketch(names,
+                                     selection_criteria=selection_criteria)
+
+    bpsketch1.add(df.iloc[:300], y[:300])
+    bpsketch2.add(df.iloc[300:], y[300:])
+    bpsketch1.merge(bpsketch2)
+
+    with raises(Exception):
+        bpsketch1.merge(BinningProcessSketch(variable_names))
+
+    bpsketch = BinningProcessSketch(names,
+                                    selection_criteria=selection_criteria)
+    bpsketch.add(df, y)
+
+    process_merge = bpsketch1.solve()
+    process = bpsketch.solve()
+
+    summary = process.summary()
+    summary_merge = process_merge.summary()
+
+    assert summary["iv"].values == approx(summary_merge["iv"].values)
+    assert np.array_equal(process.get_support(), process_merge.get_support())
+    assert summary.set_index("name").loc["category", "dtype"] == "categorical"
+
+    X_transform = process.transform(df, metric="woe")
+    assert X_transform.shape[1] == np.count_nonzero(process.get_support())
+
+    # Further data does not modify the fitted binning process
+    splits = process.get_binned_variable("mean radius").splits.copy()
+    bpsketch.add(df.iloc[:100], 1 - y[:100])
+    assert process.get_binned_variable("mean radius").splits == approx(
+        splits)
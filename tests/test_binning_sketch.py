@@ -11,6 +11,10 @@ import pandas as pd
 from pytest import approx, raises
 
 from optbinning import OptimalBinningSketch
+from optbinning.binning.distributed import BCatSketch
+from optbinning.binning.distributed import BSketch
+from optbinning.binning.distributed import GK
+from optbinning.binning.distributed import merge_all
 from sklearn.datasets import load_breast_cancer
 from sklearn.exceptions import NotFittedError
 
@@ -200,6 +204,197 @@ def test_numerical_default_tdigest_merge():
     assert optb1.binning_table.quality_score == approx(0.0, rel=1e-2)
 
 
+def test_gk_add_batch():
+    eps = 1e-3
+    rng = np.random.RandomState(0)
+    z = rng.lognormal(size=50000)
+    z_sorted = np.sort(z)
+    n = len(z)
+
+    gk_batch = GK(eps)
+    for chunk in np.array_split(z, 7):
+        gk_batch.add_batch(chunk)
+
+    gk = GK(eps)
+    for v in z[:5000]:
+        gk.add(v)
+
+    gk_merge = GK(eps)
+    gk_merge.add_batch(z[5000:])
+    gk.merge(gk_merge)
+
+    assert gk_batch.n == gk.n == n
+
+    for q in np.linspace(0, 1, 21):
+        rank = q * (n - 1) + 1
+        for sketch, tol in ((gk_batch, eps), (gk, 2 * eps)):
+            v = sketch.quantile(q)
+            r_min = np.searchsorted(z_sorted, v, side="left") + 1
+            r_max = np.searchsorted(z_sorted, v, side="right")
+            assert r_min - tol * n <= rank <= r_max + tol * n
+
+
+def test_bcatsketch_merge():
+    rng = np.random.RandomState(0)
+    categories = np.array(["a", "b", "c", "d", "e", np.nan], dtype=object)
+    z = categories[rng.randint(0, 6, 1000)]
+    t = rng.randint(0, 2, 1000)
+
+    bcs = BCatSketch(cat_cutoff=0.1)
+    bcs.add(z, t)
+
+    bcs1 = BCatSketch(cat_cutoff=0.1)
+    bcs2 = BCatSketch(cat_cutoff=0.1)
+    bcs1.add(z[:300], t[:300])
+    bcs2.add(z[300:], t[300:])
+    bcs1.merge(bcs2)
+
+    assert bcs1.n_event == bcs.n_event == np.count_nonzero(t)
+    assert bcs1.n == bcs.n == 1000
+
+    for b1, b in zip(bcs1.bins(), bcs.bins()):
+        assert np.array_equal(b1, b)
+
+
+def test_serialization():
+    bs = BSketch(eps=1e-3, special_codes=[-9])
+    bs.add(x, y)
+
+    bs_load = BSketch.from_bytes(bs.to_bytes())
+    assert bs_load.n_event == bs.n_event
+    assert bs_load.n_nonevent == bs.n_nonevent
+
+    splits = [10, 12, 14, 16, 18]
+    for b_load, b in zip(bs_load.bins(splits), bs.bins(splits)):
+        assert np.array_equal(b_load, b)
+
+    bs_load.merge(bs)
+    assert bs_load.n == 2 * bs.n
+
+    gk = bs._sketch_e
+    gk_load = GK.from_bytes(gk.to_bytes())
+    assert gk_load.quantile(0.5) == gk.quantile(0.5)
+
+    categories = np.array(["a", "b", "c", np.nan], dtype=object)
+    z = categories[np.arange(len(y)) % 4]
+
+    bcs = BCatSketch(cat_cutoff=0.1)
+    bcs.add(z, y)
+
+    bcs_load = BCatSketch.from_bytes(bcs.to_bytes())
+    for b_load, b in zip(bcs_load.bins(), bcs.bins()):
+        assert np.array_equal(b_load, b)
+
+    bcs_mixed = BCatSketch()
+    bcs_mixed.add(np.array(["a", 1] * 10, dtype=object), y[:20])
+
+    with raises(TypeError):
+        bcs_mixed.to_bytes()
+
+    with raises(ValueError):
+        BSketch.from_bytes(bcs.to_bytes())
+
+    with raises(ValueError):
+        GK.from_bytes(b"data")
+
+
+def test_optimal_binning_sketch_serialization():
+    optb = OptimalBinningSketch(eps=1e-3, monotonic_trend="descending",
+                                special_codes=[-9])
+
+    optb_load = OptimalBinningSketch.from_bytes(optb.to_bytes())
+    assert optb_load.get_params() == optb.get_params()
+
+    optb.add(x, y)
+    optb.solve()
+
+    optb_load = OptimalBinningSketch.from_bytes(optb.to_bytes())
+    optb_load.solve()
+
+    assert optb_load.get_params() == optb.get_params()
+    assert optb_load.splits == approx(optb.splits)
+
+    optb_load.add(x, y)
+    optb_load.solve()
+    assert optb_load.binning_table.build()["Count"].values[-1] == 2 * len(x)
+
+    categories = np.array(["a", "b", "c", "d"], dtype=object)
+    z = categories[np.arange(len(y)) % 4]
+
+    optb = OptimalBinningSketch(dtype="categorical")
+    optb.add(z, y)
+    optb.solve()
+
+    optb_load = OptimalBinningSketch.from_bytes(optb.to_bytes())
+    optb_load.solve()
+
+    for s_load, s in zip(optb_load.splits, optb.splits):
+        assert np.array_equal(s_load, s)
+
+
+def test_merge_all():
+    optb = OptimalBinningSketch(sketch="gk", eps=1e-4)
+    optb.add(x, y)
+    optb.solve()
+
+    partials = []
+    for x_i, y_i in zip(np.array_split(x, 10), np.array_split(y, 10)):
+        optb_i = OptimalBinningSketch(sketch="gk", eps=1e-4)
+        optb_i.add(x_i, y_i)
+        partials.append(optb_i)
+
+    optb_merge, error_bound = merge_all(partials, return_error_bound=True)
+    optb_merge.solve()
+
+    assert optb_merge._bsketch.n == len(x)
+    assert error_bound == approx(1e-4 * 5)
+    assert optb_merge.splits == approx(optb.splits, rel=1e-6)
+
+    # input sketches are not modified
+    assert partials[0]._bsketch.n == len(np.array_split(x, 10)[0])
+
+    optb_merge_jobs = merge_all(partials, n_jobs=2)
+    assert optb_merge_jobs._bsketch.n == len(x)
+
+    with raises(ValueError):
+        merge_all([])
+
+    with raises(ValueError):
+        merge_all([optb, OptimalBinningSketch(sketch="gk", eps=1e-3)])
+
+    with raises(TypeError):
+        merge_all([optb, GK(1e-4)])
+
+
+def test_numerical_incremental():
+    optb = OptimalBinningSketch(sketch="gk", eps=1e-4)
+    optb.add(x, y)
+    optb.solve()
+
+    optb_inc = OptimalBinningSketch(sketch="gk", eps=1e-4)
+    optb_inc.add(x[:300], y[:300])
+    optb_inc.solve(incremental=True)
+    optb_inc.add(x[300:], y[300:])
+    optb_inc.solve(incremental=True)
+
+    assert optb_inc.splits == approx(optb.splits, rel=1e-6)
+
+    # no new data: previous solution is reused
+    optimizer = optb_inc._optimizer
+    optb_inc.solve(incremental=True)
+
+    assert optb_inc._optimizer is optimizer
+    assert optb_inc.splits == approx(optb.splits, rel=1e-6)
+    assert optb_inc.binning_table.iv == approx(optb.binning_table.iv)
+
+    # parameters changed: cache is discarded
+    optb_inc.set_params(max_n_prebins=10)
+    optb_inc.solve(incremental=True)
+
+    assert optb_inc._optimizer is not optimizer
+    assert optb_inc._n_prebins <= 10
+
+
 def test_categorical_default_user_splits():
     x = np.array([
         'Working', 'State servant', 'Working', 'Working', 'Working',
@@ -0,0 +1,107 @@
+"""
+Histogram CART testing.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import numpy as np
+import pandas as pd
+
+from pytest import approx
+
+from optbinning.binning.cart import HistogramCART
+from optbinning.binning.cart import supports_options
+from optbinning.binning.prebinning import PreBinning
+from sklearn.datasets import load_boston
+from sklearn.datasets import load_breast_cancer
+from sklearn.tree import _tree
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.tree import DecisionTreeRegressor
+
+
+data = load_breast_cancer()
+df = pd.DataFrame(data.data, columns=data.feature_names)
+
+variable = "mean radius"
+x = df[variable].values
+y = data.target
+
+
+def _sklearn_splits(est, x, y, sample_weight=None):
+    est.fit(x.reshape(-1, 1), y, sample_weight=sample_weight)
+    splits = np.unique(est.tree_.threshold)
+    return splits[splits != _tree.TREE_UNDEFINED]
+
+
+def test_options():
+    assert supports_options("classification", {"criterion": "entropy"})
+    assert not supports_options("classification",
+                                {"criterion": "squared_error"})
+    assert not supports_options("classification", {"splitter": "random"})
+    assert not supports_options("regression", {"max_features": 1})
+
+
+def test_classification():
+    for options in ({"min_samples_leaf": 29, "max_leaf_nodes": 20},
+                    {"min_samples_leaf": 5, "max_leaf_nodes": 8,
+                     "criterion": "entropy"},
+                    {"max_depth": 3, "class_weight": {0: 2, 1: 0.5}}):
+
+        est = DecisionTreeClassifier(**options)
+        cart = HistogramCART(**options).fit(x, y)
+
+        assert cart.splits == approx(_sklearn_splits(est, x, y), rel=1e-12)
+
+
+def test_classification_ties():
+    # Duplicated values and values closer than the float32 resolution
+    rng = np.random.RandomState(0)
+    x = rng.randint(0, 5, 1000) + rng.normal(scale=1e-6, size=1000)
+    y = rng.randint(0, 2, 1000)
+    sample_weight = rng.uniform(size=1000)
+
+    options = {"min_samples_leaf": 20, "max_leaf_nodes": 15}
+    est = DecisionTreeClassifier(**options)
+    cart = HistogramCART(**options).fit(x, y, sample_weight)
+
+    assert cart.splits == approx(_sklearn_splits(est, x, y, sample_weight),
+                                 rel=1e-12)
+
+
+def test_classification_improvement_ties():
+    # Nodes with the same improvement are expanded in the order given by the
+    # heap layout of sklearn's best-first builder, not by insertion order.
+    rng = np.random.RandomState(3027)
+    x = rng.randint(0, 10, 200)
+    y = rng.randint(0, 2, 200)
+
+    options = {"min_samples_leaf": 5, "max_leaf_nodes": 8,
+               "class_weight": {0: 2, 1: 0.5}}
+    est = DecisionTreeClassifier(**options)
+    cart = HistogramCART(**options).fit(x, y)
+
+    assert cart.splits == approx(_sklearn_splits(est, x, y), rel=1e-12)
+
+
+def test_regression():
+    boston = load_boston()
+    x = boston.data[:, 12]
+    y = boston.target
+
+    options = {"min_samples_leaf": 26, "max_leaf_nodes": 20}
+    est = DecisionTreeRegressor(**options)
+    cart = HistogramCART(problem_type="regression", **options).fit(x, y)
+
+    assert cart.splits == approx(_sklearn_splits(est, x, y), rel=1e-12)
+
+
+def test_prebinning_sklearn_fallback():
+    prebinning = PreBinning(problem_type="classification", method="cart",
+                            n_bins=20, min_bin_size=29,
+                            splitter="random", random_state=0).fit(x, y)
+
+    est = DecisionTreeClassifier(min_samples_leaf=29, max_leaf_nodes=20,
+                                 splitter="random", random_state=0)
+
+    assert prebinning.splits == approx(_sklearn_splits(est, x, y))
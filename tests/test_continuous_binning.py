@@ -246,6 +246,22 @@ def test_numerical_default_fit_transform():
                                       30.47142857], rel=1e-6)
 
 
+def test_information():
+    optb = ContinuousOptimalBinning()
+
+    with raises(NotFittedError):
+        optb.information()
+
+    optb.fit(x, y)
+
+    with raises(ValueError):
+        optb.information(print_level=-1)
+
+    optb.information(print_level=0)
+    optb.information(print_level=1)
+    optb.information(print_level=2)
+
+
 def test_verbose():
     optb = ContinuousOptimalBinning(verbose=True)
     optb.fit(x, y)
@@ -0,0 +1,62 @@
+"""
+Lazy imports testing.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import subprocess
+import sys
+
+import optbinning
+
+from pytest import raises
+
+
+HEAVY_MODULES = ("ortools", "matplotlib", "tdigest", "localsolver")
+
+
+def _loaded_heavy_modules(statement):
+    code = ("import sys\n{}\nprint(','.join(sorted(set(m.split('.')[0] "
+            "for m in sys.modules if m.startswith({!r})))))"
+            .format(statement, HEAVY_MODULES))
+
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return output.decode().strip()
+
+
+def test_lazy_attributes():
+    assert "BinningProcess" in dir(optbinning)
+    assert optbinning.OptimalBinning.__name__ == "OptimalBinning"
+
+    with raises(AttributeError):
+        optbinning.NewOptimalBinning
+
+
+def test_import_no_heavy_modules():
+    statement = ("import optbinning\n"
+                 "from optbinning import *\n"
+                 "from optbinning.binning.distributed import merge_all")
+
+    assert _loaded_heavy_modules(statement) == ""
+
+
+def test_transform_no_heavy_modules(tmp_path):
+    path = str(tmp_path / "process.pkl")
+
+    statement = (
+        "import pickle\n"
+        "import numpy as np\n"
+        "from optbinning import BinningProcess\n"
+        "x = np.random.RandomState(0).normal(size=(1000, 2))\n"
+        "y = (x[:, 0] > 0).astype(int)\n"
+        "process = BinningProcess(['a', 'b']).fit(x, y)\n"
+        "pickle.dump((process, x), open({!r}, 'wb'))".format(path))
+
+    assert "ortools" in _loaded_heavy_modules(statement)
+
+    statement = ("import pickle\n"
+                 "process, x = pickle.load(open({!r}, 'rb'))\n"
+                 "process.transform(x)".format(path))
+
+    assert _loaded_heavy_modules(statement) == ""
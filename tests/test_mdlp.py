@@ -12,6 +12,7 @@ from pytest import approx, raises
 
 from optbinning import MDLP
 from sklearn.datasets import load_breast_cancer
+from sklearn.datasets import load_wine
 from sklearn.exceptions import NotFittedError
 
 
@@ -54,6 +55,28 @@ def test_numerical_practical():
                                   17.88], rel=1e-6)
 
 
+def test_numerical_multiclass():
+    data = load_wine()
+    x = data.data[:, list(data.feature_names).index("proline")]
+
+    mdlp = MDLP()
+    mdlp.fit(x, data.target)
+
+    assert mdlp.splits == approx([468.0, 508.40612903, 676.5, 750.27096774,
+                                  862.5, 985.0], rel=1e-6)
+
+
+def test_numerical_multiclass_classes_present():
+    data = load_wine()
+    x = data.data[:, list(data.feature_names).index("alcohol")]
+
+    mdlp = MDLP()
+    mdlp.fit(x, data.target)
+
+    assert mdlp.splits == approx([12.185, 12.44, 12.77647742, 13.7183871],
+                                 rel=1e-6)
+
+
 def test_splits():
     mdlp = MDLP()
 
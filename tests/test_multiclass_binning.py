@@ -140,6 +140,14 @@ def test_numerical_default_solvers():
                                       2.6450001], rel=1e-6)
 
 
+def test_numerical_prebinning_mdlp():
+    optb = MulticlassOptimalBinning(prebinning_method="mdlp")
+    optb.fit(x, y)
+
+    assert optb.status == "OPTIMAL"
+    assert optb.splits == approx([2.31838871], rel=1e-6)
+
+
 def test_numerical_user_splits_fixed():
     user_splits = [2.1, 2.2, 2.3, 2.6, 2.9]
 
@@ -218,6 +226,26 @@ def test_classes():
     assert optb.classes == approx([0, 1, 2])
 
 
+def test_information():
+    optb = MulticlassOptimalBinning()
+
+    with raises(NotFittedError):
+        optb.information()
+
+    optb.fit(x, y)
+
+    with raises(ValueError):
+        optb.information(print_level=-1)
+
+    optb.information(print_level=0)
+    optb.information(print_level=1)
+    optb.information(print_level=2)
+
+    optb = MulticlassOptimalBinning(solver="mip")
+    optb.fit(x, y)
+    optb.information(print_level=2)
+
+
 def test_verbose():
     optb = MulticlassOptimalBinning(verbose=True)
     optb.fit(x, y)
@@ -14,6 +14,7 @@ from contextlib import redirect_stdout
 
 from optbinning import BinningProcess
 from optbinning import Scorecard
+from optbinning.scoring import load_artifact
 from sklearn.datasets import load_boston
 from sklearn.datasets import load_breast_cancer
 from sklearn.exceptions import NotFittedError
@@ -21,6 +22,21 @@ from sklearn.linear_model import LinearRegression
 from sklearn.linear_model import LogisticRegression
 
 
+def _binary_data():
+    # Breast cancer data with a categorical variable, missing values and
+    # special codes -9
+    data = load_breast_cancer()
+    variable_names = list(data.feature_names) + ["category"]
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df["category"] = np.array(["a", "b", "c", "d"], dtype=object)[
+        np.arange(len(df)) % 4]
+    df.loc[:5, "mean radius"] = np.nan
+    df.loc[6:12, "mean texture"] = -9
+    df["target"] = data.target
+
+    return df, variable_names
+
+
 def test_params():
     data = load_breast_cancer()
     variable_names = data.feature_names
@@ -396,6 +412,127 @@ def test_predict_score():
                                 608.27744027, 638.49988325], rel=1e-6)
 
 
+def test_predict_score_compiled():
+    df, variable_names = _binary_data()
+
+    # Unknown categories
+    df_new = df.copy()
+    df_new.loc[:20, "category"] = "e"
+
+    for estimator in (LogisticRegression(),
+                      LogisticRegression(multi_class="multinomial")):
+        binning_process = BinningProcess(variable_names, special_codes=[-9],
+                                         categorical_variables=["category"])
+        scorecard = Scorecard(target="target",
+                              binning_process=binning_process,
+                              estimator=estimator, scaling_method="pdo_odds",
+                              scaling_method_params={
+                                "pdo": 20, "odds": 50,
+                                "scorecard_points": 600})
+        scorecard.fit(df, metric_special="empirical")
+
+        for X in (df, df_new):
+            X_t = scorecard.binning_process_.transform(X[variable_names])
+            X_indices = scorecard.binning_process_.transform(
+                X[variable_names], metric="indices")
+
+            score = np.full(len(X), scorecard.intercept_, dtype=float)
+            for variable in X_t.columns:
+                table = scorecard.table()
+                points = table[table.Variable == variable].Points.values
+                score += points[X_indices[variable]]
+
+            assert scorecard.score(X) == approx(score)
+            assert scorecard.predict_proba(X) == approx(
+                scorecard.estimator_.predict_proba(X_t))
+            assert np.array_equal(scorecard.predict(X),
+                                  scorecard.estimator_.predict(X_t))
+
+
+def test_score_record():
+    df, variable_names = _binary_data()
+    df.loc[13:20, "category"] = "e"
+
+    binning_process = BinningProcess(variable_names, special_codes=[-9],
+                                     categorical_variables=["category"])
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LogisticRegression())
+
+    with raises(NotFittedError):
+        scorecard.score_record({})
+
+    scorecard.fit(df)
+
+    records = df[variable_names].to_dict(orient="records")
+    score = scorecard.score(df)
+
+    assert scorecard.score_records(records) == approx(score)
+    assert scorecard.score_record(records[0]) == approx(score[0])
+
+    # Variables not in the record are missing values
+    record = dict(records[1])
+    del record["mean radius"]
+    df_record = df.iloc[[1]].copy()
+    df_record["mean radius"] = np.nan
+
+    assert scorecard.score_record(record) == approx(
+        scorecard.score(df_record)[0])
+
+    # Missing values of nullable dtypes
+    record["mean radius"] = pd.NA
+    record["category"] = pd.NA
+
+    df_record["category"] = np.nan
+
+    assert scorecard.score_record(record) == approx(
+        scorecard.score(df_record)[0])
+
+
+def test_export(tmp_path):
+    df, variable_names = _binary_data()
+    df.loc[13:20, "category"] = "e"
+
+    binning_process = BinningProcess(variable_names, special_codes=[-9],
+                                     categorical_variables=["category"])
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LogisticRegression(),
+                          scaling_method="min_max",
+                          scaling_method_params={"min": 300, "max": 850})
+
+    path = str(tmp_path / "scorecard.json")
+
+    with raises(NotFittedError):
+        scorecard.export(path)
+
+    scorecard.fit(df)
+    scorecard.export(path)
+    artifact = load_artifact(path)
+
+    assert artifact.score(df) == approx(scorecard.score(df))
+    assert artifact.score(df[variable_names].values) == approx(
+        scorecard.score(df))
+    assert artifact.predict_proba(df) == approx(scorecard.predict_proba(df))
+    assert np.array_equal(artifact.predict(df), scorecard.predict(df))
+
+    # Continuous target
+    data = load_boston()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df["target"] = data.target
+
+    binning_process = BinningProcess(data.feature_names)
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LinearRegression())
+    scorecard.fit(df)
+    scorecard.export(path)
+    artifact = load_artifact(path)
+
+    assert artifact.score(df) == approx(scorecard.score(df))
+    assert artifact.predict(df) == approx(scorecard.predict(df))
+
+    with raises(ValueError):
+        artifact.predict_proba(df)
+
+
 def test_information():
     data = load_breast_cancer()
     variable_names = data.feature_names
@@ -0,0 +1,254 @@
+"""
+Scorecard monitoring testing.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2020
+
+import pandas as pd
+import numpy as np
+
+from pytest import approx, raises
+
+from optbinning import BinningProcess
+from optbinning import Scorecard
+from optbinning.scorecard.monitoring import ScorecardMonitoring
+from optbinning.scorecard.monitoring_accumulator import (
+    ScorecardMonitoringAccumulator)
+from sklearn.datasets import load_boston
+from sklearn.datasets import make_classification
+from sklearn.exceptions import NotFittedError
+from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LogisticRegression
+
+
+def _binary_scorecard():
+    X, y = make_classification(n_samples=3000, n_features=6,
+                               n_informative=4, flip_y=0.2, random_state=0)
+
+    variable_names = ["x{}".format(i) for i in range(X.shape[1])]
+    df = pd.DataFrame(X, columns=variable_names)
+    df["target"] = y
+
+    binning_process = BinningProcess(variable_names)
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LogisticRegression()).fit(df)
+
+    return scorecard, df
+
+
+def _chunks(df, chunk_size):
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def test_params():
+    scorecard, df = _binary_scorecard()
+
+    with raises(TypeError):
+        ScorecardMonitoring(target=1, scorecard=scorecard).fit(df, df)
+
+    with raises(TypeError):
+        ScorecardMonitoring(target="target", scorecard=None).fit(df, df)
+
+    with raises(ValueError):
+        ScorecardMonitoring(target="target", scorecard=scorecard,
+                            psi_method="new_method").fit(df, df)
+
+    with raises(ValueError):
+        ScorecardMonitoring(target="target", scorecard=scorecard,
+                            n_jobs=1.5).fit(df, df)
+
+    with raises(TypeError):
+        ScorecardMonitoring(target="target", scorecard=scorecard).fit(1, df)
+
+    with raises(ValueError):
+        ScorecardMonitoring(target="target", scorecard=scorecard).fit(
+            df[df.columns[1:]], df)
+
+    with raises(ValueError, match="df_actual does not contain data"):
+        ScorecardMonitoring(target="target", scorecard=scorecard).fit(
+            iter([]), df)
+
+    with raises(ValueError, match="df_expected does not contain data"):
+        ScorecardMonitoring(target="target", scorecard=scorecard).fit(
+            df, iter([]))
+
+    with raises(NotFittedError):
+        ScorecardMonitoring(target="target", scorecard=scorecard).psi_table()
+
+
+def test_default_binary():
+    scorecard, df = _binary_scorecard()
+    df_actual = df.sample(frac=0.5, random_state=1)
+
+    monitoring = ScorecardMonitoring(target="target", scorecard=scorecard)
+    monitoring.fit(df_actual, df)
+
+    score = scorecard.score(df_actual)
+    df_psi = monitoring.psi_table()
+    n_records_a = df_psi["Count A"].values[:-1]
+
+    assert n_records_a.sum() == len(df_actual)
+    assert n_records_a == approx(np.histogram(
+        score, np.r_[-np.inf, monitoring.psi_splits, np.inf])[0])
+
+    df_psi_variable = monitoring.psi_variable_table(style="detailed")
+    x0 = df_psi_variable[df_psi_variable.Variable == "x0"]
+    optb = scorecard.binning_process_.get_binned_variable("x0")
+    indices = optb.transform(df_actual["x0"], metric="indices")
+
+    assert x0["Count A"].values == approx(
+        np.bincount(indices, minlength=len(x0)))
+
+
+def test_chunks_continuous():
+    data = load_boston()
+    variable_names = data.feature_names
+    df = pd.DataFrame(data.data, columns=variable_names)
+    df["target"] = data.target + 0.5
+
+    binning_process = BinningProcess(variable_names)
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LinearRegression()).fit(df)
+
+    df_actual = df.sample(frac=0.6, random_state=1)
+
+    monitoring = ScorecardMonitoring(target="target", scorecard=scorecard)
+    monitoring.fit(df_actual, df)
+
+    monitoring_chunks = ScorecardMonitoring(target="target",
+                                            scorecard=scorecard, n_jobs=2)
+    monitoring_chunks.fit(_chunks(df_actual, 50), _chunks(df, 100))
+
+    tables = [monitoring.psi_table(), monitoring.tests_table(),
+              monitoring.psi_variable_table(style="detailed")]
+    tables_chunks = [monitoring_chunks.psi_table(),
+                     monitoring_chunks.tests_table(),
+                     monitoring_chunks.psi_variable_table(style="detailed")]
+
+    for table, table_chunks in zip(tables, tables_chunks):
+        pd.testing.assert_frame_equal(table, table_chunks)
+
+
+def test_accumulator_binary():
+    scorecard, df = _binary_scorecard()
+    df_actual = df.sample(frac=0.5, random_state=1)
+
+    monitoring = ScorecardMonitoring(target="target", scorecard=scorecard)
+    monitoring.fit(df_actual, df)
+
+    accumulator = ScorecardMonitoringAccumulator(target="target",
+                                                 scorecard=scorecard)
+
+    with raises(NotFittedError):
+        accumulator.add(df_actual, "2020-01-01")
+
+    accumulator.fit(df)
+
+    for i, rows in enumerate(np.array_split(np.arange(len(df_actual)), 3)):
+        accumulator.add(df_actual.iloc[rows], "2020-01-0{}".format(i + 1))
+
+    with raises(TypeError):
+        accumulator.add(df_actual, 1.5)
+
+    with raises(ValueError):
+        accumulator.monitoring(["2020-02-01"])
+
+    window = accumulator.monitoring()
+
+    pd.testing.assert_frame_equal(window.psi_table(), monitoring.psi_table())
+    pd.testing.assert_frame_equal(window.tests_table(),
+                                  monitoring.tests_table())
+    pd.testing.assert_frame_equal(
+        window.psi_variable_table(style="detailed"),
+        monitoring.psi_variable_table(style="detailed"))
+
+    # Serialization and rolling window
+    accumulator_load = ScorecardMonitoringAccumulator.from_bytes(
+        accumulator.to_bytes(), scorecard)
+
+    assert accumulator_load.partitions == accumulator.partitions
+    assert accumulator_load.psi_splits == approx(accumulator.psi_splits)
+
+    accumulator.remove("2020-01-01")
+    accumulator_load.remove("2020-01-01")
+
+    psi = accumulator.monitoring().psi_table()
+    psi_load = accumulator_load.monitoring().psi_table()
+    assert psi["PSI"].values == approx(psi_load["PSI"].values)
+
+    data = load_boston()
+    df_other = pd.DataFrame(data.data, columns=data.feature_names)
+    df_other["target"] = data.target + 0.5
+    scorecard_other = Scorecard(
+        target="target", binning_process=BinningProcess(data.feature_names),
+        estimator=LinearRegression()).fit(df_other)
+
+    with raises(ValueError):
+        ScorecardMonitoringAccumulator.from_bytes(accumulator.to_bytes(),
+                                                  scorecard_other)
+
+
+def test_accumulator_continuous():
+    data = load_boston()
+    variable_names = data.feature_names
+    df = pd.DataFrame(data.data, columns=variable_names)
+    df["target"] = data.target + 0.5
+
+    binning_process = BinningProcess(variable_names)
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=LinearRegression()).fit(df)
+
+    df_actual = df.sample(frac=0.6, random_state=1)
+
+    monitoring = ScorecardMonitoring(target="target", scorecard=scorecard)
+    monitoring.fit(df_actual, df)
+
+    accumulator = ScorecardMonitoringAccumulator(target="target",
+                                                 scorecard=scorecard)
+    accumulator.fit(df)
+
+    for i, rows in enumerate(np.array_split(np.arange(len(df_actual)), 3)):
+        accumulator.add(df_actual.iloc[rows], "2020-01-0{}".format(i + 1))
+
+    window = accumulator.monitoring()
+
+    pd.testing.assert_frame_equal(window.psi_table(), monitoring.psi_table())
+    pd.testing.assert_frame_equal(window.tests_table(),
+                                  monitoring.tests_table())
+    pd.testing.assert_frame_equal(
+        window.psi_variable_table(style="detailed"),
+        monitoring.psi_variable_table(style="detailed"))
+
+    # Mean and std are exact, window quartiles are approximated by the
+    # quantile sketch within its rank error
+    target = window._df_target_analysis.set_index("Metric")
+    target_exact = monitoring._df_target_analysis.set_index("Metric")
+
+    assert target["Expected"].values == approx(
+        target_exact["Expected"].values)
+    assert target.loc[["Mean", "Std"], "Actual"].values == approx(
+        target_exact.loc[["Mean", "Std"], "Actual"].values)
+
+    y_actual = np.sort(df_actual["target"].values)
+    n = len(y_actual)
+    for q, metric in zip((0.25, 0.5, 0.75), ("p25", "Median", "p75")):
+        value = target.loc[metric, "Actual"]
+        rank_lo = np.searchsorted(y_actual, value, side="left")
+        rank_hi = np.searchsorted(y_actual, value, side="right")
+
+        assert rank_lo - 1 - accumulator.eps * n <= q * n
+        assert q * n <= rank_hi + 1 + accumulator.eps * n
+
+    # Serialization of the sum, sum of squares and sketch states
+    accumulator_load = ScorecardMonitoringAccumulator.from_bytes(
+        accumulator.to_bytes(), scorecard)
+    window_load = accumulator_load.monitoring()
+
+    pd.testing.assert_frame_equal(window_load.psi_table(),
+                                  window.psi_table())
+    pd.testing.assert_frame_equal(window_load.tests_table(),
+                                  window.tests_table())
+    pd.testing.assert_frame_equal(window_load._df_target_analysis,
+                                  window._df_target_analysis)